@@ -0,0 +1,9 @@
+#!/usr/bin/env python3
+"""
+AI-SDLC - One command for the whole lifecycle: start, resume, validate, pause, end
+"""
+
+from ai_sdlc.cli import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+AI-SDLC Framework - Shared support modules for the Umbrella scripts
+
+The lifecycle API is importable without running a script:
+
+    import ai_sdlc
+    ai_sdlc.evaluate_phase("my-project")["passed"]
+
+Names are resolved on first use, so importing the package (or one of its
+modules) loads only what that caller needs.
+"""
+
+import importlib
+
+_API = {
+    "AISDLCManager": "project",
+    "ProjectConfig": "project",
+    "project_status": "resume",
+    "resume_project": "resume",
+    "evaluate_phase": "validation",
+    "validate_phase": "validation",
+    "validate_portfolio": "validation",
+    "watch_phase": "validation",
+    "pause_session": "pause",
+    "pause_project": "pause",
+    "complete_project": "completion",
+    "end_project": "completion"
+}
+
+__all__ = sorted(_API)
+
+
+def __getattr__(name):
+    module = _API.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_API))
@@ -0,0 +1,7 @@
+"""
+Run the ai-sdlc command line: python -m ai_sdlc <command>
+"""
+
+from ai_sdlc.cli import main
+
+main()
@@ -0,0 +1,283 @@
+"""
+Archive - Deduplicated, compressed archive of a project's phase folders
+
+The archive is an uncompressed tar of individually xz-compressed objects:
+- objects/<sha256[:2]>/<sha256>.xz holds each distinct file content once;
+- manifests/<revision>.json maps every path of one revision to its object.
+
+Re-archiving a later revision appends only the objects the archive does not
+have yet, plus a new manifest. Files whose size and mtime match the previous
+manifest are not even read. Compression runs in worker processes. Files
+larger than SMALL_FILE are streamed in chunks through a temp file, so memory
+use does not grow with file size.
+"""
+
+import hashlib
+import io
+import json
+import lzma
+import os
+import shutil
+import stat as stat_module
+import subprocess
+import tarfile
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from datetime import datetime
+
+from ai_sdlc import timings
+from ai_sdlc.fsutil import ai_sdlc_home, locked
+from ai_sdlc.repo_stats import PHASE_FOLDERS
+from ai_sdlc.scaffold import component_slug
+from ai_sdlc.session_state import STATUS_FILE, load_state
+
+# Top-level files archived next to the phase folders
+ARCHIVED_FILES = [STATUS_FILE, "PROJECT-COMPLETION.md", "README.md"]
+SKIPPED_NAMES = {".git", "__pycache__", ".pytest_cache", ".DS_Store"}
+
+CHUNK_SIZE = 1024 * 1024
+PROJECT_HEADER = "AI_SDLC.project"
+XZ_PRESET = 6
+# Smallest LZMA2 dictionary of any preset; files below it get a dictionary of their own size
+SMALL_FILE = 256 * 1024
+# Below this many changed bytes, starting worker processes costs more than it saves
+PARALLEL_BYTES = 4 * 1024 * 1024
+
+
+def archive_dir():
+    return os.path.join(ai_sdlc_home(), "archives")
+
+
+def project_key(project_path):
+    """Stable id of a project folder, so projects sharing a name never share revisions"""
+    return hashlib.sha1(os.path.realpath(project_path).encode("utf-8")).hexdigest()[:16]
+
+
+def default_archive_path(project_path):
+    state = load_state(project_path) or {}
+    name = state.get("project", {}).get("name") or os.path.basename(os.path.realpath(project_path))
+    return os.path.join(archive_dir(), f"{component_slug(name) or 'project'}-{project_key(project_path)}.tar")
+
+
+def _object_name(digest):
+    return f"objects/{digest[:2]}/{digest}.xz"
+
+
+def compress_file(path, tmp_dir, preset=XZ_PRESET):
+    """Hash and xz-compress one file in a single streaming pass (runs in a worker process)
+    
+    Returns (sha256, size, compressed). Files under SMALL_FILE come back as
+    compressed bytes; larger ones are streamed to a temp file whose path is
+    returned instead.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, "rb") as source:
+        filters = {"id": lzma.FILTER_LZMA2, "preset": preset}
+        expected = os.fstat(source.fileno()).st_size
+        if expected < SMALL_FILE:
+            # Allocating the preset's full dictionary costs more than compressing a small file
+            filters["dict_size"] = max(4096, expected)
+            data = source.read()
+            digest.update(data)
+            return digest.hexdigest(), len(data), lzma.compress(data, filters=[filters])
+        
+        compressor = lzma.LZMACompressor(filters=[filters])
+        fd, tmp_path = tempfile.mkstemp(dir=tmp_dir, suffix=".xz")
+        with os.fdopen(fd, "wb") as target:
+            for chunk in iter(lambda: source.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+                size += len(chunk)
+                target.write(compressor.compress(chunk))
+            target.write(compressor.flush())
+    return digest.hexdigest(), size, tmp_path
+
+
+def _add_object(tar, name, compressed, project=None):
+    """Append compressed bytes or a compressed temp file as one tar member; returns its size"""
+    if isinstance(compressed, str):
+        size = os.path.getsize(compressed)
+        tar.add(compressed, arcname=name)
+        return size
+    info = tarfile.TarInfo(name)
+    if project:
+        info.pax_headers = {PROJECT_HEADER: project}
+    info.size = len(compressed)
+    info.mtime = int(time.time())
+    info.mode = 0o444
+    tar.addfile(info, io.BytesIO(compressed))
+    return info.size
+
+
+def iter_project_files(project_path):
+    """(relpath, lstat) of every archived file, symlink and empty folder, in a stable order"""
+    roots = [folder for folder in PHASE_FOLDERS if os.path.isdir(os.path.join(project_path, folder))]
+    for name in ARCHIVED_FILES:
+        full_path = os.path.join(project_path, name)
+        if os.path.isfile(full_path):
+            yield name, os.lstat(full_path)
+    for root in roots:
+        for dirpath, dirnames, filenames in os.walk(os.path.join(project_path, root)):
+            dirnames[:] = sorted(d for d in dirnames if d not in SKIPPED_NAMES)
+            if not dirnames and not filenames:
+                yield os.path.relpath(dirpath, project_path).replace(os.sep, "/"), os.lstat(dirpath)
+            # Symlinked folders (deployed-components/<name>) are recorded as links, not walked
+            for name in sorted(dirnames + filenames):
+                full_path = os.path.join(dirpath, name)
+                if name in dirnames and not os.path.islink(full_path) or name in SKIPPED_NAMES:
+                    continue
+                yield os.path.relpath(full_path, project_path).replace(os.sep, "/"), os.lstat(full_path)
+
+
+def _read_archive(path):
+    """Object names and {revision: project key} of the manifests already in an archive"""
+    objects = set()
+    manifests = {}
+    if not os.path.exists(path):
+        return objects, manifests
+    with tarfile.open(path, "r:") as tar:
+        for member in tar:
+            if member.name.startswith("objects/"):
+                objects.add(member.name)
+            elif member.name.startswith("manifests/"):
+                # The project is a PAX header, so finding a project's revisions reads no manifest
+                manifests[member.name[len("manifests/"):-len(".json")]] = member.pax_headers.get(PROJECT_HEADER)
+    return objects, manifests
+
+
+def read_manifest(path, revision):
+    with tarfile.open(path, "r:") as tar:
+        return json.load(tar.extractfile(f"manifests/{revision}.json"))
+
+
+def _revision_name(project_path):
+    """<time>-<HEAD>-<project key prefix>, unique even when projects share an archive and a commit"""
+    revision = datetime.now().strftime("%Y%m%d-%H%M%S")
+    try:
+        head = subprocess.run(["git", "rev-parse", "--short=8", "HEAD"], cwd=project_path,
+                              capture_output=True, text=True)
+        if head.returncode == 0 and head.stdout.strip():
+            revision += "-" + head.stdout.strip()
+    except FileNotFoundError:
+        pass
+    return f"{revision}-{project_key(project_path)[:8]}"
+
+
+@timings.traced()
+def archive_project(project_path=".", output=None, workers=None, preset=XZ_PRESET):
+    """Append the project's current revision to its archive, adding only new file contents
+    
+    Only revisions of this project folder (by project_key) are compared
+    with, even when several projects share one archive file. Returns
+    {"archive", "project", "revision", "files", "new_objects", "reused",
+    "bytes_in", "bytes_added", "seconds"}.
+    """
+    started = time.perf_counter()
+    output = output or default_archive_path(project_path)
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    result = {"archive": output, "project": project_key(project_path), "revision": _revision_name(project_path),
+              "files": 0, "new_objects": 0,
+              "reused": 0, "bytes_in": 0, "bytes_added": 0, "seconds": 0.0}
+    
+    with locked(output + ".lock"):
+        objects, manifests = _read_archive(output)
+        # Two revisions within one second: number the later one rather than shadow the first
+        base, number = result["revision"], 2
+        while result["revision"] in manifests:
+            result["revision"] = f"{base}-{number}"
+            number += 1
+        own = [revision for revision, project in manifests.items() if project == result["project"]]
+        previous = read_manifest(output, max(own))["files"] if own else {}
+        
+        files = {}
+        pending = []
+        for relpath, stat in iter_project_files(project_path):
+            if os.path.islink(os.path.join(project_path, relpath)):
+                files[relpath] = {"link": os.readlink(os.path.join(project_path, relpath))}
+                continue
+            if stat_module.S_ISDIR(stat.st_mode):
+                files[relpath] = {"dir": True}
+                continue
+            entry = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "mode": stat.st_mode & 0o777}
+            cached = previous.get(relpath)
+            if (cached and "sha256" in cached and cached["size"] == stat.st_size
+                    and cached["mtime_ns"] == stat.st_mtime_ns
+                    and _object_name(cached["sha256"]) in objects):
+                entry["sha256"] = cached["sha256"]
+                result["reused"] += 1
+            else:
+                pending.append(relpath)
+            files[relpath] = entry
+            result["bytes_in"] += stat.st_size
+        
+        tmp_dir = tempfile.mkdtemp(prefix="archive-", dir=os.path.dirname(os.path.abspath(output)))
+        try:
+            with tarfile.open(output, "a:") as tar:
+                if pending:
+                    pending_bytes = sum(files[path]["size"] for path in pending)
+                    paths = [os.path.join(project_path, path) for path in pending]
+                    with timings.span("compress", files=len(pending), bytes=pending_bytes), \
+                            ExitStack() as stack:
+                        if pending_bytes >= PARALLEL_BYTES and len(pending) > 1 and workers != 1:
+                            pool = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+                            compressed = pool.map(compress_file, paths, [tmp_dir] * len(paths),
+                                                  [preset] * len(paths), chunksize=4)
+                        else:
+                            compressed = (compress_file(path, tmp_dir, preset) for path in paths)
+                        # Results arrive in order; each object is appended and its temp file dropped at once
+                        for relpath, (digest, _, data) in zip(pending, compressed):
+                            files[relpath]["sha256"] = digest
+                            name = _object_name(digest)
+                            if name in objects:
+                                result["reused"] += 1
+                            else:
+                                result["bytes_added"] += _add_object(tar, name, data)
+                                objects.add(name)
+                                result["new_objects"] += 1
+                            if isinstance(data, str):
+                                os.remove(data)
+                
+                # The manifest goes last: a revision only exists once all its objects do
+                manifest = json.dumps({"revision": result["revision"], "project": result["project"],
+                                       "files": files}, indent=1).encode("utf-8")
+                _add_object(tar, f"manifests/{result['revision']}.json", manifest, result["project"])
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    
+    result["files"] = len(files)
+    result["seconds"] = round(time.perf_counter() - started, 3)
+    return result
+
+
+def list_revisions(path, project_path=None):
+    """Revisions stored in an archive, oldest first; only one project's with project_path"""
+    manifests = _read_archive(path)[1]
+    if project_path is not None:
+        key = project_key(project_path)
+        return sorted(revision for revision, project in manifests.items() if project == key)
+    return sorted(manifests)
+
+
+@timings.traced()
+def restore_revision(path, revision, destination):
+    """Extract one revision of an archive into destination, streaming each object"""
+    manifest = read_manifest(path, revision)
+    restored = 0
+    with tarfile.open(path, "r:") as tar:
+        for relpath, entry in manifest["files"].items():
+            target = os.path.join(destination, *relpath.split("/"))
+            if entry.get("dir"):
+                os.makedirs(target, exist_ok=True)
+                continue
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            if "link" in entry:
+                if not os.path.lexists(target):
+                    os.symlink(entry["link"], target)
+                continue
+            with lzma.open(tar.extractfile(_object_name(entry["sha256"]))) as source, open(target, "wb") as f:
+                shutil.copyfileobj(source, f, CHUNK_SIZE)
+            os.chmod(target, entry["mode"])
+            restored += 1
+    return restored
@@ -0,0 +1,290 @@
+"""
+Artifact Store - Local content-addressed store for large design and deployment files
+
+Files of at least THRESHOLD bytes under OFFLOAD_DIRS (wireframes, architecture
+diagrams, deployment bundles) are kept out of git. Pause copies each one into
+~/.ai-sdlc/artifacts/objects/ under its sha256, streaming it in chunks and
+storing identical content once. It commits a small pointer file in
+.ai-sdlc/artifacts/<path> instead, and lists the real file in a managed block
+of .gitignore. A pause with a change journal looks only at the journaled
+paths. Resume materialises missing files from their pointers. This
+works like Git LFS, but everything stays on this machine and no server is
+involved.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+from ai_sdlc import timings
+from ai_sdlc.component_index import CACHE_DIR
+from ai_sdlc.fsutil import ai_sdlc_home, atomic_write
+
+OFFLOAD_DIRS = ["3-Design/wireframes", "3-Design/architecture-diagrams", "6-Deployment"]
+# Deploy release snapshots are hardlinked copies of component src/, never offloaded
+SKIPPED_DIRS = {".git", ".releases"}
+THRESHOLD = int(os.environ.get("AI_SDLC_ARTIFACT_THRESHOLD", 1024 * 1024))
+CHUNK_SIZE = 1024 * 1024
+
+POINTER_DIR = os.path.join(".ai-sdlc", "artifacts")
+POINTER_HEADER = "ai-sdlc-artifact v1"
+STAT_CACHE = os.path.join(CACHE_DIR, "artifacts.json")
+
+IGNORE_BEGIN = "# AI-SDLC offloaded artifacts (managed; pointers in .ai-sdlc/artifacts/)"
+IGNORE_END = "# End of AI-SDLC offloaded artifacts"
+
+
+def store_dir():
+    return os.path.join(ai_sdlc_home(), "artifacts", "objects")
+
+
+def object_path(digest):
+    return os.path.join(store_dir(), digest[:2], digest)
+
+
+def pointer_path(project_path, path):
+    return os.path.join(project_path, POINTER_DIR, *path.split("/"))
+
+
+def store_file(path):
+    """Copy a file into the store, hashing it in the same streaming pass; returns (sha256, size)"""
+    os.makedirs(store_dir(), exist_ok=True)
+    digest = hashlib.sha256()
+    size = 0
+    fd, tmp_path = tempfile.mkstemp(dir=store_dir(), suffix=".tmp")
+    try:
+        with open(path, "rb") as source, os.fdopen(fd, "wb") as target:
+            for chunk in iter(lambda: source.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+                target.write(chunk)
+                size += len(chunk)
+        sha256 = digest.hexdigest()
+        target_path = object_path(sha256)
+        if os.path.exists(target_path):
+            os.remove(tmp_path)  # Stored already, by this or another project
+        else:
+            os.makedirs(os.path.dirname(target_path), exist_ok=True)
+            # Read-only, like rule objects, so nothing edits a stored version in place
+            os.chmod(tmp_path, 0o444)
+            os.replace(tmp_path, target_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return sha256, size
+
+
+def read_pointer(path):
+    """Parse a pointer file into {"sha256", "size"}, or None when it is not one"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            lines = f.read(512).splitlines()
+    except (OSError, UnicodeDecodeError):
+        return None
+    if not lines or lines[0] != POINTER_HEADER:
+        return None
+    fields = dict(line.split(" ", 1) for line in lines[1:] if " " in line)
+    if "sha256" not in fields or not fields.get("size", "").isdigit():
+        return None
+    return {"sha256": fields["sha256"], "size": int(fields["size"])}
+
+
+def write_pointer(project_path, path, sha256, size):
+    atomic_write(pointer_path(project_path, path), f"{POINTER_HEADER}\nsha256 {sha256}\nsize {size}\n")
+
+
+def managed_paths(project_path):
+    """Project-relative paths that have a pointer, found by walking the (small) pointer tree"""
+    root = os.path.join(project_path, POINTER_DIR)
+    paths = []
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            paths.append(os.path.relpath(os.path.join(dirpath, filename), root).replace(os.sep, "/"))
+    return sorted(paths)
+
+
+def _offload_roots(changed):
+    """Paths to scan for a set of changed paths: those under OFFLOAD_DIRS, or a whole dir containing one"""
+    roots = set()
+    for path in changed:
+        path = path.replace(os.sep, "/").strip("/")
+        if SKIPPED_DIRS.intersection(path.split("/")):
+            continue
+        for folder in OFFLOAD_DIRS:
+            if path == folder or path.startswith(folder + "/"):
+                roots.add(path)
+            elif folder.startswith(path + "/"):
+                roots.add(folder)
+    return sorted(roots)
+
+
+def _large_files(project_path, threshold, changed=None):
+    """{path: stat} of regular files of at least `threshold` bytes under OFFLOAD_DIRS
+    
+    With changed (project-relative paths), only those paths are looked at,
+    instead of walking every offload folder.
+    """
+    found = {}
+    
+    def check(full_path):
+        try:
+            stat = os.lstat(full_path)
+        except OSError:
+            return
+        if stat.st_size >= threshold and not os.path.islink(full_path) and os.path.isfile(full_path):
+            found[os.path.relpath(full_path, project_path).replace(os.sep, "/")] = stat
+    
+    for root in (OFFLOAD_DIRS if changed is None else _offload_roots(changed)):
+        full_root = os.path.join(project_path, *root.split("/"))
+        if not os.path.isdir(full_root) or os.path.islink(full_root):
+            check(full_root)
+            continue
+        for dirpath, dirnames, filenames in os.walk(full_root):
+            dirnames[:] = [d for d in dirnames if d not in SKIPPED_DIRS]
+            for filename in filenames:
+                check(os.path.join(dirpath, filename))
+    return found
+
+
+def _ignore_pattern(path):
+    """Anchored .gitignore pattern matching exactly one path"""
+    escaped = "".join("\\" + char if char in "\\*?[" else char for char in path)
+    if escaped.endswith(" "):
+        escaped = escaped[:-1] + "\\ "
+    return "/" + escaped
+
+
+def _update_ignore(project_path, paths):
+    """Rewrite the managed block of .gitignore to list exactly `paths`"""
+    ignore_path = os.path.join(project_path, ".gitignore")
+    try:
+        with open(ignore_path, "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        lines = []
+    if IGNORE_BEGIN in lines and IGNORE_END in lines[lines.index(IGNORE_BEGIN):]:
+        begin = lines.index(IGNORE_BEGIN)
+        end = lines.index(IGNORE_END, begin)
+        lines[begin:end + 1] = []
+    while lines and not lines[-1].strip():
+        lines.pop()
+    if paths:
+        lines += [""] if lines else []
+        lines += [IGNORE_BEGIN] + [_ignore_pattern(path) for path in sorted(paths)] + [IGNORE_END]
+    atomic_write(ignore_path, "\n".join(lines) + "\n" if lines else "")
+
+
+def _load_stat_cache(project_path):
+    try:
+        with open(os.path.join(project_path, STAT_CACHE), "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+@timings.traced()
+def offload_artifacts(project_path=".", threshold=None, changed=None):
+    """Move large files under OFFLOAD_DIRS into the store and keep pointers to them in git
+    
+    With changed (the paths a change journal recorded), only those paths and
+    the already managed files are looked at, so no offload folder is walked.
+    Files whose size and mtime match the last offload are not read. A managed
+    file that was deleted here drops its pointer. A pointer whose file has
+    never been on this machine (a fresh clone without the store) is kept.
+    Returns {"offloaded", "removed", "untracked", "bytes", "managed", "paths"},
+    where "paths" lists every file this changed, for staging.
+    """
+    threshold = THRESHOLD if threshold is None else threshold
+    cache = _load_stat_cache(project_path)
+    managed = set(managed_paths(project_path))
+    candidates = _large_files(project_path, threshold, changed)
+    result = {"offloaded": [], "removed": [], "untracked": [], "bytes": 0, "managed": 0, "paths": []}
+    cache_changed = False
+    
+    for path in sorted(managed - set(candidates)):
+        full_path = os.path.join(project_path, path)
+        if os.path.isfile(full_path) and not os.path.islink(full_path):
+            candidates[path] = os.stat(full_path)  # Shrunk below the threshold: stays offloaded
+        elif path in cache:
+            os.remove(pointer_path(project_path, path))
+            del cache[path]
+            cache_changed = True
+            result["removed"].append(path)
+    
+    with timings.span("store artifacts", candidates=len(candidates)):
+        for path, stat in sorted(candidates.items()):
+            cached = cache.get(path)
+            if path in managed and cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+                continue
+            sha256, size = store_file(os.path.join(project_path, path))
+            cache[path] = [stat.st_size, stat.st_mtime_ns, sha256]
+            cache_changed = True
+            pointer = read_pointer(pointer_path(project_path, path)) if path in managed else None
+            if pointer and pointer["sha256"] == sha256:
+                continue
+            write_pointer(project_path, path, sha256, size)
+            result["offloaded"].append(path)
+            result["bytes"] += size
+    
+    current = (managed | set(result["offloaded"])) - set(result["removed"])
+    result["managed"] = len(current)
+    if result["offloaded"] or result["removed"]:
+        _update_ignore(project_path, current)
+        result["paths"] = [".gitignore"] + [os.path.join(POINTER_DIR, *path.split("/")).replace(os.sep, "/")
+                                            for path in result["offloaded"] + result["removed"]]
+    if cache_changed:
+        atomic_write(os.path.join(project_path, STAT_CACHE), json.dumps(cache, indent=1))
+    
+    # Files committed before they were offloaded leave the index; their history stays as it was
+    added = [path for path in result["offloaded"] if path not in managed]
+    if added and os.path.exists(os.path.join(project_path, ".git")):
+        untracked = timings.run(["git", "rm", "--cached", "-q", "--ignore-unmatch", "--pathspec-from-file=-",
+                                 "--pathspec-file-nul"], cwd=project_path, input="\0".join(added), text=True,
+                                capture_output=True)
+        if untracked.returncode == 0:
+            result["untracked"] = added
+    return result
+
+
+@timings.traced()
+def materialize_artifacts(project_path="."):
+    """Restore offloaded files that are missing from the working tree, returning {materialized, missing}"""
+    result = {"materialized": [], "missing": [], "managed": 0}
+    paths = managed_paths(project_path)
+    result["managed"] = len(paths)
+    cache = None
+    for path in paths:
+        full_path = os.path.join(project_path, path)
+        if os.path.lexists(full_path):
+            continue
+        pointer = read_pointer(pointer_path(project_path, path))
+        source = object_path(pointer["sha256"]) if pointer else None
+        if source is None or not os.path.isfile(source):
+            result["missing"].append(path)
+            continue
+        
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        tmp_path = f"{full_path}.{os.getpid()}.tmp"
+        shutil.copyfile(source, tmp_path)  # A writable copy, not a link to the read-only object
+        os.replace(tmp_path, full_path)
+        stat = os.stat(full_path)
+        cache = cache if cache is not None else _load_stat_cache(project_path)
+        cache[path] = [stat.st_size, stat.st_mtime_ns, pointer["sha256"]]
+        result["materialized"].append(path)
+    
+    if cache is not None:
+        atomic_write(os.path.join(project_path, STAT_CACHE), json.dumps(cache, indent=1))
+    return result
+
+
+def artifact_status(project_path="."):
+    """Every offloaded file as {path, size, sha256, present, stored}"""
+    status = []
+    for path in managed_paths(project_path):
+        pointer = read_pointer(pointer_path(project_path, path)) or {"sha256": None, "size": 0}
+        status.append({"path": path, "size": pointer["size"], "sha256": pointer["sha256"],
+                       "present": os.path.isfile(os.path.join(project_path, path)),
+                       "stored": bool(pointer["sha256"]) and os.path.isfile(object_path(pointer["sha256"]))})
+    return status
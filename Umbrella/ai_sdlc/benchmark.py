@@ -0,0 +1,376 @@
+"""
+Benchmark - Synthetic AI-SDLC projects and timings for the Umbrella scripts
+
+Generates projects of configurable size (components, files per component,
+commits of history, paused sessions), times the start, resume,
+validate, pause and end entry points against them and writes a JSON report
+that later runs can be compared with. Run from the Umbrella folder:
+
+    python -m ai_sdlc.benchmark --sizes small medium --output baseline.json
+    python -m ai_sdlc.benchmark --sizes small medium --compare baseline.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from ai_sdlc import completion, pause, project, resume, validation
+from ai_sdlc.journal import JOURNAL_FILE
+from ai_sdlc.scaffold import scaffold_project
+from ai_sdlc.session_state import STATE_FILE, STATUS_FILE, new_state, render_session_status
+
+REPORT_VERSION = 1
+
+SIZES = {
+    "small": {"components": 10, "files_per_component": 5, "commits": 50, "sessions": 5},
+    "medium": {"components": 100, "files_per_component": 10, "commits": 500, "sessions": 50},
+    "large": {"components": 500, "files_per_component": 20, "commits": 5000, "sessions": 200}
+}
+
+OPERATIONS = ("start_project", "resume_project", "validate_phase", "pause_project", "end_project")
+
+# Slowdowns smaller than this are timer noise, whatever the ratio
+MIN_REGRESSION_SECONDS = 0.005
+
+# Share of component files modified before each timed pause
+PAUSE_CHANGE_RATIO = 0.01
+
+# Fixed author and clock so generated histories are identical between runs
+BENCH_IDENTITY = {
+    "GIT_AUTHOR_NAME": "AI-SDLC Benchmark",
+    "GIT_AUTHOR_EMAIL": "benchmark@ai-sdlc.local",
+    "GIT_COMMITTER_NAME": "AI-SDLC Benchmark",
+    "GIT_COMMITTER_EMAIL": "benchmark@ai-sdlc.local"
+}
+BASE_TIMESTAMP = 1700000000
+
+
+def _text(rng, lines, width=72):
+    words = ["component", "service", "request", "handler", "state", "phase", "session",
+             "validate", "deploy", "config", "record", "update", "result", "index"]
+    out = []
+    for _ in range(lines):
+        line = " ".join(rng.choice(words) for _ in range(width // 8))
+        out.append(line)
+    return "\n".join(out) + "\n"
+
+
+def _project_files(name, components, files_per_component, sessions, rng, requirements):
+    """Build the synthetic project's files as {path: text}"""
+    files = {".gitignore": "__pycache__/\n*.pyc\n.env\n.ai-sdlc/cache/\n"}
+    
+    for phase in (1, 2, 3):
+        for item in requirements[phase]:
+            files[item] = f"# {os.path.basename(item)}\n\n" + _text(rng, 40)
+    
+    names = [f"component-{index:04d}" for index in range(components)]
+    rows = ["# Component Breakdown", "", "| Component | Depends on |", "|-----------|------------|"]
+    for index, component in enumerate(names):
+        rows.append(f"| {component} | {names[index - 1] if index else 'none'} |")
+    files["4-Development/component-breakdown.md"] = "\n".join(rows) + "\n"
+    
+    for index, component in enumerate(names):
+        base = f"4-Development/components/{component}"
+        for number in range(files_per_component):
+            folder = ("src", "tests", "docs")[number % 3]
+            extension = ".md" if folder == "docs" else ".py"
+            files[f"{base}/{folder}/file_{number:03d}{extension}"] = _text(rng, 30)
+        # Half the components are in testing, a quarter deployed
+        if index % 2 == 0:
+            files[f"5-Testing/component-tests/{component}/test-report.md"] = _text(rng, 10)
+        if index % 4 == 0:
+            files[f"6-Deployment/deployed-components/{component}/deployment.md"] = _text(rng, 10)
+    
+    state = new_state(name, "Synthetic benchmark project", ["Python"], {}, phase=4)
+    state["session_date"] = "2024-01-01 09:00"
+    state["next_actions"] = ["Develop components", "Write component tests"]
+    history = [{"paused_at": f"2024-01-{1 + index % 28:02d} 18:00", "last_commit": f"Session {index}"}
+               for index in range(sessions)]
+    state["last_session"] = history[-1] if history else None
+    files[JOURNAL_FILE.replace(os.sep, "/")] = "".join(json.dumps(dict(session, event="pause")) + "\n"
+                                                       for session in history)
+    files[STATUS_FILE] = render_session_status(state)
+    files[STATE_FILE.replace(os.sep, "/")] = json.dumps(state, indent=2) + "\n"
+    return files
+
+
+def _fast_import_stream(branch, files, commits, rng):
+    """Yield a git fast-import stream: one commit with every file, then small edits"""
+    editable = sorted(path for path in files if "/src/" in path) or sorted(files)
+    
+    def blob(data):
+        data = data.encode("utf-8")
+        return f"data {len(data)}\n".encode("ascii") + data + b"\n"
+    
+    def header(number, message):
+        when = BASE_TIMESTAMP + number * 60
+        identity = f"{BENCH_IDENTITY['GIT_COMMITTER_NAME']} <{BENCH_IDENTITY['GIT_COMMITTER_EMAIL']}>"
+        return (f"commit {branch}\ncommitter {identity} {when} +0000\n".encode("utf-8") + blob(message))
+    
+    yield header(0, "🚀 Initialize AI-SDLC project")
+    for path in sorted(files):
+        yield f"M 100644 inline {path}\n".encode("utf-8") + blob(files[path])
+    
+    for number in range(1, commits):
+        path = editable[rng.randrange(len(editable))]
+        files[path] += f"# revision {number}\n"
+        yield header(number, f"📝 Session work {number}")
+        yield f"M 100644 inline {path}\n".encode("utf-8") + blob(files[path])
+
+
+def generate_project(path, components=10, files_per_component=5, commits=50, sessions=5, seed=0):
+    """Create a synthetic AI-SDLC project (phase 4) with a Git history of `commits` commits"""
+    rng = random.Random(seed)
+    requirements = validation.PHASE_REQUIREMENTS
+    name = os.path.basename(os.path.normpath(path))
+    files = _project_files(name, components, files_per_component, sessions, rng, requirements)
+    
+    os.makedirs(path)
+    subprocess.run(["git", "init", "-q"], cwd=path, check=True)
+    branch = subprocess.run(["git", "symbolic-ref", "HEAD"], cwd=path, capture_output=True,
+                            text=True, check=True).stdout.strip()
+    
+    # fast-import writes thousands of commits in one process instead of one per commit
+    importer = subprocess.Popen(["git", "fast-import", "--quiet"], cwd=path, stdin=subprocess.PIPE)
+    for chunk in _fast_import_stream(branch, files, max(1, commits), rng):
+        importer.stdin.write(chunk)
+    importer.stdin.close()
+    if importer.wait() != 0:
+        raise subprocess.CalledProcessError(importer.returncode, "git fast-import")
+    subprocess.run(["git", "reset", "-q", "--hard"], cwd=path, check=True)
+    
+    # Checkout order is arbitrary: keep the JSON state newer than its rendered view
+    os.utime(os.path.join(path, STATE_FILE))
+    scaffold_project(path)
+    return path
+
+
+@contextmanager
+def _quiet():
+    """Silence the scripts and the git commands they run (file descriptors 1 and 2)"""
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved = os.dup(1), os.dup(2)
+    with open(os.devnull, "w") as devnull:
+        os.dup2(devnull.fileno(), 1)
+        os.dup2(devnull.fileno(), 2)
+        try:
+            yield
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.dup2(saved[0], 1)
+            os.dup2(saved[1], 2)
+            os.close(saved[0])
+            os.close(saved[1])
+
+
+def _touch_files(project_path, ratio, run):
+    """Modify a share of the component source files before a pause"""
+    components_dir = os.path.join(project_path, "4-Development", "components")
+    candidates = []
+    for root, _dirs, names in os.walk(components_dir):
+        candidates.extend(os.path.join(root, name) for name in names)
+    candidates.sort()
+    count = max(1, int(len(candidates) * ratio))
+    for path in candidates[run * count % max(1, len(candidates)):][:count]:
+        with open(path, "a") as f:
+            f.write(f"# benchmark run {run}\n")
+
+
+def _operations(project_path, workdir):
+    """Map operation name to (setup, call) pairs; setup runs outside the timing"""
+    counter = {"start": 0, "end": 0}
+    
+    def start_setup(run):
+        counter["start"] += 1
+        return os.path.join(workdir, f"start-{counter['start']}")
+    
+    def start_call(target):
+        config = project.ProjectConfig("bench", "Benchmark project", ["Python"], {})
+        return project.AISDLCManager(config, target).start_project()
+    
+    def end_setup(run):
+        counter["end"] += 1
+        target = os.path.join(workdir, f"end-{counter['end']}")
+        shutil.copytree(project_path, target, symlinks=True)
+        return target
+    
+    def pause_setup(run):
+        _touch_files(project_path, PAUSE_CHANGE_RATIO, run)
+        return project_path
+    
+    return {
+        "start_project": (start_setup, start_call),
+        "resume_project": (lambda run: project_path, resume.resume_project),
+        "validate_phase": (lambda run: project_path, validation.validate_phase),
+        "pause_project": (pause_setup, lambda target: pause.pause_project(target, "Benchmark pause")),
+        "end_project": (end_setup, completion.end_project)
+    }
+
+
+def _summarize(runs):
+    return {
+        "runs": [round(run, 6) for run in runs],
+        "min": round(min(runs), 6),
+        "median": round(statistics.median(runs), 6),
+        "mean": round(statistics.mean(runs), 6)
+    }
+
+
+def run_benchmarks(sizes, operations=OPERATIONS, repeat=3, workdir=None, keep=False):
+    """Generate one project per size and time each operation `repeat` times
+    
+    sizes maps a size name to generator parameters (see SIZES).
+    """
+    own_workdir = workdir is None
+    workdir = workdir or tempfile.mkdtemp(prefix="ai-sdlc-bench-")
+    
+    # Never touch the user's rule store, project registry or push queue
+    saved_env = {key: os.environ.get(key) for key in list(BENCH_IDENTITY) + ["AI_SDLC_HOME"]}
+    os.environ.update(BENCH_IDENTITY)
+    os.environ["AI_SDLC_HOME"] = os.path.join(workdir, "home")
+    
+    report = {
+        "version": REPORT_VERSION,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "git": subprocess.run(["git", "--version"], capture_output=True, text=True).stdout.strip(),
+        "repeat": repeat,
+        "results": []
+    }
+    
+    try:
+        for size, params in sizes.items():
+            size_dir = os.path.join(workdir, size)
+            os.makedirs(size_dir, exist_ok=True)
+            project_path = os.path.join(size_dir, "project")
+            
+            started = time.perf_counter()
+            generate_project(project_path, **params)
+            generated = time.perf_counter() - started
+            print(f"🏗️  {size}: generated {params} in {generated:.2f}s")
+            
+            table = _operations(project_path, size_dir)
+            for operation in operations:
+                setup, call = table[operation]
+                runs = []
+                ok = True
+                for run in range(repeat):
+                    target = setup(run)
+                    with _quiet():
+                        started = time.perf_counter()
+                        result = call(target)
+                        runs.append(time.perf_counter() - started)
+                    ok = ok and result is not False
+                
+                entry = {"size": size, "params": params, "operation": operation, "ok": ok}
+                entry.update(_summarize(runs))
+                report["results"].append(entry)
+                icon = "✅" if ok else "⚠️ "
+                print(f"   {icon} {operation:<15} min {entry['min'] * 1000:9.1f} ms   "
+                      f"median {entry['median'] * 1000:9.1f} ms")
+    finally:
+        for key, value in saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        if own_workdir and not keep:
+            shutil.rmtree(workdir, ignore_errors=True)
+        elif keep:
+            print(f"📁 Benchmark projects kept in {workdir}")
+    
+    return report
+
+
+def compare_reports(current, baseline, threshold=1.25):
+    """Compare best-of-N timings with a baseline report
+    
+    Returns one row per (size, operation) present in both reports; rows whose
+    generator parameters differ are marked incomparable rather than compared.
+    A regression must exceed both the ratio threshold and MIN_REGRESSION_SECONDS.
+    """
+    previous = {(entry["size"], entry["operation"]): entry for entry in baseline.get("results", [])}
+    rows = []
+    for entry in current["results"]:
+        old = previous.get((entry["size"], entry["operation"]))
+        if old is None:
+            continue
+        row = {"size": entry["size"], "operation": entry["operation"],
+               "baseline": old["min"], "current": entry["min"], "ratio": None, "regression": False}
+        if old.get("params") != entry["params"]:
+            row["incomparable"] = True
+        elif old["min"] > 0:
+            row["ratio"] = round(entry["min"] / old["min"], 3)
+            row["regression"] = (row["ratio"] > threshold and
+                                 entry["min"] - old["min"] > MIN_REGRESSION_SECONDS)
+        rows.append(row)
+    return rows
+
+
+def print_comparison(rows, threshold):
+    """Print the baseline comparison, returning False when anything regressed"""
+    print(f"\n📊 Compared with baseline (regression above {threshold:.2f}x):")
+    for row in rows:
+        label = f"{row['size']}/{row['operation']}"
+        if row.get("incomparable"):
+            print(f"   ⚠️  {label}: size parameters differ, not compared")
+        elif row["ratio"] is not None:
+            icon = "❌" if row["regression"] else "✅"
+            print(f"   {icon} {label}: {row['baseline'] * 1000:.1f} ms → {row['current'] * 1000:.1f} ms "
+                  f"({row['ratio']:.2f}x)")
+    return not any(row["regression"] for row in rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Umbrella scripts on synthetic projects")
+    parser.add_argument("--sizes", nargs="+", choices=sorted(SIZES), default=["small"],
+                        help="Project sizes to generate (default: small)")
+    parser.add_argument("--components", type=int, help="Custom size: number of components")
+    parser.add_argument("--files", type=int, default=5, help="Custom size: files per component")
+    parser.add_argument("--commits", type=int, default=50, help="Custom size: commits of history")
+    parser.add_argument("--sessions", type=int, default=5, help="Custom size: paused sessions in the session journal")
+    parser.add_argument("--operations", nargs="+", choices=OPERATIONS, default=list(OPERATIONS))
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per operation (default: 3)")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--compare", metavar="BASELINE", help="Compare with an earlier JSON report")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="Slowdown ratio reported as a regression (default: 1.25)")
+    parser.add_argument("--workdir", help="Generate projects here instead of a temporary folder")
+    parser.add_argument("--keep", action="store_true", help="Keep the generated projects")
+    args = parser.parse_args()
+    
+    if args.components is not None:
+        sizes = {"custom": {"components": args.components, "files_per_component": args.files,
+                            "commits": args.commits, "sessions": args.sessions}}
+    else:
+        sizes = {size: SIZES[size] for size in args.sizes}
+    
+    report = run_benchmarks(sizes, args.operations, args.repeat, args.workdir, args.keep)
+    
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Report written to {args.output}")
+    
+    if args.compare:
+        with open(args.compare, "r") as f:
+            baseline = json.load(f)
+        if not print_comparison(compare_reports(report, baseline, args.threshold), args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""
+Change Journal - Dirty-path journal fed by a resident watcher for fast pauses
+
+While `4-pause-project.py --watch` runs, every changed path is appended to
+.ai-sdlc/cache/dirty-paths.log. A pause then stages exactly those paths instead
+of scanning the whole working tree with `git status` and `git add .`.
+"""
+
+import json
+import os
+import signal
+import socket
+import subprocess
+import time
+
+from ai_sdlc import timings
+from ai_sdlc.component_index import CACHE_DIR
+from ai_sdlc.fsutil import lock_file
+from ai_sdlc.watcher import EVERYTHING, create_watcher, is_excluded
+
+JOURNAL_FILE = os.path.join(CACHE_DIR, "dirty-paths.log")
+WATCHER_FILE = os.path.join(CACHE_DIR, "watcher.json")
+FLUSH_FILE = os.path.join(CACHE_DIR, "flush.request")
+
+# How long a pause waits for the watcher to journal events still in flight
+FLUSH_TIMEOUT = 3.0
+
+# Pathspecs handed to a single `git` invocation on stdin, and as command-line arguments
+STAGE_BATCH_SIZE = 1000
+ARG_BATCH_SIZE = 100
+
+
+def record_changes(project_path, paths):
+    """Append changed paths to the journal"""
+    if not paths:
+        return
+    journal_path = os.path.join(project_path, JOURNAL_FILE)
+    os.makedirs(os.path.dirname(journal_path), exist_ok=True)
+    with open(journal_path, "a", encoding="utf-8", errors="surrogateescape") as f:
+        lock_file(f)
+        f.write("".join(f"{path}\n" for path in sorted(paths)))
+
+
+def watcher_running(project_path):
+    """Return the live watcher's info, or None if no watcher covers this project"""
+    try:
+        with open(os.path.join(project_path, WATCHER_FILE), "r") as f:
+            info = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if info.get("host") != socket.gethostname():
+        return None
+    try:
+        os.kill(info["pid"], 0)
+    except (OSError, KeyError, TypeError):
+        return None
+    return info
+
+
+def _request_flush(project_path):
+    """Ask the watcher to journal pending events and wait until it has"""
+    flush_path = os.path.join(project_path, FLUSH_FILE)
+    with open(flush_path, "w"):
+        pass
+    
+    deadline = time.monotonic() + FLUSH_TIMEOUT
+    while time.monotonic() < deadline:
+        if not os.path.exists(flush_path):
+            return True
+        time.sleep(0.02)
+    
+    try:
+        os.remove(flush_path)
+    except OSError:
+        pass
+    return False
+
+
+@timings.traced()
+def claim_changes(project_path):
+    """Take all journaled paths, emptying the journal
+    
+    Returns None when no watcher is running, because the journal is then not
+    guaranteed to be complete and callers must fall back to a full scan.
+    """
+    if watcher_running(project_path) is None or not _request_flush(project_path):
+        return None
+    
+    journal_path = os.path.join(project_path, JOURNAL_FILE)
+    try:
+        with open(journal_path, "r+", encoding="utf-8", errors="surrogateescape") as f:
+            lock_file(f)
+            paths = {line.rstrip("\n") for line in f if line.strip()}
+            f.seek(0)
+            f.truncate()
+    except FileNotFoundError:
+        paths = set()
+    return paths
+
+
+def _git_env():
+    """Environment for git: journaled paths are file names, so '*', '?' and '[' must not glob"""
+    return dict(os.environ, GIT_LITERAL_PATHSPECS="1")
+
+
+def _git_lines(project_path, args, stdin_paths=None, ok_codes=(0,), literal=False):
+    """Run git with NUL-separated paths on stdin and return NUL-separated output
+    
+    Raises CalledProcessError when git exits with a code not in ok_codes.
+    With literal, pathspecs are not globbed (check-ignore rejects that mode).
+    """
+    stdin = "\0".join(stdin_paths) if stdin_paths is not None else None
+    result = timings.run(["git"] + args, cwd=project_path, input=stdin, env=_git_env() if literal else None,
+                         capture_output=True, text=True, errors="surrogateescape")
+    if result.returncode not in ok_codes:
+        raise subprocess.CalledProcessError(result.returncode, ["git"] + args, result.stdout, result.stderr)
+    return [line for line in result.stdout.split("\0") if line]
+
+
+def _tracked(project_path, paths):
+    """Which of the given paths git tracks (files, or files under a folder path)"""
+    tracked = set()
+    for start in range(0, len(paths), ARG_BATCH_SIZE):
+        tracked.update(_git_lines(project_path, ["ls-files", "-z", "--"] + paths[start:start + ARG_BATCH_SIZE],
+                                   literal=True))
+    return tracked
+
+
+@timings.traced()
+def stage_changes(project_path, paths):
+    """Stage exactly the journaled paths (additions, edits and deletions)
+    
+    Paths that no longer exist are only passed to git when tracked, and ignored
+    paths are dropped, since either would make `git add` fail. Paths are
+    literal pathspecs, so a name containing '*' stages only that file.
+    """
+    if EVERYTHING in paths:
+        timings.run(["git", "add", "-A", "--", "."], cwd=project_path, env=_git_env(), check=True)
+        return
+    
+    paths = sorted(paths)
+    for start in range(0, len(paths), STAGE_BATCH_SIZE):
+        batch = paths[start:start + STAGE_BATCH_SIZE]
+        
+        existing = [path for path in batch if os.path.lexists(os.path.join(project_path, path))]
+        missing = sorted(set(batch) - set(existing))
+        if missing:
+            tracked = _tracked(project_path, missing)
+            missing = [path for path in missing
+                       if path in tracked or any(name.startswith(path + "/") for name in tracked)]
+        if existing:
+            # Exit code 1 means none of them is ignored
+            ignored = set(_git_lines(project_path, ["check-ignore", "-z", "--stdin"], existing, ok_codes=(0, 1)))
+            existing = [path for path in existing if path not in ignored]
+        
+        pathspecs = existing + missing
+        if pathspecs:
+            timings.run(["git", "add", "-A", "--pathspec-from-file=-", "--pathspec-file-nul"],
+                        cwd=project_path, input="\0".join(pathspecs), env=_git_env(), text=True,
+                        errors="surrogateescape", check=True)
+
+
+def _seed_journal(project_path):
+    """Journal everything already dirty when the watcher starts"""
+    records = _git_lines(project_path, ["status", "--porcelain", "-z"])
+    paths = set()
+    skip_next = False
+    for record in records:
+        if skip_next:
+            paths.add(record)  # Original path of a rename
+            skip_next = False
+            continue
+        paths.add(record[3:].rstrip("/"))
+        skip_next = record[0] in "RC"
+    record_changes(project_path, paths)
+
+
+def _raise_keyboard_interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
+def run_change_tracker(project_path=".", poll_interval=1.0):
+    """Watch the project and journal changed paths until interrupted"""
+    watcher = create_watcher(project_path, poll_interval)
+    watcher_path = os.path.join(project_path, WATCHER_FILE)
+    os.makedirs(os.path.dirname(watcher_path), exist_ok=True)
+    
+    # Watches are active before seeding, so nothing slips between the two
+    _seed_journal(project_path)
+    with open(watcher_path, "w") as f:
+        json.dump({"pid": os.getpid(), "host": socket.gethostname(),
+                   "backend": watcher.backend, "started_at": time.time()}, f)
+    
+    # Treat SIGTERM like Ctrl+C so the watcher file is always cleaned up
+    signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
+    
+    print(f"👀 Tracking changes in {os.path.abspath(project_path)} ({watcher.backend})")
+    print("   Press Ctrl+C to stop")
+    flush_path = os.path.join(project_path, FLUSH_FILE)
+    try:
+        while True:
+            changes = {path for path in watcher.read_changes(timeout=0.2) if not is_excluded(path)}
+            record_changes(project_path, changes)
+            
+            # A pause is waiting: drain everything that happened before its request
+            if os.path.exists(flush_path):
+                record_changes(project_path, watcher.read_changes(timeout=0))
+                os.remove(flush_path)
+    except KeyboardInterrupt:
+        print("\n👋 Change tracking stopped")
+    finally:
+        watcher.close()
+        try:
+            os.remove(watcher_path)
+        except OSError:
+            pass
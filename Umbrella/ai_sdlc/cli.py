@@ -0,0 +1,690 @@
+"""
+CLI - Single `ai-sdlc` entry point with start/resume/validate/pause/end subcommands
+
+Each subcommand imports only the modules it needs. With --json a command prints
+its structured result instead of the emoji report; the exit status is non-zero
+whenever the action did not succeed. The numbered scripts are aliases for these
+subcommands.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from ai_sdlc import timings
+
+
+def _print_json(data):
+    print(json.dumps(data, indent=2, default=str))
+
+
+def _common_options():
+    """Options every subcommand accepts"""
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--json", action="store_true", help="Print the result as JSON")
+    common.add_argument("--timings", nargs="?", const="", metavar="PATH",
+                        help="Record step timings (JSON and Chrome trace, default: ~/.ai-sdlc/timings/)")
+    return common
+
+
+# Same values as rule_store.STRATEGIES and scaffold.STAGES, spelled out so that
+# parsing the command line does not import those modules
+STRATEGIES = ("hardlink", "symlink", "copy")
+STAGES = ("development", "testing", "deployment")
+
+
+def _add_sync_rules_options(parser):
+    parser.add_argument("--strategy", choices=STRATEGIES,
+                        help="How rules are installed: hardlink, symlink or copy (default: hardlink)")
+
+
+def _add_component_options(parser):
+    parser.add_argument("--stage", action="append", choices=STAGES,
+                        help="Component folders to create: development (default), testing, deployment")
+    parser.add_argument("--component", action="append", metavar="NAME",
+                        help="Scaffold this component instead of reading component-breakdown.md")
+    parser.add_argument("--dry-run", action="store_true", help="Show the scaffold plan without creating folders")
+
+
+def build_parser():
+    common = _common_options()
+    parser = argparse.ArgumentParser(prog="ai-sdlc", description="AI-SDLC Framework lifecycle commands")
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND")
+    commands.required = True
+    
+    start = commands.add_parser("start", parents=[common], help="Initialize a new project",
+                                description="Interactive setup for AI-driven development")
+    start.add_argument("--name", help="Project name (skips the interactive questions)")
+    start.add_argument("--description", help="Project description")
+    start.add_argument("--tech", action="append", metavar="TECH", help="Technology (repeatable, default: Python)")
+    start.add_argument("--assistant", default="amazon-q", help="Primary AI assistant (default: amazon-q)")
+    start.add_argument("--code-review", default="automated", help="Code review tool (default: automated)")
+    start.add_argument("--path", help="Project folder (default: ./<name>)")
+    start.add_argument("--force", action="store_true", help="Initialize even if the folder already exists")
+    start.add_argument("--sync-rules", nargs="*", metavar="ROOT",
+                       help="Update AI rules in all registered projects (or all projects under ROOT)")
+    start.add_argument("--components", nargs="?", const=".", metavar="PROJECT",
+                       help="Create skeletons for the components in 4-Development/component-breakdown.md")
+    _add_sync_rules_options(start)
+    _add_component_options(start)
+    start.set_defaults(handler=_cmd_start)
+    
+    resume = commands.add_parser("resume", parents=[common], help="Show project status and next steps",
+                                 description="Check status and get next steps")
+    resume.add_argument("project_path", nargs="?", default=".", help="Project folder (default: current folder)")
+    resume.add_argument("--sessions", type=int, default=5, metavar="N",
+                        help="Recent sessions to show from the session journal (default: 5)")
+    resume.set_defaults(handler=_cmd_resume)
+    
+    validate = commands.add_parser("validate", parents=[common], help="Check if the current phase is complete",
+                                   description="Check if the current AI-SDLC phase is ready to advance")
+    validate.add_argument("project_path", nargs="?", default=".", help="Project folder (default: current folder)")
+    validate.add_argument("phase_number", nargs="?", type=int, help="Phase to validate (default: current phase)")
+    validate.add_argument("--portfolio", nargs="+", metavar="ROOT",
+                          help="Validate every AI-SDLC project found under these folders")
+    validate.add_argument("--workers", type=int, help="Concurrent validations in portfolio mode")
+    validate.add_argument("--watch", action="store_true",
+                          help="Stay running and re-validate whenever project files change")
+    validate.add_argument("--debounce", type=float, default=0.5,
+                          help="Seconds of quiet before re-validating in watch mode (default: 0.5)")
+    validate.add_argument("--poll-interval", type=float, default=1.0,
+                          help="Scan interval where inotify is unavailable (default: 1.0)")
+    validate.add_argument("--run-tests", action="store_true",
+                          help="Run changed component tests before checking the Test→Deploy gate")
+    validate.set_defaults(handler=_cmd_validate)
+    
+    pause = commands.add_parser("pause", parents=[common], help="Commit current work and record the pause",
+                                description="Save current work and commit to Git")
+    pause.add_argument("project_path", nargs="?", default=".", help="Project folder (default: current folder)")
+    pause.add_argument("commit_message", nargs="?", help="Commit message (default: phase and timestamp)")
+    pause.add_argument("--watch", action="store_true",
+                       help="Stay resident and journal changed files so pauses skip full-tree scans")
+    pause.add_argument("--push-status", action="store_true",
+                       help="Show pushes still waiting in the background push queue")
+    pause.add_argument("--poll-interval", type=float, default=1.0,
+                       help="Seconds between scans when inotify is unavailable")
+    pause.set_defaults(handler=_cmd_pause)
+    
+    end = commands.add_parser("end", parents=[common], help="Final commit, summary and release tag",
+                              description="Final commit and project completion")
+    end.add_argument("project_path", nargs="?", default=".", help="Project folder (default: current folder)")
+    end.add_argument("final_message", nargs="?", help="Final commit message")
+    end.add_argument("--push-now", action="store_true",
+                     help="Push branch and release tag now (one atomic push) instead of queueing them")
+    end.add_argument("--no-archive", dest="archive", action="store_false",
+                     help="Do not append the phase folders to the project archive")
+    end.set_defaults(handler=_cmd_end)
+    
+    sync = commands.add_parser("sync-rules", parents=[common], help="Update AI rules in many projects",
+                               description="Update AI rules in all registered projects (or all projects under ROOT)")
+    sync.add_argument("roots", nargs="*", metavar="ROOT", help="Folders to search for projects")
+    _add_sync_rules_options(sync)
+    sync.set_defaults(handler=_cmd_sync_rules)
+    
+    components = commands.add_parser("components", parents=[common], help="Create component skeletons",
+                                     description="Create skeletons for the components in "
+                                                 "4-Development/component-breakdown.md")
+    components.add_argument("project_path", nargs="?", default=".", help="Project folder (default: current folder)")
+    _add_component_options(components)
+    components.set_defaults(handler=_cmd_components)
+    
+    test = commands.add_parser("test", parents=[common], help="Run component tests for the Test→Deploy gate",
+                               description="Run each component's tests in parallel, skipping components "
+                                           "unchanged since their last green run")
+    test.add_argument("project_path", nargs="?", default=".", help="Project folder (default: current folder)")
+    test.add_argument("--component", action="append", metavar="NAME",
+                      help="Test only this component (default: all components in 5-Testing)")
+    test.add_argument("--jobs", "-j", type=int, help="Components tested at once (default: CPU count)")
+    test.add_argument("--force", action="store_true", help="Run even components unchanged since a green run")
+    test.add_argument("--command", metavar="CMD",
+                      help="Test command instead of auto-detection; {component}, {src} and {tests} are filled in")
+    test.add_argument("--timeout", type=int, default=600, help="Seconds before a component's run fails (default: 600)")
+    test.set_defaults(handler=_cmd_test)
+    
+    deploy = commands.add_parser("deploy", parents=[common], help="Deploy components incrementally",
+                                 description="Promote component src/ folders into 6-Deployment/deployed-components, "
+                                             "copying only changed files")
+    deploy.add_argument("project_path", nargs="?", default=".", help="Project folder (default: current folder)")
+    deploy.add_argument("--component", action="append", metavar="NAME",
+                        help="Deploy this component (default: every component whose tests passed)")
+    deploy.add_argument("--force", action="store_true", help="Deploy even if the component's tests have not passed")
+    deploy.add_argument("--rollback", action="store_true", help="Switch back to the previous release instead")
+    deploy.add_argument("--keep", type=int, default=3, help="Releases kept per component (default: 3)")
+    deploy.set_defaults(handler=_cmd_deploy)
+    
+    schedule = commands.add_parser("schedule", parents=[common], help="Plan component waves and blockers",
+                                   description="Dependency waves, critical path and blocked components "
+                                               "from 4-Development/component-breakdown.md")
+    schedule.add_argument("project_path", nargs="?", default=".", help="Project folder (default: current folder)")
+    schedule.add_argument("--save", action="store_true",
+                          help="Record the deployment order and blockers in SESSION-STATUS.md")
+    schedule.set_defaults(handler=_cmd_schedule)
+    
+    context = commands.add_parser("context", parents=[common], help="Build a context pack for the AI assistant",
+                                  description="Project status, recent sessions, components and phase "
+                                              "artifacts as one Markdown document within a budget")
+    context.add_argument("project_path", nargs="?", default=".", help="Project folder (default: current folder)")
+    context.add_argument("--budget", type=int, default=8000, metavar="N",
+                         help="Size limit in estimated tokens (default: 8000)")
+    context.add_argument("--bytes", action="store_true", help="Count the budget in bytes instead of tokens")
+    context.add_argument("--phase", type=int, choices=range(1, 8), metavar="N",
+                         help="Build the pack for this phase (default: current phase)")
+    context.add_argument("--output", "-o", metavar="FILE", help="Write the pack to FILE instead of stdout")
+    context.set_defaults(handler=_cmd_context)
+    
+    history = commands.add_parser("history", parents=[common], help="Show phase history and changed artifacts",
+                                  description="Phase history and artifact manifests from .ai-sdlc/state.db")
+    history.add_argument("project_path", nargs="?", default=".", help="Project folder (default: current folder)")
+    history.add_argument("--changed-since", type=int, choices=range(1, 8), metavar="N",
+                         help="List artifacts that changed after Phase N was completed")
+    history.add_argument("--check-files", action="store_true",
+                         help="Also compare recorded artifacts with the files on disk")
+    history.set_defaults(handler=_cmd_history)
+    
+    artifacts = commands.add_parser("artifacts", parents=[common], help="Manage large files kept out of git",
+                                    description="Large design and deployment files in the local artifact store")
+    artifacts.add_argument("project_path", nargs="?", default=".", help="Project folder (default: current folder)")
+    action = artifacts.add_mutually_exclusive_group()
+    action.add_argument("--offload", action="store_true",
+                        help="Move large files to the store now (pause does this automatically)")
+    action.add_argument("--materialize", action="store_true",
+                        help="Restore missing files from the store (resume does this automatically)")
+    artifacts.add_argument("--threshold", type=int, metavar="BYTES",
+                           help="Offload files of at least this size (default: 1 MiB or AI_SDLC_ARTIFACT_THRESHOLD)")
+    artifacts.set_defaults(handler=_cmd_artifacts)
+    
+    archive = commands.add_parser("archive", parents=[common], help="Archive the phase folders",
+                                  description="Append the phase folders to a deduplicated, compressed archive "
+                                              "(end does this automatically)")
+    archive.add_argument("project_path", nargs="?", default=".", help="Project folder (default: current folder)")
+    archive.add_argument("--output", "-o", metavar="FILE",
+                         help="Archive file (default: ~/.ai-sdlc/archives/<project>-<id>.tar)")
+    archive.add_argument("--workers", type=int, help="Compression processes (default: one per CPU)")
+    action = archive.add_mutually_exclusive_group()
+    action.add_argument("--list", action="store_true", help="List the revisions in the archive")
+    action.add_argument("--restore", metavar="REVISION", help="Extract a revision (see --list)")
+    archive.add_argument("--to", metavar="DIR", default=".", help="Folder to restore into (default: current folder)")
+    archive.set_defaults(handler=_cmd_archive)
+    
+    prompts = commands.add_parser("prompts", parents=[common], help="Render prompts from the prompt template",
+                                  description="Fill ai-sdlc-prompt-template.md in bulk: one prompt per data row "
+                                              "(or per component) and phase")
+    prompts.add_argument("project_path", nargs="?", default=".", help="Project folder (default: current folder)")
+    prompts.add_argument("--data", metavar="FILE",
+                         help="JSON, JSON Lines or CSV rows of placeholder values "
+                              "(default: the components in 4-Development/component-breakdown.md)")
+    prompts.add_argument("--values", metavar="FILE", help="JSON object of values shared by every row")
+    prompts.add_argument("--phase", type=int, choices=range(1, 8), metavar="N", action="append",
+                         help="Render this phase (repeatable; default: 4-6 for components, else all)")
+    prompts.add_argument("--template", metavar="FILE", help="Prompt template (default: ai-sdlc-prompt-template.md)")
+    prompts.add_argument("--output", "-o", metavar="DIR",
+                         help="Folder for the prompts (default: .ai-sdlc/prompts in the project)")
+    prompts.add_argument("--strict", action="store_true", help="Fail when any placeholder is left unfilled")
+    prompts.set_defaults(handler=_cmd_prompts)
+    
+    serve = commands.add_parser("serve", parents=[common], help="Serve project status as cached JSON",
+                                description="Local status server for dashboards: keeps every project's phase, "
+                                            "progress and components in memory and answers unchanged polls with 304")
+    serve.add_argument("roots", nargs="*", metavar="ROOT",
+                       help="Folders to search for projects (default: all registered projects)")
+    serve.add_argument("--host", default="127.0.0.1", help="Address to listen on (default: 127.0.0.1)")
+    serve.add_argument("--port", type=int, default=8765, help="Port to listen on (default: 8765)")
+    serve.add_argument("--interval", type=float, default=2.0,
+                       help="Seconds between checks for changed projects (default: 2)")
+    serve.add_argument("--rediscover", type=float, default=30.0, metavar="SECONDS",
+                       help="Seconds between searches for added or removed projects (default: 30)")
+    serve.add_argument("--max-age", type=float, default=60.0, metavar="SECONDS",
+                       help="Re-evaluate unchanged projects after this long (default: 60)")
+    serve.add_argument("--verbose", action="store_true", help="Log every request")
+    serve.set_defaults(handler=_cmd_serve)
+    
+    return parser
+
+
+def _cmd_start(args):
+    if args.sync_rules is not None:
+        args.roots = args.sync_rules
+        return _cmd_sync_rules(args)
+    if args.components is not None:
+        args.project_path = args.components
+        return _cmd_components(args)
+    
+    from ai_sdlc.project import AISDLCManager, ProjectConfig, get_project_config
+    
+    if args.name:
+        config = ProjectConfig(args.name, args.description or f"{args.name} application",
+                               args.tech or ["Python"],
+                               {"assistant": args.assistant, "code_review": args.code_review})
+    elif args.json:
+        print(json.dumps({"ok": False, "error": "--name is required with --json"}))
+        return False
+    else:
+        config = get_project_config()
+    
+    # Determine project root
+    project_root = args.path or f"./{config.name}"
+    if os.path.exists(project_root) and not args.force:
+        if args.name:
+            message = f"Directory '{project_root}' exists (use --force to initialize it anyway)"
+            if args.json:
+                print(json.dumps({"ok": False, "error": message}))
+            else:
+                print(f"❌ {message}")
+            return False
+        overwrite = input(f"\n⚠️  Directory '{config.name}' exists. Overwrite? (y/N): ").strip().lower()
+        if overwrite != 'y':
+            print("❌ Project initialization cancelled")
+            return False
+    
+    # Initialize project
+    if not args.json:
+        print(f"\n🏗️  Initializing project '{config.name}'...")
+    manager = AISDLCManager(config, project_root)
+    result = manager.start_project()
+    
+    if args.json:
+        result["ok"] = True
+        result["project_path"] = project_root
+        _print_json(result)
+        return True
+    
+    # Display results
+    print("\n✅ Project initialized successfully!")
+    print(f"📁 Project folder: {project_root}")
+    print(f"📋 Current phase: {result['phase'].title()}")
+    print(f"🔧 Git status: {result['git_initialized']}")
+    print(f"🤖 AI rules: {result['ai_rules_loaded']}")
+    
+    print(f"\n🎯 Next steps:")
+    print(f"1. cd {config.name}")
+    print(f"2. Work in folder: {result['phase_folder']}")
+    print(f"3. Complete these actions:")
+    for action in result['actions']:
+        print(f"   - {action}")
+    print(f"4. Run: python ../Umbrella/3-validate-phase.py")
+    return True
+
+
+def _cmd_resume(args):
+    from ai_sdlc.resume import project_status, resume_project
+    
+    if args.json:
+        result = project_status(args.project_path, args.sessions)
+        _print_json(result)
+        return result["ok"]
+    return resume_project(args.project_path, args.sessions)
+
+
+def _cmd_validate(args):
+    from ai_sdlc import validation
+    
+    if args.watch and (args.portfolio or args.json):
+        print("❌ --watch cannot be combined with --portfolio or --json", file=sys.stderr)
+        return False
+    
+    if args.run_tests and not args.portfolio:
+        from ai_sdlc.test_runner import print_test_report, run_component_tests
+        
+        report = run_component_tests(args.project_path)
+        if not args.json:
+            print_test_report(report)
+            print()
+    
+    if args.watch:
+        return validation.watch_phase(args.project_path, args.phase_number, args.debounce, args.poll_interval)
+    if args.portfolio:
+        report = validation.validate_portfolio(args.portfolio, args.phase_number, args.workers)
+        if args.json:
+            _print_json(report)
+        else:
+            validation.print_portfolio_report(report)
+        return report["summary"]["passed"] == report["summary"]["total"]
+    if args.json:
+        result = validation.evaluate_phase(args.project_path, args.phase_number)
+        _print_json(result)
+        return result["passed"]
+    return validation.validate_phase(args.project_path, args.phase_number)
+
+
+def _cmd_pause(args):
+    if args.push_status:
+        from ai_sdlc.push_queue import print_queue_status, queue_status
+        
+        entries = queue_status()
+        if args.json:
+            _print_json(entries)
+        else:
+            print_queue_status(entries)
+        return True
+    
+    if args.watch:
+        from ai_sdlc.change_journal import run_change_tracker
+        
+        run_change_tracker(args.project_path, args.poll_interval)
+        return True
+    
+    from ai_sdlc.pause import pause_project, pause_session
+    
+    if args.json:
+        result = pause_session(args.project_path, args.commit_message)
+        _print_json(result)
+        return result["ok"]
+    
+    print("⏸️  Pausing AI-SDLC Project...")
+    success = pause_project(args.project_path, args.commit_message)
+    if success:
+        print("\n✅ Project paused successfully!")
+        print("💡 To resume: python ../Umbrella/2-resume-project.py")
+    else:
+        print("\n❌ Failed to pause project")
+    return success
+
+
+def _cmd_end(args):
+    from ai_sdlc.completion import complete_project, end_project
+    
+    if args.json:
+        result = complete_project(args.project_path, args.final_message, args.push_now, args.archive)
+        _print_json(result)
+        return result["ok"]
+    
+    print("🏁 Ending AI-SDLC Project...")
+    success = end_project(args.project_path, args.final_message, args.push_now, args.archive)
+    if not success:
+        print("\n❌ Failed to end project")
+    return success
+
+
+def _cmd_sync_rules(args):
+    from ai_sdlc.project import sync_project_rules
+    
+    results = sync_project_rules(args.roots, args.strategy)
+    if args.json:
+        _print_json(results)
+        return not any(result.get("error") for result in results)
+    
+    updated = 0
+    for result in results:
+        if result.get("error"):
+            print(f"❌ {result['project']}: {result['error']}")
+        elif result["installed"]:
+            updated += 1
+            print(f"🔄 {result['project']}: {len(result['installed'])} rule file(s) updated")
+    print(f"✅ AI rules in sync: {len(results)} project(s) checked, {updated} updated")
+    return not any(result.get("error") for result in results)
+
+
+def _cmd_components(args):
+    if args.json:
+        from ai_sdlc.scaffold import scaffold_components
+        
+        try:
+            plan = scaffold_components(args.project_path, args.stage or ["development"], args.component,
+                                       dry_run=args.dry_run)
+        except FileNotFoundError as e:
+            print(json.dumps({"ok": False, "error": f"{e.filename} not found"}))
+            return False
+        except ValueError as e:
+            print(json.dumps({"ok": False, "error": str(e)}))
+            return False
+        plan["ok"] = bool(plan["components"]) and not plan["conflicts"]
+        _print_json(plan)
+        return plan["ok"]
+    
+    from ai_sdlc.project import create_components
+    
+    return create_components(args.project_path, args.stage, args.component, args.dry_run)
+
+
+def _cmd_test(args):
+    from ai_sdlc.test_runner import print_test_report, run_component_tests
+    
+    report = run_component_tests(args.project_path, args.component, args.jobs, args.force, args.command,
+                                 args.timeout)
+    if args.json:
+        _print_json(report)
+    else:
+        print_test_report(report)
+    return report["failed"] == 0
+
+
+def _cmd_deploy(args):
+    from ai_sdlc import deploy
+    from ai_sdlc.test_runner import test_statuses
+    from ai_sdlc.validation import get_component_status
+    
+    if args.rollback:
+        if not args.component:
+            print("❌ --rollback needs --component NAME", file=sys.stderr)
+            return False
+        results = [deploy.rollback_component(args.project_path, name) for name in args.component]
+    else:
+        names = args.component or get_component_status(args.project_path)["testing"]
+        results = []
+        if not args.force:
+            statuses = test_statuses(args.project_path, names)
+            for name in names:
+                if statuses[name] == "passed":
+                    continue
+                if args.component:
+                    results.append({"component": name, "ok": False,
+                                    "error": f"tests not passing ({statuses[name]}); use --force to deploy anyway"})
+                else:
+                    # Not asked for by name: reported, but not a failure on its own
+                    results.append({"component": name, "ok": False, "skipped": True,
+                                    "error": f"tests not passing ({statuses[name]})"})
+            names = [name for name in names if statuses[name] == "passed"]
+        results.extend(deploy.deploy_component(args.project_path, name, args.keep) for name in names)
+    
+    deployed = [result for result in results if not result.get("skipped")]
+    if args.json:
+        _print_json(results)
+    else:
+        deploy.print_deploy_results(results)
+        if not deployed:
+            print("📭 No components with passing tests to deploy (run: python ../Umbrella/ai-sdlc.py test)")
+    return bool(deployed) and all(result["ok"] for result in deployed)
+
+
+def _cmd_schedule(args):
+    from ai_sdlc.schedule import build_schedule, print_schedule, save_schedule
+    
+    schedule = build_schedule(args.project_path)
+    if args.json:
+        _print_json(schedule)
+    elif schedule["error"]:
+        print(f"❌ {schedule['error']}")
+    else:
+        print_schedule(schedule)
+    
+    if schedule["ok"] and args.save:
+        if not save_schedule(args.project_path, schedule):
+            print("❌ No SESSION-STATUS.md found. Not an AI-SDLC project.", file=sys.stderr)
+            return False
+        if not args.json:
+            print("📝 SESSION-STATUS.md updated with the deployment order")
+    return schedule["ok"] and not schedule["cycles"]
+
+
+def _cmd_context(args):
+    from ai_sdlc.context_pack import build_context_pack, print_context_summary
+    from ai_sdlc.fsutil import atomic_write
+    
+    pack = build_context_pack(args.project_path, args.budget, "bytes" if args.bytes else "tokens", args.phase)
+    if pack["ok"] and args.output:
+        atomic_write(args.output, pack["text"])
+    
+    if args.json:
+        _print_json(pack)
+    elif pack["error"]:
+        print(f"❌ {pack['error']}")
+    elif args.output:
+        print_context_summary(pack, args.output)
+    else:
+        print(pack["text"], end="")
+    return pack["ok"]
+
+
+def _cmd_history(args):
+    from ai_sdlc.session_state import phase_label
+    from ai_sdlc.state_db import changed_since, phase_history
+    
+    if args.changed_since:
+        result = changed_since(args.project_path, args.changed_since, args.check_files)
+        if args.json:
+            _print_json(result)
+            return True
+        if not result["completed"]:
+            print(f"📭 {phase_label(args.changed_since)} has not been completed yet, nothing recorded to compare")
+            return True
+        print(f"🔎 Artifacts changed since {phase_label(args.changed_since)} "
+              f"({result['recorded']} file(s) recorded then):")
+        for key, icon in (("added", "+"), ("changed", "~"), ("removed", "-")):
+            for path in result[key]:
+                print(f"   {icon} {path}")
+        if not (result["added"] or result["changed"] or result["removed"]):
+            print("   (none)")
+        return True
+    
+    history = phase_history(args.project_path)
+    if args.json:
+        _print_json(history)
+        return True
+    if not history:
+        print("📭 No phase history recorded yet (.ai-sdlc/state.db)")
+        return True
+    print("📜 Phase history:")
+    for item in history:
+        until = item["left_at"] or "now"
+        print(f"   {phase_label(item['phase'])}: {item['entered_at']} → {until} ({item['artifacts']} file(s) recorded)")
+    return True
+
+
+def _cmd_artifacts(args):
+    from ai_sdlc.artifact_store import artifact_status, materialize_artifacts, offload_artifacts
+    from ai_sdlc.repo_stats import format_bytes
+    
+    if args.offload:
+        result = offload_artifacts(args.project_path, args.threshold)
+        if args.json:
+            _print_json(result)
+        else:
+            print(f"📦 Offloaded {len(result['offloaded'])} file(s) ({format_bytes(result['bytes'])}), "
+                  f"{len(result['removed'])} pointer(s) dropped, {result['managed']} managed")
+        return True
+    
+    if args.materialize:
+        result = materialize_artifacts(args.project_path)
+        if args.json:
+            _print_json(result)
+        else:
+            print(f"📦 Restored {len(result['materialized'])} of {result['managed']} offloaded file(s)")
+            for path in result["missing"]:
+                print(f"   ⚠️  {path}: not in this machine's artifact store")
+        return not result["missing"]
+    
+    status = artifact_status(args.project_path)
+    if args.json:
+        _print_json(status)
+        return True
+    print(f"📦 {len(status)} offloaded file(s), {format_bytes(sum(item['size'] for item in status))}")
+    for item in status:
+        state = "ok" if item["present"] else ("restorable" if item["stored"] else "missing")
+        print(f"   {item['path']} ({format_bytes(item['size'])}, {state})")
+    return all(item["present"] or item["stored"] for item in status)
+
+
+def _cmd_archive(args):
+    from ai_sdlc.archive import archive_project, default_archive_path, list_revisions, restore_revision
+    from ai_sdlc.repo_stats import format_bytes
+    
+    path = args.output or default_archive_path(args.project_path)
+    if args.list:
+        revisions = list_revisions(path, args.project_path)
+        if args.json:
+            _print_json({"archive": path, "revisions": revisions})
+        else:
+            print(f"🗄️  {path}: {len(revisions)} revision(s)")
+            for revision in revisions:
+                print(f"   {revision}")
+        return True
+    
+    if args.restore:
+        restored = restore_revision(path, args.restore, args.to)
+        if args.json:
+            _print_json({"archive": path, "revision": args.restore, "restored": restored})
+        else:
+            print(f"🗄️  Restored {restored} file(s) of {args.restore} into {args.to}")
+        return True
+    
+    result = archive_project(args.project_path, path, args.workers)
+    if args.json:
+        _print_json(result)
+    else:
+        print(f"🗄️  Archived revision {result['revision']} to {result['archive']}")
+        print(f"   {result['files']} file(s), {format_bytes(result['bytes_in'])}: {result['new_objects']} new "
+              f"object(s) ({format_bytes(result['bytes_added'])} compressed), {result['reused']} unchanged")
+    return True
+
+
+def _cmd_prompts(args):
+    from ai_sdlc.prompts import (COMPONENT_PHASES, OUTPUT_DIR, component_rows, load_rows, print_prompt_report,
+                                 render_prompts, write_prompts)
+    
+    if args.data:
+        rows = load_rows(args.data)
+        phases = args.phase
+    else:
+        rows = component_rows(args.project_path)
+        phases = args.phase or COMPONENT_PHASES
+        if not rows:
+            print("⚠️  No components found in 4-Development/component-breakdown.md (use --data FILE)")
+            return False
+    defaults = None
+    if args.values:
+        with open(args.values, "r", encoding="utf-8") as f:
+            defaults = json.load(f)
+    
+    result = render_prompts(rows, phases, args.template, defaults)
+    output = args.output or os.path.join(args.project_path, OUTPUT_DIR)
+    result["paths"] = write_prompts(result, output)
+    if args.json:
+        for prompt in result["prompts"]:
+            del prompt["text"]  # Written to result["paths"]
+        _print_json(result)
+    else:
+        print_prompt_report(result, output)
+    return not (args.strict and result["unfilled"])
+
+
+def _cmd_serve(args):
+    from ai_sdlc.status_server import serve_status
+    
+    return serve_status(args.roots, args.host, args.port, args.interval, args.rediscover, args.max_age,
+                        args.verbose)
+
+
+def main(argv=None):
+    """Run one subcommand; exits with status 1 when it did not succeed"""
+    args = build_parser().parse_args(argv)
+    timings.enable_from_args(args.timings)
+    
+    try:
+        success = args.handler(args)
+    except KeyboardInterrupt:
+        print("\n❌ Cancelled")
+        success = False
+    except Exception as e:
+        if args.json:
+            print(json.dumps({"ok": False, "error": str(e)}))
+        else:
+            print(f"\n❌ Error: {str(e)}")
+        success = False
+    
+    if not success:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
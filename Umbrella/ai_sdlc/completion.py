@@ -0,0 +1,363 @@
+"""
+Completion - Final commit, completion summary, release tag and final push
+
+The end step is a small release pipeline. After the final commit, repository
+statistics, the completion summary and remote discovery run concurrently.
+Then the release is tagged, and the branch and tag go out together in one
+atomic push while the phase folders are appended to the project archive.
+"""
+
+import asyncio
+import os
+import subprocess
+import time
+from datetime import datetime
+
+from ai_sdlc import timings
+from ai_sdlc.archive import archive_project
+from ai_sdlc.artifact_store import offload_artifacts
+from ai_sdlc.fsutil import atomic_write
+from ai_sdlc.pause import GIT_NOT_FOUND
+from ai_sdlc.push_queue import (atomic_push_args, enqueue_push, push_failure, resolve_push_target,
+                                start_worker)
+from ai_sdlc.repo_stats import collect_repo_stats, format_bytes
+from ai_sdlc.session_state import PHASE_NAMES, load_state, phase_label
+from ai_sdlc.state_db import phase_history
+
+
+def phase_status_lines(current_phase, entered):
+    """Final Status lines for the phases the project actually went through"""
+    entered = sorted(set(entered) | ({current_phase} if current_phase else set()))
+    if entered == list(range(1, len(PHASE_NAMES) + 1)):
+        return [f"- All {len(PHASE_NAMES)} phases completed"]
+    lines = []
+    if current_phase:
+        lines.append(f"- Ended in Phase {phase_label(current_phase)}")
+    if len(entered) > 1:
+        lines.append(f"- Phases entered: {', '.join(str(phase) for phase in entered)}")
+    return lines
+
+
+def render_completion_summary(project_name, stats, current_phase=None, entered=()):
+    """Render PROJECT-COMPLETION.md with the phases gone through and repository statistics per phase folder"""
+    lines = [
+        "# Project Completion Summary",
+        "",
+        f"## Project: {project_name}",
+        f"## Completed: {datetime.now().strftime('%Y-%m-%d %H:%M')}",
+        "",
+        "## Final Status",
+        *phase_status_lines(current_phase, entered),
+        "- Code committed to repository",
+        "- Project ready for deployment/maintenance",
+        "",
+        "## Repository Information"
+    ]
+    
+    if stats:
+        lines.append(f"- Total commits: {stats['commits']}")
+        lines.append(f"- Tracked files: {stats['files']} ({format_bytes(stats['bytes'])})")
+        lines.append("")
+        lines.append("| Phase Folder | Files | Size | Commits |")
+        lines.append("|--------------|-------|------|---------|")
+        for folder, phase in stats["phases"].items():
+            lines.append(f"| {folder} | {phase['files']} | {format_bytes(phase['bytes'])} | {phase['commits']} |")
+        lines.append("")
+        lines.append("_File and size counts exclude this summary._")
+    else:
+        lines.append("- Repository statistics unavailable")
+    
+    lines += [
+        "",
+        "## Next Steps",
+        "1. Deploy to production environment",
+        "2. Set up monitoring and maintenance",
+        "3. Plan future enhancements",
+        "4. Keep the project archive (~/.ai-sdlc/archives/) with the release",
+        "",
+        "---",
+        "Generated by AI-SDLC Framework",
+        ""
+    ]
+    return "\n".join(lines)
+
+
+async def _git(project_path, *args, check=True):
+    """Run git as an asyncio subprocess, returning (returncode, stdout, stderr)"""
+    process = await asyncio.create_subprocess_exec("git", *args, cwd=project_path, stdin=subprocess.DEVNULL,
+                                                   stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    stdout, stderr = await process.communicate()
+    stdout = stdout.decode("utf-8", "replace")
+    stderr = stderr.decode("utf-8", "replace")
+    if check and process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, ["git", *args], stdout, stderr)
+    return process.returncode, stdout, stderr
+
+
+def _stage_runner(stages, started):
+    """Run pipeline stages, recording outcome, start offset and duration of each in `stages`"""
+    async def run(name, step, fatal=True):
+        record = {"stage": name, "status": "ok", "detail": None,
+                  "start": round(time.perf_counter() - started, 3), "seconds": 0.0}
+        stages.append(record)
+        try:
+            return await step(record)
+        except subprocess.CalledProcessError as e:
+            record.update(status="failed", detail=(e.stderr or "").strip() or str(e))
+            if fatal:
+                raise
+        except Exception as e:
+            record.update(status="failed", detail=str(e))
+            if fatal:
+                raise
+        finally:
+            record["seconds"] = round(time.perf_counter() - started - record["start"], 3)
+    return run
+
+
+async def _commit_changes(project_path, final_message, record):
+    """Commit everything staged; returns whether there was anything to commit"""
+    _, status, _ = await _git(project_path, "status", "--porcelain")
+    if not status.strip():
+        record["status"] = "skipped"
+        record["detail"] = "nothing to commit"
+        return False
+    await _git(project_path, "commit", "-q", "-m", final_message)
+    return True
+
+
+def _collect_stats(project_path, has_changes):
+    """Repository statistics of the committed tree, or None when git cannot provide them"""
+    try:
+        stats = collect_repo_stats(project_path)
+    except subprocess.CalledProcessError:
+        return None
+    if not has_changes:
+        stats["commits"] += 1  # The summary commit
+    return stats
+
+
+async def _write_summary(project_path, project_name, stats, final_message, has_changes):
+    """Write PROJECT-COMPLETION.md and fold it into the final commit"""
+    state = load_state(project_path) or {}
+    entered = [entry["phase"] for entry in phase_history(project_path)]
+    atomic_write(os.path.join(project_path, "PROJECT-COMPLETION.md"),
+                 render_completion_summary(project_name, stats, state.get("phase"), entered))
+    await _git(project_path, "add", "PROJECT-COMPLETION.md")
+    if has_changes:
+        await _git(project_path, "commit", "--amend", "--no-edit", "-q")
+    else:
+        await _git(project_path, "commit", "-q", "-m", final_message)
+
+
+def _queue_refs(project_path, refs, remote):
+    """Hand refs to the background push worker as one queue entry"""
+    try:
+        enqueue_push(project_path, refs, remote)
+        start_worker()
+    except OSError as e:
+        return {"status": "failed", "remote": remote, "error": str(e)}
+    return {"status": "queued", "remote": remote, "error": None}
+
+
+async def _push(project_path, tags, target, push_now, record):
+    """Send the branch and tags in one atomic push, now or through the push queue"""
+    remote, branch = target
+    refs = [f"refs/tags/{tag}" for tag in tags] + ([f"refs/heads/{branch}"] if branch else [])
+    if remote is None or not refs:
+        record.update(status="skipped", detail="no remote")
+        return {"status": "no_remote", "remote": None, "error": None}
+    
+    if not push_now:
+        push = await asyncio.to_thread(_queue_refs, project_path, refs, remote)
+    else:
+        returncode, stdout, stderr = await _git(project_path, *atomic_push_args(remote, refs), check=False)
+        if returncode == 0:
+            push = {"status": "pushed", "remote": remote, "error": None}
+        else:
+            push = {"status": "failed", "remote": remote, "error": push_failure(returncode, stdout, stderr)[1]}
+    if push["error"]:
+        record.update(status="failed", detail=push["error"])
+    return push
+
+
+async def _archive(project_path, record):
+    """Append this revision to the project archive in worker processes"""
+    archive = await asyncio.to_thread(archive_project, project_path)
+    record["detail"] = f"{archive['new_objects']} new / {archive['files']} file(s)"
+    return archive
+
+
+async def _release_pipeline(project_path, project_name, final_message, push_now, archive, result):
+    """Commit, then gather stats/summary and discover the remote concurrently, then tag, push and archive"""
+    run = _stage_runner(result["stages"], time.perf_counter())
+    
+    async def stage(record):
+        offload = await asyncio.to_thread(offload_artifacts, project_path)
+        if offload["offloaded"]:
+            record["detail"] = f"{len(offload['offloaded'])} large file(s) offloaded"
+        await _git(project_path, "add", ".")
+    
+    await run("stage", stage)
+    has_changes = await run("commit", lambda record: _commit_changes(project_path, final_message, record))
+    
+    async def stats_and_summary():
+        result["stats"] = await run("stats", lambda record: asyncio.to_thread(_collect_stats, project_path,
+                                                                               has_changes))
+        await run("summary", lambda record: _write_summary(project_path, project_name, result["stats"],
+                                                           final_message, has_changes))
+    
+    # Remote discovery only reads config, so it overlaps with the stats and summary commit
+    _, target = await asyncio.gather(
+        stats_and_summary(),
+        run("remote", lambda record: asyncio.to_thread(resolve_push_target, project_path)))
+    result["commit_message"] = final_message
+    
+    tag_name = f"v1.0-{datetime.now().strftime('%Y%m%d')}"
+    tags = []
+    await run("tag", lambda record: _git(project_path, "tag", "-a", tag_name, "-m", f"Release: {project_name}"),
+              fatal=False)
+    if result["stages"][-1]["status"] == "ok":
+        tags.append(tag_name)
+        result["tag"] = tag_name
+    else:
+        result["tag_error"] = result["stages"][-1]["detail"]
+    
+    push = run("push", lambda record: _push(project_path, tags, target, push_now, record))
+    if not archive:
+        result["push"] = await push
+        return
+    # The archive reads only the working tree, so it overlaps with the network push
+    result["push"], result["archive"] = await asyncio.gather(
+        push, run("archive", lambda record: _archive(project_path, record), fatal=False))
+
+
+@timings.traced()
+def complete_project(project_path=".", final_message=None, push_now=False, archive=True):
+    """Create the final commit, summary and release tag, returning a result record (no output)
+    
+    The steps run as an asyncio release pipeline; result["stages"] reports the
+    outcome, start offset and duration of each. The branch and tag go out in
+    one atomic push: queued for the background worker, or right away with
+    push_now. With archive, the phase folders are appended to the project
+    archive (see ai_sdlc.archive) alongside the push.
+    """
+    result = {
+        "project": project_path,
+        "ok": False,
+        "error": None,
+        "name": None,
+        "commit_message": None,
+        "tag": None,
+        "tag_error": None,
+        "stats": None,
+        "push": None,
+        "archive": None,
+        "stages": [],
+        "completed_at": None
+    }
+    
+    # Check if this is an AI-SDLC project
+    state = load_state(project_path)
+    if state is None:
+        result["error"] = "No SESSION-STATUS.md found. Not an AI-SDLC project."
+        return result
+    
+    # Check if Git repository exists
+    if not os.path.exists(os.path.join(project_path, ".git")):
+        result["error"] = "No Git repository found."
+        return result
+    
+    # Read project name from the project state
+    project_name = state.get("project", {}).get("name") or "AI-SDLC Project"
+    result["name"] = project_name
+    if not final_message:
+        final_message = f"🏁 Project Completion: {project_name} - {datetime.now().strftime('%Y-%m-%d')}"
+    
+    try:
+        with timings.span("release pipeline"):
+            asyncio.run(_release_pipeline(project_path, project_name, final_message, push_now, archive,
+                                          result))
+    except subprocess.CalledProcessError as e:
+        result["error"] = f"Git operation failed: {e}"
+        return result
+    except FileNotFoundError:
+        result["error"] = GIT_NOT_FOUND
+        return result
+    
+    result["completed_at"] = datetime.now().strftime('%Y-%m-%d %H:%M')
+    result["ok"] = True
+    return result
+
+
+def print_stage_report(stages):
+    """Print the outcome and timing of each release pipeline stage"""
+    icons = {"ok": "✅", "skipped": "⏭️ ", "failed": "❌"}
+    print("\n⏱️  Release pipeline:")
+    for stage in stages:
+        detail = f"  {stage['detail']}" if stage["detail"] else ""
+        print(f"   {icons[stage['status']]} {stage['stage']:<8} +{stage['start']:.2f}s  "
+              f"{stage['seconds']:.2f}s{detail}")
+
+
+@timings.traced()
+def end_project(project_path=".", final_message=None, push_now=False, archive=True):
+    """End project with final commit and summary"""
+    result = complete_project(project_path, final_message, push_now, archive)
+    if result["error"]:
+        print(f"❌ {result['error']}")
+        if result["stages"]:
+            print_stage_report(result["stages"])
+        return False
+    
+    project_name = result["name"]
+    print(f"🏁 Ending Project: {project_name}")
+    print(f"✅ Final commit created: {result['commit_message']}")
+    
+    if result["tag"]:
+        print(f"🏷️  Created release tag: {result['tag']}")
+    else:
+        print("⚠️  Could not create release tag")
+    
+    push = result["push"]
+    if push["status"] == "pushed":
+        print(f"📤 Branch and tag pushed to '{push['remote']}' in one atomic push")
+    elif push["status"] == "queued":
+        print(f"📤 Final push to '{push['remote']}' queued; it continues in the background")
+        print("   Check progress: python ../Umbrella/4-pause-project.py --push-status")
+    elif push["status"] == "no_remote":
+        print("📡 No remote repository configured")
+    else:
+        print(f"⚠️  Could not push to remote ({push['error']}). Push manually:")
+        print("   git push --atomic origin HEAD --tags")
+    
+    if result["archive"]:
+        print(f"🗄️  Archived revision {result['archive']['revision']} to {result['archive']['archive']}")
+    
+    # Display completion summary
+    print("\n" + "="*60)
+    print("🎉 PROJECT COMPLETED SUCCESSFULLY! 🎉")
+    print("="*60)
+    print(f"📁 Project: {project_name}")
+    print(f"📅 Completed: {result['completed_at']}")
+    print(f"📄 Summary: PROJECT-COMPLETION.md created")
+    print(f"🏷️  Release: {result['tag'] or 'Not tagged'}")
+    print("="*60)
+    
+    # Show repository stats
+    stats = result["stats"]
+    if stats:
+        print(f"📊 Total commits: {stats['commits']}")
+        print(f"📊 Total files: {stats['files']}")
+    print_stage_report(result["stages"])
+    
+    print("\n💡 Next Steps:")
+    print("   1. Deploy to production")
+    print("   2. Set up monitoring")
+    print("   3. Plan maintenance schedule")
+    if result["archive"]:
+        print("   4. Keep the project archive with the release")
+    else:
+        print("   4. Archive project documentation: python ../Umbrella/ai-sdlc.py archive")
+    
+    return True
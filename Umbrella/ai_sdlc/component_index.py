@@ -0,0 +1,142 @@
+"""
+Component Index - Persistent, mtime-refreshed index of component folders (Phases 4-6)
+
+A warm load reads no directory listings, but it still stats every component
+and each of its top-level folders, so its cost grows with the number of
+components. The root's mtime alone cannot stand in for those stats: a file
+added to an empty src/ changes only src/'s mtime, and that decides whether
+src is listed.
+"""
+
+import json
+import os
+
+from ai_sdlc import timings
+from ai_sdlc.fsutil import atomic_write
+
+COMPONENT_ROOTS = {
+    "development": "4-Development/components",
+    "testing": "5-Testing/component-tests",
+    "deployed": "6-Deployment/deployed-components"
+}
+
+STATE_DIR = ".ai-sdlc"
+CACHE_DIR = os.path.join(STATE_DIR, "cache")
+INDEX_FILE = os.path.join(CACHE_DIR, "component-index.json")
+INDEX_VERSION = 2
+
+
+def _scan_root(root_path):
+    """List component folders of a root in a single scandir pass"""
+    with os.scandir(root_path) as entries:
+        return {entry.name: entry for entry in entries
+                if not entry.name.startswith(".") and entry.is_dir()}
+
+
+def scan_component(component_path):
+    """List the top-level entries (src, tests, docs, ...) of a component, leaving out empty folders
+    
+    Returns (entries, {folder: mtime_ns}). A folder's mtime moves when its
+    first entry is added or its last one removed, so the mtimes tell when
+    the listing is stale.
+    """
+    names = []
+    folders = {}
+    with os.scandir(component_path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                folders[entry.name] = entry.stat().st_mtime_ns
+                with os.scandir(entry.path) as contents:
+                    if next(contents, None) is None:
+                        continue
+            names.append(entry.name)
+    return sorted(names), folders
+
+
+def _folders_unchanged(component_path, folders):
+    try:
+        return all(os.stat(os.path.join(component_path, name)).st_mtime_ns == mtime_ns
+                   for name, mtime_ns in folders.items())
+    except OSError:
+        return False
+
+
+def _read_index(index_path):
+    """Read the on-disk index, returning an empty index when missing or stale"""
+    try:
+        with open(index_path, 'r') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return {"version": INDEX_VERSION, "roots": {}}
+    
+    if index.get("version") != INDEX_VERSION:
+        return {"version": INDEX_VERSION, "roots": {}}
+    return index
+
+
+def _write_index(index_path, index):
+    """Atomically replace the on-disk index (best effort, cache only)"""
+    try:
+        atomic_write(index_path, json.dumps(index, separators=(",", ":")))
+    except OSError:
+        pass
+
+
+def _refresh_root(root_path, cached):
+    """Refresh one component root, rescanning only folders whose mtime changed"""
+    try:
+        root_mtime = os.stat(root_path).st_mtime_ns
+    except OSError:
+        return {"mtime_ns": None, "components": {}}
+    
+    cached_components = cached.get("components", {}) if cached else {}
+    if cached and cached.get("mtime_ns") == root_mtime:
+        # Root listing unchanged: no component was added or removed
+        names = {name: None for name in cached_components}
+    else:
+        names = _scan_root(root_path)
+    
+    components = {}
+    for name, entry in names.items():
+        component_path = os.path.join(root_path, name)
+        try:
+            stat = entry.stat() if entry is not None else os.stat(component_path)
+        except OSError:
+            continue
+        
+        previous = cached_components.get(name)
+        if (previous and previous.get("mtime_ns") == stat.st_mtime_ns
+                and _folders_unchanged(component_path, previous["folders"])):
+            components[name] = previous
+            continue
+        
+        try:
+            entries, folders = scan_component(component_path)
+            components[name] = {"mtime_ns": stat.st_mtime_ns, "entries": entries, "folders": folders}
+        except OSError:
+            continue
+    
+    return {"mtime_ns": root_mtime, "components": components}
+
+
+@timings.traced()
+def load_component_index(project_path="."):
+    """Load the component index, refreshing it incrementally from disk
+    
+    Returns a mapping of status ("development", "testing", "deployed") to
+    {component name: [top-level entries]}, where empty folders are left out.
+    Only changed components are listed again, but each one is stat'ed, so
+    a warm load is O(components) stats.
+    """
+    index_path = os.path.join(project_path, INDEX_FILE)
+    index = _read_index(index_path)
+    
+    roots = {}
+    for status, root in COMPONENT_ROOTS.items():
+        roots[status] = _refresh_root(os.path.join(project_path, root), index["roots"].get(status))
+    
+    if roots != index["roots"]:
+        _write_index(index_path, {"version": INDEX_VERSION, "roots": roots})
+    
+    return {status: {name: component["entries"] for name, component in root["components"].items()}
+            for status, root in roots.items()}
@@ -0,0 +1,287 @@
+"""
+Context Pack - Budgeted session context for the AI assistant
+
+Assembles one Markdown document for the current phase: the project status,
+recent sessions, component states (Phases 4-6) and the prior-phase artifacts
+the phase rules list as MANDATORY INPUTS, followed by the phase's own
+artifacts. Every artifact first gets an outline (headings and opening
+paragraph); artifacts are then upgraded to their full text in priority order
+while the budget lasts.
+
+Outlines come from a per-file digest cache in .ai-sdlc/cache/, keyed by size
+and mtime with the content hash as fallback, so repeated builds only re-read
+the files that changed.
+"""
+
+import json
+import os
+import re
+
+from ai_sdlc import timings
+from ai_sdlc.component_index import CACHE_DIR
+from ai_sdlc.fsutil import atomic_write, file_sha256, locked
+from ai_sdlc.journal import tail_entries
+from ai_sdlc.session_state import PHASE_RULES, load_state, phase_label
+from ai_sdlc.test_runner import test_statuses
+from ai_sdlc.validation import PHASE_REQUIREMENTS, component_label, component_records
+
+DIGEST_FILE = os.path.join(CACHE_DIR, "context-digests.json")
+DIGEST_VERSION = 1
+
+DEFAULT_BUDGET = 8000
+BYTES_PER_TOKEN = 4
+SUMMARY_CHARS = 400
+RECENT_SESSIONS = 3
+
+# MANDATORY INPUTS from earlier phases, as listed in each phase's rules, most important first
+PHASE_INPUTS = {
+    1: [],
+    2: ["1-Planning/project-charter.md", "1-Planning/initial-timeline.md", "1-Planning/stakeholder-map.md"],
+    3: ["2-Requirements/requirements-specification.md", "2-Requirements/user-stories.md",
+        "2-Requirements/acceptance-criteria.md"],
+    4: ["3-Design/system-architecture.md", "3-Design/api-specifications.md", "3-Design/database-schema.md",
+        "3-Design/data-interfaces.md", "3-Design/ui-flows.md", "3-Design/wireframes.md"],
+    5: ["3-Design/system-architecture.md", "3-Design/api-specifications.md"],
+    6: ["5-Testing/test-status.md"],
+    7: ["6-Deployment/deployment-status.md"]
+}
+
+_HEADING_PATTERN = re.compile(r"^ {0,3}(#{1,6})\s+(.+?)\s*#*\s*$")
+
+
+def measure(text, unit="tokens"):
+    """Size of text in budget units: estimated tokens (about four bytes each) or bytes"""
+    size = len(text.encode("utf-8"))
+    return size if unit == "bytes" else -(-size // BYTES_PER_TOKEN)
+
+
+def digest_text(text):
+    """Outline of a Markdown document: its headings and first paragraph of prose"""
+    headings = []
+    paragraph = []
+    paragraph_done = False
+    in_code = False
+    for line in text.splitlines():
+        stripped = line.strip()
+        if stripped.startswith(("```", "~~~")):
+            in_code = not in_code
+            continue
+        if in_code:
+            continue
+        match = _HEADING_PATTERN.match(line)
+        if match:
+            headings.append([len(match.group(1)), match.group(2)])
+            paragraph_done = paragraph_done or bool(paragraph)
+        elif not stripped:
+            paragraph_done = paragraph_done or bool(paragraph)
+        elif not paragraph_done and not stripped.startswith(("|", "<!--", "---")):
+            paragraph.append(stripped)
+    summary = " ".join(paragraph)
+    if len(summary) > SUMMARY_CHARS:
+        summary = summary[:SUMMARY_CHARS].rsplit(" ", 1)[0] + " …"
+    return {"headings": headings, "summary": summary}
+
+
+def _read_digests(project_path):
+    try:
+        with open(os.path.join(project_path, DIGEST_FILE), 'r') as f:
+            digests = json.load(f)
+    except (OSError, ValueError):
+        return {"version": DIGEST_VERSION, "files": {}}
+    if digests.get("version") != DIGEST_VERSION:
+        return {"version": DIGEST_VERSION, "files": {}}
+    return digests
+
+
+@timings.traced()
+def file_digests(project_path, paths):
+    """Digests {path: {size, mtime_ns, sha256, headings, summary}} of the Markdown files that exist
+    
+    Files whose size and mtime match the cache are not read. A touched file
+    whose hash is unchanged keeps its cached outline.
+    """
+    digests = _read_digests(project_path)
+    cached = digests["files"]
+    result = {}
+    updated = {}
+    for path in paths:
+        full_path = os.path.join(project_path, path)
+        try:
+            stat = os.stat(full_path)
+        except OSError:
+            continue
+        entry = cached.get(path)
+        if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            result[path] = entry
+            continue
+        
+        sha256 = file_sha256(full_path)
+        if entry and entry["sha256"] == sha256:
+            entry = dict(entry, mtime_ns=stat.st_mtime_ns)
+        else:
+            with open(full_path, 'r', encoding="utf-8", errors="replace") as f:
+                entry = dict(digest_text(f.read()), sha256=sha256)
+            entry.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+        result[path] = updated[path] = entry
+    
+    if updated:
+        digest_path = os.path.join(project_path, DIGEST_FILE)
+        with locked(digest_path + ".lock"):
+            latest = _read_digests(project_path)
+            latest["files"].update(updated)
+            atomic_write(digest_path, json.dumps(latest, indent=1))
+    return result
+
+
+def phase_artifacts(phase):
+    """Markdown artifacts for a phase's context: prior-phase inputs first, then the phase's own"""
+    paths = list(PHASE_INPUTS.get(phase, []))
+    if phase in (5, 6):
+        paths.append("4-Development/component-breakdown.md")
+    paths.extend(PHASE_REQUIREMENTS.get(phase, []))
+    artifacts = []
+    for path in paths:
+        if path.endswith(".md") and path not in artifacts:
+            artifacts.append(path)
+    return artifacts
+
+
+def render_outline(digest):
+    """Markdown outline of a file digest"""
+    lines = []
+    if digest["summary"]:
+        lines.append(f"> {digest['summary']}")
+        lines.append("")
+    for level, title in digest["headings"]:
+        lines.append(f"{'  ' * (level - 1)}- {title}")
+    return "\n".join(lines)
+
+
+def _status_section(state, phase):
+    project = state.get("project", {})
+    lines = [f"# Context Pack: {project.get('name') or 'AI-SDLC project'}", "",
+             "## Current State",
+             f"- **Phase:** {phase_label(phase)}",
+             f"- **Progress:** {state.get('progress', '')}",
+             f"- **Last Task:** {state.get('last_task', '')}",
+             f"- **AI Rules:** .amazonq/rules/{PHASE_RULES.get(phase, PHASE_RULES[1])}"]
+    if project.get("tech_stack"):
+        lines.append(f"- **Tech Stack:** {', '.join(project['tech_stack'])}")
+    if state.get("next_actions"):
+        lines.extend(["", "### Next Actions"] + [f"- {action}" for action in state["next_actions"]])
+    return "\n".join(lines)
+
+
+def _sessions_section(sessions):
+    if not sessions:
+        return ""
+    lines = ["## Recent Sessions"]
+    for session in sessions:
+        lines.append(f"- {session.get('paused_at', '')}: {session.get('last_commit', '')}")
+    return "\n".join(lines)
+
+
+def _components_section(project_path, state, phase):
+    if not 4 <= phase <= 6:
+        return ""
+    records = component_records(project_path)
+    if not records:
+        return ""
+    labels = {name: component_label(record) or "not started" for name, record in records.items()}
+    tests = test_statuses(project_path, [name for name, record in records.items() if record["testing"]])
+    lines = ["## Components"]
+    for name in sorted(labels):
+        note = f" (tests: {tests[name]})" if name in tests else ""
+        lines.append(f"- {name}: {labels[name]}{note}")
+    schedule = state.get("schedule") or {}
+    if schedule.get("blocked"):
+        lines.append("")
+        for name, dependencies in sorted(schedule["blocked"].items()):
+            lines.append(f"- ⛔ {name} waits on {', '.join(dependencies)}")
+    return "\n".join(lines)
+
+
+@timings.traced()
+def build_context_pack(project_path=".", budget=DEFAULT_BUDGET, unit="tokens", phase=None,
+                       recent_sessions=RECENT_SESSIONS):
+    """Build the context pack of a project within `budget` tokens (or bytes)
+    
+    Returns {"text", "used", "budget", "unit", "artifacts": [{path, mode, size}]}
+    where mode is full, outline or omitted.
+    """
+    result = {"project": project_path, "ok": False, "error": None, "phase": None, "budget": budget,
+              "unit": unit, "used": 0, "artifacts": [], "text": ""}
+    state = load_state(project_path)
+    if state is None:
+        result["error"] = "No SESSION-STATUS.md found"
+        return result
+    phase = phase or state.get("phase") or 1
+    result["phase"] = phase
+    
+    with timings.span("fixed_sections"):
+        sections = [_status_section(state, phase),
+                    _sessions_section(tail_entries(project_path, recent_sessions)),
+                    _components_section(project_path, state, phase)]
+        text = "\n\n".join(section for section in sections if section) + "\n"
+    used = measure(text, unit)
+    
+    paths = phase_artifacts(phase)
+    digests = file_digests(project_path, paths)
+    artifacts = []
+    for path in paths:
+        if path not in digests:
+            continue
+        outline = f"\n### {path} (outline)\n\n{render_outline(digests[path])}\n"
+        artifacts.append({"path": path, "mode": "omitted", "outline": outline,
+                          "size": measure(outline, unit),
+                          # Full text size is estimated from the cached byte count, so no file is read yet
+                          "full_size": measure(f"\n### {path}\n\n\n", unit) + (
+                              digests[path]["size"] if unit == "bytes"
+                              else -(-digests[path]["size"] // BYTES_PER_TOKEN))})
+    
+    # Every artifact starts as an "omitted" line; outlines replace those lines
+    # first, then outlines are upgraded to full text in priority order
+    if artifacts:
+        used += measure("\n## Artifacts\n" + "\n## Omitted (over budget)\n\n", unit)
+        for artifact in artifacts:
+            artifact["line"] = measure(f"- {artifact['path']}\n", unit)
+            used += artifact["line"]
+    for artifact in artifacts:
+        if used - artifact["line"] + artifact["size"] <= budget:
+            artifact["mode"] = "outline"
+            used += artifact["size"] - artifact["line"]
+    for artifact in artifacts:
+        if artifact["mode"] == "outline" and used - artifact["size"] + artifact["full_size"] <= budget:
+            with open(os.path.join(project_path, artifact["path"]), 'r', encoding="utf-8", errors="replace") as f:
+                content = f.read()
+            full = f"\n### {artifact['path']}\n\n{content.strip()}\n"
+            if used - artifact["size"] + measure(full, unit) <= budget:
+                used += measure(full, unit) - artifact["size"]
+                artifact.update(mode="full", outline=full, size=measure(full, unit))
+    
+    parts = [text]
+    included = [artifact["outline"] for artifact in artifacts if artifact["mode"] != "omitted"]
+    if included:
+        parts.append("\n## Artifacts\n")
+        parts.extend(included)
+    omitted = [artifact for artifact in artifacts if artifact["mode"] == "omitted"]
+    if omitted:
+        parts.append("\n## Omitted (over budget)\n\n")
+        parts.append("".join(f"- {artifact['path']}\n" for artifact in omitted))
+    result["text"] = "".join(parts)
+    result.update(ok=True, used=measure(result["text"], unit),
+                  artifacts=[{"path": artifact["path"], "mode": artifact["mode"], "size": artifact["size"]}
+                             for artifact in artifacts])
+    return result
+
+
+def print_context_summary(pack, output=None):
+    """Print where the context pack went and what it contains"""
+    modes = [artifact["mode"] for artifact in pack["artifacts"]]
+    target = output or "stdout"
+    print(f"📦 Context pack for {phase_label(pack['phase'])} written to {target}: "
+          f"{pack['used']}/{pack['budget']} {pack['unit']}")
+    print(f"📄 Artifacts: {modes.count('full')} full, {modes.count('outline')} outline, "
+          f"{modes.count('omitted')} omitted")
+    if pack["used"] > pack["budget"]:
+        print(f"⚠️  Project status alone exceeds the budget of {pack['budget']} {pack['unit']}")
@@ -0,0 +1,287 @@
+"""
+Deploy - Incremental promotion of components into 6-Deployment/deployed-components
+
+Each deployment is a release snapshot of 4-Development/components/<name>/src
+in deployed-components/.releases/<name>/<release>/, described by a manifest of
+content hashes. Files unchanged since the current release are hardlinked from
+it, so only changed files are copied. deployed-components/<name> is a symlink
+to the current release that is swapped atomically. The previous release is
+kept as the rollback target.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from datetime import datetime
+
+from ai_sdlc import timings
+from ai_sdlc.component_index import CACHE_DIR, COMPONENT_ROOTS
+from ai_sdlc.fsutil import atomic_write, locked
+
+RELEASES_DIR = ".releases"
+POINTER_FILE = "releases.json"
+KEEP_RELEASES = 3
+
+# Files that are never deployed
+SKIPPED_NAMES = {"__pycache__", ".DS_Store", ".pytest_cache"}
+
+
+def deployed_path(project_path, name):
+    return os.path.join(project_path, COMPONENT_ROOTS["deployed"], name)
+
+
+def releases_path(project_path, name):
+    return os.path.join(project_path, COMPONENT_ROOTS["deployed"], RELEASES_DIR, name)
+
+
+def _lock_path(project_path, name):
+    """Per-component deploy lock, kept in the git-ignored cache rather than the deployed tree"""
+    return os.path.join(project_path, CACHE_DIR, f"deploy-{name}.lock")
+
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def build_manifest(source, previous=None):
+    """Manifest {relpath: [size, mtime_ns, sha256]} of a folder
+    
+    Files whose size and mtime match the previous manifest keep their hash
+    without being read.
+    """
+    previous = previous or {}
+    manifest = {}
+    for dirpath, dirnames, filenames in os.walk(source):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIPPED_NAMES)
+        for filename in sorted(filenames):
+            if filename in SKIPPED_NAMES:
+                continue
+            path = os.path.join(dirpath, filename)
+            relpath = os.path.relpath(path, source).replace(os.sep, "/")
+            stat = os.stat(path)
+            cached = previous.get(relpath)
+            if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+                manifest[relpath] = cached
+            else:
+                manifest[relpath] = [stat.st_size, stat.st_mtime_ns, _file_digest(path)]
+    return manifest
+
+
+def diff_manifests(old, new):
+    """Split new's files into added, changed and unchanged relative to old, plus removed files"""
+    added = sorted(path for path in new if path not in old)
+    changed = sorted(path for path in new if path in old and old[path][2] != new[path][2])
+    unchanged = sorted(path for path in new if path in old and old[path][2] == new[path][2])
+    removed = sorted(path for path in old if path not in new)
+    return {"added": added, "changed": changed, "unchanged": unchanged, "removed": removed}
+
+
+def read_pointer(project_path, name):
+    """Release pointer {current, previous, releases} of a deployed component"""
+    try:
+        with open(os.path.join(releases_path(project_path, name), POINTER_FILE), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"current": None, "previous": None, "releases": []}
+
+
+def _read_manifest(project_path, name, release):
+    if not release:
+        return {}
+    try:
+        with open(os.path.join(releases_path(project_path, name), f"{release}.json"), 'r') as f:
+            return json.load(f)["files"]
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+def _place_file(source, target, link_from=None):
+    """Hardlink target from the previous release when possible, else copy from the source"""
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    if link_from is not None:
+        try:
+            os.link(link_from, target)
+            return True
+        except OSError:
+            pass
+    shutil.copy2(source, target)
+    return False
+
+
+def _swap_link(project_path, name, release):
+    """Point deployed-components/<name> at a release with a single atomic rename"""
+    link = deployed_path(project_path, name)
+    target = os.path.join(RELEASES_DIR, name, release)
+    tmp_link = f"{link}.{os.getpid()}.tmp"
+    os.symlink(target, tmp_link, target_is_directory=True)
+    os.replace(tmp_link, link)
+
+
+def _swap_directory(project_path, name, release):
+    """Fallback where symlinks are unavailable: hardlinked copy and a two-rename swap"""
+    deployed = deployed_path(project_path, name)
+    staging = f"{deployed}.{os.getpid()}.new"
+    old = f"{deployed}.{os.getpid()}.old"
+    shutil.copytree(os.path.join(releases_path(project_path, name), release), staging, copy_function=os.link)
+    if os.path.lexists(deployed):
+        os.rename(deployed, old)
+    os.rename(staging, deployed)
+    shutil.rmtree(old, ignore_errors=True)
+
+
+def _activate(project_path, name, release):
+    try:
+        _swap_link(project_path, name, release)
+    except (OSError, NotImplementedError):
+        _swap_directory(project_path, name, release)
+
+
+def _adopt_manual_deployment(project_path, name, pointer):
+    """Move a manually copied deployed-components/<name> folder into the releases as a first release"""
+    deployed = deployed_path(project_path, name)
+    if os.path.islink(deployed) or not os.path.isdir(deployed) or pointer["current"]:
+        return pointer
+    release = "manual-" + datetime.fromtimestamp(os.stat(deployed).st_mtime).strftime("%Y%m%d-%H%M%S")
+    target = os.path.join(releases_path(project_path, name), release)
+    os.rename(deployed, target)
+    _write_release(project_path, name, release, build_manifest(target))
+    _activate(project_path, name, release)
+    pointer = {"current": release, "previous": None, "releases": [release]}
+    _write_pointer(project_path, name, pointer)
+    return pointer
+
+
+def _write_release(project_path, name, release, manifest):
+    atomic_write(os.path.join(releases_path(project_path, name), f"{release}.json"),
+                 json.dumps({"release": release, "files": manifest}, indent=1))
+
+
+def _write_pointer(project_path, name, pointer):
+    atomic_write(os.path.join(releases_path(project_path, name), POINTER_FILE), json.dumps(pointer, indent=2))
+
+
+def _prune(project_path, name, pointer, keep):
+    """Drop the oldest releases beyond `keep`, never the current or previous one"""
+    protected = {pointer["current"], pointer["previous"]}
+    while len(pointer["releases"]) > keep:
+        candidates = [release for release in pointer["releases"] if release not in protected]
+        if not candidates:
+            break
+        release = candidates[0]
+        shutil.rmtree(os.path.join(releases_path(project_path, name), release), ignore_errors=True)
+        try:
+            os.remove(os.path.join(releases_path(project_path, name), f"{release}.json"))
+        except OSError:
+            pass
+        pointer["releases"].remove(release)
+
+
+@timings.traced()
+def deploy_component(project_path, name, keep=KEEP_RELEASES):
+    """Deploy one component's src/ as a new release, copying only changed files"""
+    result = {"component": name, "ok": False, "error": None, "release": None, "previous": None,
+              "added": 0, "changed": 0, "removed": 0, "linked": 0, "up_to_date": False, "seconds": 0.0}
+    started = time.perf_counter()
+    source = os.path.join(project_path, COMPONENT_ROOTS["development"], name, "src")
+    if not os.path.isdir(source):
+        result["error"] = f"{os.path.relpath(source, project_path)} not found"
+        return result
+    
+    os.makedirs(releases_path(project_path, name), exist_ok=True)
+    with locked(_lock_path(project_path, name)):
+        pointer = _adopt_manual_deployment(project_path, name, read_pointer(project_path, name))
+        current = pointer["current"]
+        old_manifest = _read_manifest(project_path, name, current)
+        
+        with timings.span("build_manifest", files=len(old_manifest)):
+            manifest = build_manifest(source, old_manifest)
+        diff = diff_manifests(old_manifest, manifest)
+        result.update(previous=current, added=len(diff["added"]), changed=len(diff["changed"]),
+                      removed=len(diff["removed"]))
+        
+        if current and not (diff["added"] or diff["changed"] or diff["removed"]):
+            result.update(ok=True, release=current, up_to_date=True,
+                          seconds=round(time.perf_counter() - started, 3))
+            return result
+        
+        digest = hashlib.sha256(json.dumps([[path, entry[2]] for path, entry in sorted(manifest.items())])
+                                .encode("utf-8")).hexdigest()
+        release = f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{digest[:8]}"
+        target = os.path.join(releases_path(project_path, name), release)
+        staging = f"{target}.{os.getpid()}.tmp"
+        current_dir = os.path.join(releases_path(project_path, name), current) if current else None
+        unchanged = set(diff["unchanged"])
+        
+        try:
+            with timings.span("stage_release", copied=len(diff["added"]) + len(diff["changed"])):
+                os.makedirs(staging)
+                for path in manifest:
+                    link_from = None
+                    if current_dir and path in unchanged:
+                        link_from = os.path.join(current_dir, *path.split("/"))
+                    if _place_file(os.path.join(source, *path.split("/")), os.path.join(staging, *path.split("/")),
+                                   link_from):
+                        result["linked"] += 1
+            os.rename(staging, target)
+        except OSError as e:
+            shutil.rmtree(staging, ignore_errors=True)
+            result["error"] = f"Could not stage release: {e}"
+            return result
+        
+        _write_release(project_path, name, release, manifest)
+        _activate(project_path, name, release)
+        
+        pointer = {"current": release, "previous": current,
+                   "releases": [item for item in pointer["releases"] if item != release] + [release]}
+        _prune(project_path, name, pointer, keep)
+        _write_pointer(project_path, name, pointer)
+    
+    result.update(ok=True, release=release, seconds=round(time.perf_counter() - started, 3))
+    return result
+
+
+@timings.traced()
+def rollback_component(project_path, name):
+    """Point a deployed component back at its previous release"""
+    result = {"component": name, "ok": False, "error": None, "release": None, "previous": None}
+    if not os.path.isdir(releases_path(project_path, name)):
+        result["error"] = "not deployed"
+        return result
+    
+    with locked(_lock_path(project_path, name)):
+        pointer = read_pointer(project_path, name)
+        previous = pointer["previous"]
+        if not previous or not os.path.isdir(os.path.join(releases_path(project_path, name), previous)):
+            result["error"] = "no previous release to roll back to"
+            return result
+        
+        _activate(project_path, name, previous)
+        pointer.update(current=previous, previous=pointer["current"])
+        _write_pointer(project_path, name, pointer)
+    
+    result.update(ok=True, release=previous, previous=pointer["previous"])
+    return result
+
+
+def print_deploy_results(results):
+    """Print one line per deployed, skipped or rolled back component"""
+    for result in results:
+        name = result["component"]
+        if result.get("skipped"):
+            print(f"⏭️  {name}: skipped, {result['error']}")
+        elif result["error"]:
+            print(f"❌ {name}: {result['error']}")
+        elif "up_to_date" not in result:
+            print(f"⏪ {name}: rolled back to {result['release']} (from {result['previous']})")
+        elif result["up_to_date"]:
+            print(f"✅ {name}: already deployed ({result['release']})")
+        else:
+            print(f"🚀 {name}: deployed {result['release']} in {result['seconds']:.2f}s "
+                  f"(+{result['added']} ~{result['changed']} -{result['removed']}, "
+                  f"{result['linked']} unchanged file(s) linked)")
@@ -0,0 +1,60 @@
+"""
+Filesystem Helpers - Atomic writes and advisory file locks
+"""
+
+import hashlib
+import os
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: locks degrade to no-ops
+    fcntl = None
+
+
+def ai_sdlc_home():
+    """Per-user framework folder shared by all projects (override with AI_SDLC_HOME)"""
+    return os.environ.get("AI_SDLC_HOME") or os.path.join(os.path.expanduser("~"), ".ai-sdlc")
+
+
+def atomic_write(path, text):
+    """Write a file via temp-file + rename so readers never see a partial file"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def file_sha256(path, chunk_size=1024 * 1024):
+    """SHA-256 of a file, read in fixed-size chunks so memory use stays constant"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def lock_file(f, blocking=True):
+    """Take an exclusive advisory lock on an open file, released when it is closed
+    
+    Returns False if blocking is False and another process holds the lock.
+    """
+    if fcntl is None:
+        return True
+    try:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+    except BlockingIOError:
+        return False
+    return True
+
+
+@contextmanager
+def locked(lock_path):
+    """Hold an exclusive lock on lock_path for the duration of the block"""
+    os.makedirs(os.path.dirname(lock_path) or ".", exist_ok=True)
+    with open(lock_path, "a") as f:
+        lock_file(f)
+        yield
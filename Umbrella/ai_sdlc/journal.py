@@ -0,0 +1,169 @@
+"""
+Session Journal - Append-only, rotating history of paused sessions
+
+Each pause appends one JSON line to .ai-sdlc/journal/sessions.jsonl. When
+the active segment grows past SEGMENT_BYTES it is rotated to a numbered
+segment. Once more than MAX_SEGMENTS segments exist, the oldest are compacted
+into sessions-archive.jsonl.gz. The latest entries are read backwards from the
+end of the newest segments, so reading them costs the same however long the
+project has been running.
+"""
+
+import gzip
+import json
+import os
+import re
+from collections import deque
+
+from ai_sdlc import timings
+from ai_sdlc.component_index import CACHE_DIR
+from ai_sdlc.fsutil import locked
+
+JOURNAL_DIR = os.path.join(".ai-sdlc", "journal")
+JOURNAL_FILE = os.path.join(JOURNAL_DIR, "sessions.jsonl")
+ARCHIVE_FILE = os.path.join(JOURNAL_DIR, "sessions-archive.jsonl.gz")
+LOCK_FILE = os.path.join(CACHE_DIR, "journal.lock")
+
+SEGMENT_BYTES = 64 * 1024
+MAX_SEGMENTS = 8
+READ_BLOCK = 8192
+
+_SEGMENT_PATTERN = re.compile(r"^sessions-(\d+)\.jsonl$")
+
+
+def _segments(project_path):
+    """Rotated segments as [(number, path)], oldest first"""
+    folder = os.path.join(project_path, JOURNAL_DIR)
+    try:
+        names = os.listdir(folder)
+    except FileNotFoundError:
+        return []
+    segments = []
+    for name in names:
+        match = _SEGMENT_PATTERN.match(name)
+        if match:
+            segments.append((int(match.group(1)), os.path.join(folder, name)))
+    return sorted(segments)
+
+
+def _rotate(project_path):
+    """Move the active segment aside and compact the oldest segments into the archive"""
+    active = os.path.join(project_path, JOURNAL_FILE)
+    segments = _segments(project_path)
+    number = segments[-1][0] + 1 if segments else 1
+    os.replace(active, os.path.join(project_path, JOURNAL_DIR, f"sessions-{number:06d}.jsonl"))
+    
+    segments = _segments(project_path)
+    if len(segments) > MAX_SEGMENTS:
+        # Concatenated gzip members form one valid stream, so compaction only appends
+        with gzip.open(os.path.join(project_path, ARCHIVE_FILE), "ab") as archive:
+            for _, path in segments[:-MAX_SEGMENTS]:
+                with open(path, "rb") as f:
+                    archive.write(f.read())
+        for _, path in segments[:-MAX_SEGMENTS]:
+            os.remove(path)
+
+
+@timings.traced()
+def append_entries(project_path, entries):
+    """Append session entries to the journal, rotating it when the active segment is full"""
+    if not entries:
+        return
+    data = "".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries).encode("utf-8")
+    active = os.path.join(project_path, JOURNAL_FILE)
+    os.makedirs(os.path.dirname(active), exist_ok=True)
+    with locked(os.path.join(project_path, LOCK_FILE)):
+        with open(active, "ab") as f:
+            f.write(data)
+            size = f.tell()
+        if size > SEGMENT_BYTES:
+            _rotate(project_path)
+
+
+def append_entry(project_path, entry):
+    append_entries(project_path, [entry])
+
+
+def _tail_lines(path, count):
+    """Last `count` non-empty lines of a file, read backwards in blocks"""
+    lines = []
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return lines
+    with f:
+        position = f.seek(0, os.SEEK_END)
+        remainder = b""
+        while position > 0 and len(lines) < count:
+            step = min(READ_BLOCK, position)
+            position -= step
+            f.seek(position)
+            block = f.read(step) + remainder
+            parts = block.split(b"\n")
+            remainder = parts.pop(0)  # May continue in the previous block
+            lines[:0] = [part for part in parts if part.strip()]
+        if position == 0 and remainder.strip():
+            lines.insert(0, remainder)
+    return lines[-count:]
+
+
+def _parse(lines):
+    entries = []
+    for line in lines:
+        try:
+            entries.append(json.loads(line))
+        except ValueError:
+            continue  # A torn write is skipped, not fatal
+    return entries
+
+
+@timings.traced()
+def tail_entries(project_path, count=5):
+    """The last `count` journal entries, oldest first"""
+    if count <= 0:
+        return []
+    lines = _tail_lines(os.path.join(project_path, JOURNAL_FILE), count)
+    for _, path in reversed(_segments(project_path)):
+        if len(lines) >= count:
+            break
+        lines[:0] = _tail_lines(path, count - len(lines))
+    if len(lines) < count:
+        try:
+            # Streamed line by line, keeping only the lines still needed
+            with gzip.open(os.path.join(project_path, ARCHIVE_FILE), "rb") as archive:
+                archived = deque((line.rstrip(b"\n") for line in archive if line.strip()),
+                                 maxlen=count - len(lines))
+            lines[:0] = archived
+        except FileNotFoundError:
+            pass
+    return _parse(lines[-count:])
+
+
+def read_all_entries(project_path):
+    """Every journal entry, oldest first (archive, segments, active segment)"""
+    lines = []
+    try:
+        with gzip.open(os.path.join(project_path, ARCHIVE_FILE), "rb") as archive:
+            lines.extend(archive.read().split(b"\n"))
+    except FileNotFoundError:
+        pass
+    for _, path in _segments(project_path) + [(None, os.path.join(project_path, JOURNAL_FILE))]:
+        try:
+            with open(path, "rb") as f:
+                lines.extend(f.read().split(b"\n"))
+        except FileNotFoundError:
+            continue
+    return _parse(line for line in lines if line.strip())
+
+
+def migrate_sessions(project_path, state):
+    """Move pause history kept in the state (older projects) into the journal
+    
+    Returns True when the state changed and needs saving.
+    """
+    sessions = state.pop("sessions", None)
+    if not sessions:
+        return sessions is not None
+    append_entries(project_path, [dict(session, event="pause") for session in sessions])
+    state["last_session"] = sessions[-1]
+    return True
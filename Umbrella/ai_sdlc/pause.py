@@ -0,0 +1,166 @@
+"""
+Pause - Save current work: commit changes, queue the push and record the session
+"""
+
+import os
+import subprocess
+from datetime import datetime
+
+from ai_sdlc import timings
+from ai_sdlc.artifact_store import offload_artifacts
+from ai_sdlc.change_journal import claim_changes, record_changes, stage_changes
+from ai_sdlc.journal import append_entry, migrate_sessions
+from ai_sdlc.push_queue import request_push
+from ai_sdlc.repo_stats import format_bytes
+from ai_sdlc.session_state import load_state, phase_label, save_state
+from ai_sdlc.watcher import EVERYTHING
+
+GIT_NOT_FOUND = "Git not found. Please install Git first."
+
+
+@timings.traced()
+def pause_session(project_path=".", commit_message=None):
+    """Commit current work and record the pause, returning a result record (no output)"""
+    result = {
+        "project": project_path,
+        "ok": False,
+        "error": None,
+        "committed": False,
+        "commit_message": None,
+        "changes": [],
+        "journaled": None,
+        "offload": None,
+        "push": None,
+        "paused_at": None
+    }
+    
+    # Check if this is an AI-SDLC project
+    state = load_state(project_path)
+    if state is None:
+        result["error"] = "No SESSION-STATUS.md found. Not an AI-SDLC project."
+        return result
+    
+    # Check if Git repository exists
+    if not os.path.exists(os.path.join(project_path, ".git")):
+        result["error"] = "No Git repository found. Run 1-start-project.py first."
+        return result
+    
+    # Paths journaled by a running change watcher (None means full scan)
+    journaled = None
+    
+    try:
+        journaled = claim_changes(project_path)
+        
+        # Large design/deployment files go to the artifact store; git gets pointers.
+        # With a journal, only the journaled paths are looked at
+        changed = journaled if journaled is not None and EVERYTHING not in journaled else None
+        result["offload"] = offload_artifacts(project_path, changed=changed)
+        
+        if journaled is not None:
+            # Stage exactly what the watcher saw change, no working tree scan
+            result["journaled"] = len(journaled)
+            stage_changes(project_path, journaled | set(result["offload"]["paths"]))
+            
+            staged = timings.run(["git", "diff", "--cached", "--name-status"],
+                                 cwd=project_path, capture_output=True, text=True, check=True)
+            result["changes"] = staged.stdout.splitlines()
+        else:
+            # Check Git status
+            status = timings.run(["git", "status", "--porcelain"],
+                                 cwd=project_path, capture_output=True, text=True, check=True)
+            result["changes"] = status.stdout.splitlines()
+            
+            # Add all changes
+            if result["changes"]:
+                timings.run(["git", "add", "."], cwd=project_path, check=True)
+        
+        if not result["changes"]:
+            result["ok"] = True
+            return result
+        
+        # Create commit message
+        if not commit_message:
+            # Read current phase from the project state
+            current_phase = "Unknown Phase"
+            if state.get("phase"):
+                current_phase = phase_label(state["phase"])
+            
+            commit_message = f"Pause work: {current_phase} - {datetime.now().strftime('%Y-%m-%d %H:%M')}"
+        
+        # Commit changes
+        timings.run(["git", "commit", "-q", "-m", commit_message], cwd=project_path, check=True)
+        result["committed"] = True
+        result["commit_message"] = commit_message
+        
+        # Queue the push for the background worker (if a remote is configured)
+        result["push"] = request_push(project_path)
+        
+        # Journal the pause; SESSION-STATUS.md only shows the latest one
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+        session = {"paused_at": timestamp, "last_commit": commit_message}
+        migrate_sessions(project_path, state)
+        append_entry(project_path, dict(session, event="pause", phase=state.get("phase"),
+                                        changes=len(result["changes"])))
+        state["last_session"] = session
+        save_state(project_path, state)
+        result["paused_at"] = timestamp
+        
+        result["ok"] = True
+        return result
+    
+    except subprocess.CalledProcessError as e:
+        if journaled:
+            record_changes(project_path, journaled)  # Keep them for the next pause
+        result["error"] = f"Git operation failed: {e}"
+        return result
+    except FileNotFoundError:
+        result["error"] = GIT_NOT_FOUND
+        return result
+
+
+@timings.traced()
+def pause_project(project_path=".", commit_message=None):
+    """Pause project and commit changes to Git"""
+    result = pause_session(project_path, commit_message)
+    
+    if result["journaled"] is not None:
+        print(f"👀 Change watcher reported {result['journaled']} changed path(s)")
+    
+    if result["error"]:
+        print(f"❌ {result['error']}")
+        if result["error"] == GIT_NOT_FOUND:
+            print("   Install from: https://git-scm.com/downloads")
+        return False
+    
+    offload = result["offload"]
+    if offload and offload["offloaded"]:
+        print(f"📦 {len(offload['offloaded'])} large file(s) ({format_bytes(offload['bytes'])}) moved to the "
+              f"artifact store; git keeps pointers in .ai-sdlc/artifacts/")
+    
+    if not result["committed"]:
+        print("✅ No changes to commit. Project already up to date.")
+        return True
+    
+    # Show what was committed
+    print("📋 Changes to be committed:")
+    for line in result["changes"]:
+        print(line)
+    print(f"✅ Changes committed locally: {result['commit_message']}")
+    
+    push = result["push"]
+    if push["status"] == "queued":
+        print(f"📤 Push to '{push['remote']}' queued; it continues in the background")
+        print("   Check progress: python ../Umbrella/4-pause-project.py --push-status")
+    elif push["status"] == "no_remote":
+        print("📡 No remote repository configured")
+        print("   To add remote: git remote add origin <repository-url>")
+        print("   Then push: git push -u origin main")
+    else:
+        print("⚠️  Could not queue push to remote")
+        print("   Changes are saved locally. Push manually when ready:")
+        print("   git push")
+    
+    print(f"\n⏸️  Project paused successfully at {result['paused_at']}")
+    print("📝 SESSION-STATUS.md updated and pause recorded in the session journal")
+    
+    return True
@@ -0,0 +1,274 @@
+"""
+Project - Project initialization and phase tracking (AISDLCManager)
+"""
+
+import os
+import subprocess
+from dataclasses import dataclass
+from typing import List, Dict
+from datetime import datetime
+
+from ai_sdlc import timings
+from ai_sdlc.rule_store import (active_rule_files, ingest_rules, install_rules, register_project,
+                                registered_projects, sync_rules)
+from ai_sdlc.scaffold import scaffold_components, scaffold_project
+from ai_sdlc.session_state import load_state, new_state, save_state
+from ai_sdlc.state_db import enter_phase, record_transition, recorded_artifacts
+from ai_sdlc.workspace import discover_projects
+
+# Folder holding the numbered scripts and the framework's rule files
+UMBRELLA_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@dataclass
+class ProjectConfig:
+    name: str
+    description: str
+    tech_stack: List[str]
+    ai_tools: Dict[str, str]
+
+
+class AISDLCManager:
+    PHASES = [
+        "planning", "requirements", "design", 
+        "development", "testing", "deployment", "maintenance"
+    ]
+    
+    PHASE_FOLDERS = {
+        "planning": "1-Planning",
+        "requirements": "2-Requirements", 
+        "design": "3-Design",
+        "development": "4-Development",
+        "testing": "5-Testing",
+        "deployment": "6-Deployment",
+        "maintenance": "7-Maintenance"
+    }
+    
+    def __init__(self, config: ProjectConfig, project_root: str = "."):
+        self.config = config
+        self.project_root = project_root
+        self.current_phase = 0
+        self.artifacts = {}
+        self._ensure_folder_structure()
+        self._load_state()
+    
+    def _load_state(self):
+        """Reload the phase from state.json and the recorded artifacts from .ai-sdlc/state.db
+        
+        state.json is authoritative; the database's open phase entry is
+        brought in line with it, whoever changed the phase.
+        """
+        state = load_state(self.project_root)
+        phase = state.get("phase") if state else None
+        if phase:
+            self.current_phase = min(phase, len(self.PHASES)) - 1
+            enter_phase(self.project_root, self.current_phase + 1, self.PHASES[self.current_phase])
+            self.artifacts = recorded_artifacts(self.project_root)
+    
+    @timings.traced()
+    def _ensure_folder_structure(self):
+        """Create required folder structure from the layout spec"""
+        scaffold_project(self.project_root)
+    
+    @timings.traced()
+    def start_project(self) -> Dict:
+        """Initialize AI-driven project"""
+        self._create_session_status()
+        enter_phase(self.project_root, self.current_phase + 1, self.PHASES[self.current_phase])
+        git_status = self._init_git_repo()
+        ai_rules_status = self._setup_ai_rules()
+        return {
+            "project": self.config.name,
+            "phase": self.PHASES[self.current_phase],
+            "phase_folder": self.PHASE_FOLDERS[self.PHASES[self.current_phase]],
+            "actions": self._get_actions(),
+            "folder_structure_created": True,
+            "git_initialized": git_status,
+            "ai_rules_loaded": ai_rules_status
+        }
+    
+    def advance_phase(self, artifacts: Dict) -> Dict:
+        """Move to next phase
+        
+        artifacts maps names to project-relative files or folders; their paths
+        and hashes are recorded in .ai-sdlc/state.db together with the phase
+        change. Without artifacts the whole phase folder is recorded.
+        """
+        current_phase_name = self.PHASES[self.current_phase]
+        artifacts = artifacts or {self.PHASE_FOLDERS[current_phase_name]: self.PHASE_FOLDERS[current_phase_name]}
+        
+        next_phase = self.current_phase + 1 if self.current_phase < len(self.PHASES) - 1 else None
+        recorded = record_transition(self.project_root, self.current_phase + 1, current_phase_name, artifacts,
+                                     next_phase + 1 if next_phase is not None else None,
+                                     self.PHASES[next_phase] if next_phase is not None else None)
+        self.artifacts[current_phase_name] = artifacts
+        if next_phase is not None:
+            self.current_phase = next_phase
+        
+        self._update_session_status()
+        ai_rules_status = self._setup_ai_rules()
+        
+        return {
+            "phase": self.PHASES[self.current_phase],
+            "phase_folder": self.PHASE_FOLDERS[self.PHASES[self.current_phase]],
+            "actions": self._get_actions(),
+            "artifacts_stored": len(artifacts),
+            "files_recorded": recorded,
+            "ai_rules_loaded": ai_rules_status
+        }
+    
+    def _get_actions(self) -> List[str]:
+        """Get phase-specific AI actions"""
+        actions_map = {
+            "planning": ["Create project charter", "Define timeline", "Map stakeholders"],
+            "requirements": ["Generate user stories", "Create acceptance criteria", "Define security requirements"],
+            "design": ["Create architecture", "Design API specs", "Plan database schema"],
+            "development": ["Generate code", "Implement features", "Create unit tests"],
+            "testing": ["Create test plan", "Generate test cases", "Run automated tests"],
+            "deployment": ["Configure CI/CD", "Deploy application", "Setup monitoring"],
+            "maintenance": ["Monitor performance", "Analyze feedback", "Plan enhancements"]
+        }
+        return actions_map.get(self.PHASES[self.current_phase], [])
+    
+    @timings.traced()
+    def _create_session_status(self):
+        """Create initial session status file"""
+        state = new_state(
+            self.config.name,
+            self.config.description,
+            self.config.tech_stack,
+            self.config.ai_tools,
+            phase=self.current_phase + 1
+        )
+        state["session_date"] = datetime.now().strftime("%Y-%m-%d")
+        state["next_actions"] = self._get_actions()
+        save_state(self.project_root, state)
+    
+    def _update_session_status(self):
+        """Update session status file"""
+        state = load_state(self.project_root)
+        if state is None:
+            state = new_state(self.config.name, self.config.description,
+                              self.config.tech_stack, self.config.ai_tools)
+        
+        state["phase"] = self.current_phase + 1
+        state["progress"] = f"{int((self.current_phase / len(self.PHASES)) * 100)}% complete"
+        state["session_date"] = datetime.now().strftime("%Y-%m-%d")
+        state["next_actions"] = self._get_actions()
+        save_state(self.project_root, state)
+    
+    @timings.traced()
+    def _init_git_repo(self) -> str:
+        """Initialize Git repository"""
+        try:
+            timings.run(["git", "--version"], check=True, capture_output=True)
+            if os.path.exists(os.path.join(self.project_root, ".git")):
+                return "Git repository already exists"
+            timings.run(["git", "init"], cwd=self.project_root, check=True, capture_output=True)
+            gitignore_content = "# AI-SDLC Project\n*.log\n*.tmp\n.DS_Store\nThumbs.db\n\n# AI-SDLC local caches\n.ai-sdlc/cache/\n.ai-sdlc/state.db\n.ai-sdlc/state.db-journal\n"
+            with open(os.path.join(self.project_root, ".gitignore"), "w") as f:
+                f.write(gitignore_content)
+            timings.run(["git", "add", "."], cwd=self.project_root, check=True, capture_output=True)
+            timings.run(["git", "commit", "-m", "Initial AI-SDLC project setup"], cwd=self.project_root, check=True, capture_output=True)
+            return "Git repository initialized successfully"
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            return "Git not found - please install Git first"
+    
+    @timings.traced()
+    def _setup_ai_rules(self) -> str:
+        """Install the current phase's AI rules into the .amazonq folder for Amazon Q access"""
+        try:
+            phase = self.current_phase + 1
+            result = activate_phase_rules(self.project_root, phase)
+            register_project(self.project_root)
+            
+            loaded = len(result["installed"]) + len(result["unchanged"])
+            return (f"AI rules loaded: {loaded}/{len(active_rule_files(phase))} files for Phase {phase} "
+                    f"({result['strategy']}) in .amazonq/rules/")
+        except Exception as e:
+            return f"AI rules setup failed: {str(e)}"
+
+
+@timings.traced()
+def activate_phase_rules(project_path, phase, strategy=None) -> Dict:
+    """Make a phase's rules (plus the cross-cutting ones) the only framework rules in .amazonq/rules/"""
+    # Rules come from the shared content-addressed store, not fresh copies
+    manifest = ingest_rules(UMBRELLA_DIR)
+    return install_rules(project_path, manifest, strategy, phase)
+
+
+def sync_project_rules(roots=None, strategy=None) -> List[Dict]:
+    """Update the AI rules of every registered (or discovered) project"""
+    projects = discover_projects(roots) if roots else registered_projects()
+    return sync_rules(UMBRELLA_DIR, projects, strategy)
+
+
+def create_components(project_path, stages, names=None, dry_run=False) -> bool:
+    """Create component skeletons listed in component-breakdown.md"""
+    stages = stages or ["development"]
+    try:
+        plan = scaffold_components(project_path, stages, names, dry_run=dry_run)
+    except FileNotFoundError as e:
+        print(f"❌ {e.filename} not found - list components there or pass --component NAME")
+        return False
+    except ValueError as e:
+        print(f"❌ {e}")
+        return False
+    
+    if not plan["components"]:
+        print("⚠️  No components found in component-breakdown.md")
+        return False
+    
+    verb = "Would create" if dry_run else "Created"
+    print(f"🧩 Components: {len(plan['components'])} ({', '.join(stages)})")
+    print(f"📁 {verb} {len(plan['create'])} folder(s), {len(plan['existing'])} already present")
+    if dry_run:
+        for path in plan["create"]:
+            print(f"   + {path}")
+    for path in plan["conflicts"]:
+        print(f"   ❌ {path} is blocked by a file")
+    return not plan["conflicts"]
+
+
+def get_project_config() -> ProjectConfig:
+    """Interactive project configuration"""
+    print("🚀 AI-SDLC Project Initialization")
+    print("=" * 40)
+    
+    # Project name
+    while True:
+        name = input("\n📝 Project name: ").strip()
+        if name and name.replace('-', '').replace('_', '').isalnum():
+            break
+        print("❌ Please enter a valid project name (alphanumeric, hyphens, underscores only)")
+    
+    # Project description
+    description = input("📄 Project description: ").strip()
+    if not description:
+        description = f"{name} application"
+    
+    # Tech stack
+    print("\n🛠️  Technology Stack (press Enter when done):")
+    print("Examples: Python, JavaScript, React, Node.js, PostgreSQL, Docker")
+    tech_stack = []
+    while True:
+        tech = input(f"Tech {len(tech_stack) + 1} (or Enter to finish): ").strip()
+        if not tech:
+            break
+        tech_stack.append(tech)
+    
+    if not tech_stack:
+        tech_stack = ["Python"]  # Default
+        print(f"Using default tech stack: {tech_stack}")
+    
+    # AI tools preference
+    print("\n🤖 AI Tools Configuration:")
+    ai_assistant = input("Primary AI assistant (default: amazon-q): ").strip() or "amazon-q"
+    code_review = input("Code review tool (default: automated): ").strip() or "automated"
+    
+    ai_tools = {
+        "assistant": ai_assistant,
+        "code_review": code_review
+    }
+    
+    return ProjectConfig(name, description, tech_stack, ai_tools)
@@ -0,0 +1,262 @@
+"""
+Prompts - Batch rendering of ai-sdlc-prompt-template.md
+
+The template is compiled once into literal text and placeholder slots, per
+phase, and cached by the hash of its content. Each `[bracketed placeholder]`
+gets a key from its section and position ("1.1.1", "3.1.2", ...). A
+placeholder after a bold label also answers to the label's slug, e.g.
+"operating-system" for `**Operating System:** [...]`. A placeholder that
+is a bare name, such as `[component]`, is keyed by that name.
+
+Rendering joins the compiled parts with the values of one data row. No
+parsing happens per prompt, so thousands of prompts render in milliseconds.
+Placeholders without a value keep their bracketed hint and are reported.
+"""
+
+import csv
+import hashlib
+import json
+import os
+import re
+import time
+
+from ai_sdlc import timings
+from ai_sdlc.fsutil import atomic_write
+from ai_sdlc.scaffold import component_slug, parse_component_breakdown
+
+TEMPLATE_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             "ai-sdlc-prompt-template.md")
+OUTPUT_DIR = os.path.join(".ai-sdlc", "prompts")
+COMPONENT_PHASES = (4, 5, 6)
+
+_RULE = re.compile(r"^={10,}\s*$")
+_PHASE_TITLE = re.compile(r"^([1-7])-(.+?)\s*$")
+_SECTION = re.compile(r"^##\s+(\d+\.\d+)\b")
+_PLACEHOLDER = re.compile(r"\[([^\[\]\n]+)\](?!\()")
+_LABEL = re.compile(r"^\s*(?:-\s*)?\*\*([^*]+?):\*\*\s*\[")
+_NAME = re.compile(r"[A-Za-z_][\w-]*")
+
+# Compiled templates by content hash
+_compiled = {}
+
+
+def compile_template(text):
+    """Compile template text into {"sha256", "phases", "slots"}
+    
+    phases maps each phase number to {"title", "parts"}, where parts are
+    literal strings and slot indices in order. slots are {"key", "names",
+    "hint", "phase"}, names being every key the slot can be filled by.
+    """
+    compiled = {"sha256": hashlib.sha256(text.encode("utf-8")).hexdigest(), "phases": {}, "slots": []}
+    lines = text.splitlines(keepends=True)
+    phase = None
+    section = None
+    counts = {}
+    aliases = set()
+    parts = []
+    literal = []
+    index = 0
+    while index < len(lines):
+        line = lines[index]
+        # A phase starts at "=====" / "N-TITLE" / "=====" and runs until the next rule
+        if _RULE.match(line):
+            title = _PHASE_TITLE.match(lines[index + 1]) if index + 1 < len(lines) else None
+            if phase is not None:
+                parts.append("".join(literal).strip("\n") + "\n")
+            literal = []
+            parts = []
+            phase = None
+            if title and index + 2 < len(lines) and _RULE.match(lines[index + 2]):
+                phase = int(title.group(1))
+                section = f"{phase}.0"
+                compiled["phases"][phase] = {"title": title.group(2).title(), "parts": parts}
+            index += 3 if title else 1
+            continue
+        index += 1
+        if phase is None:
+            continue
+        
+        heading = _SECTION.match(line)
+        if heading:
+            section = heading.group(1)
+        position = 0
+        for match in _PLACEHOLDER.finditer(line):
+            hint = match.group(1)
+            counts[section] = counts.get(section, 0) + 1
+            key = f"{section}.{counts[section]}"
+            names = [key]
+            label = _LABEL.match(line) if match.start() == line.index("[") else None
+            if _NAME.fullmatch(hint):
+                names.insert(0, component_slug(hint))
+            elif label and component_slug(label.group(1)) not in aliases:
+                aliases.add(component_slug(label.group(1)))
+                names.append(component_slug(label.group(1)))
+            literal.append(line[position:match.start()])
+            parts.append("".join(literal))
+            parts.append(len(compiled["slots"]))
+            literal = []
+            position = match.end()
+            compiled["slots"].append({"key": names[0], "names": names, "hint": hint, "phase": phase})
+        literal.append(line[position:])
+    if phase is not None:
+        parts.append("".join(literal).strip("\n") + "\n")
+    
+    # Merge adjacent literals so rendering joins as few pieces as possible
+    for entry in compiled["phases"].values():
+        merged = []
+        for part in entry["parts"]:
+            if isinstance(part, str) and merged and isinstance(merged[-1], str):
+                merged[-1] += part
+            elif part != "":
+                merged.append(part)
+        if merged and isinstance(merged[0], str):
+            merged[0] = merged[0].lstrip("\n")
+        entry["parts"] = merged
+    return compiled
+
+
+def load_template(path=None):
+    """Compiled template at path (default: ai-sdlc-prompt-template.md), compiling each content hash once"""
+    with open(path or TEMPLATE_FILE, "rb") as f:
+        data = f.read()
+    sha256 = hashlib.sha256(data).hexdigest()
+    if sha256 not in _compiled:
+        with timings.span("compile_template"):
+            _compiled[sha256] = compile_template(data.decode("utf-8"))
+    return _compiled[sha256]
+
+
+def normalize_values(row):
+    """Row values keyed by slug, as text; empty values count as missing"""
+    values = {}
+    for key, value in row.items():
+        if isinstance(value, (list, tuple)):
+            value = ", ".join(str(item) for item in value)
+        if value is None or str(value).strip() == "":
+            continue
+        values[component_slug(str(key))] = str(value)
+    return values
+
+
+def render(compiled, phase, values):
+    """Render one phase for normalized values, returning (text, keys of unfilled slots)"""
+    slots = compiled["slots"]
+    pieces = []
+    unfilled = []
+    for part in compiled["phases"][phase]["parts"]:
+        if isinstance(part, str):
+            pieces.append(part)
+            continue
+        slot = slots[part]
+        for name in slot["names"]:
+            if name in values:
+                pieces.append(values[name])
+                break
+        else:
+            pieces.append(f"[{slot['hint']}]")
+            unfilled.append(slot["key"])
+    return "".join(pieces), unfilled
+
+
+def component_rows(project_path="."):
+    """One data row per component in 4-Development/component-breakdown.md"""
+    path = os.path.join(project_path, "4-Development", "component-breakdown.md")
+    if not os.path.exists(path):
+        return []
+    return [{"component": component["title"], "name": component["name"],
+             "depends-on": ", ".join(component["depends_on"]) or "none"}
+            for component in parse_component_breakdown(path)]
+
+
+def load_rows(path):
+    """Data rows from a JSON list (or single object), JSON Lines or CSV file"""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if path.endswith(".csv"):
+            return list(csv.DictReader(f))
+        if path.endswith(".jsonl"):
+            return [json.loads(line) for line in f if line.strip()]
+        data = json.load(f)
+    return data if isinstance(data, list) else [data]
+
+
+def _row_phases(row, phases):
+    """Phases to render a row for: its own "phase" field (e.g. "4,5") or the given default"""
+    own = row.get("phase")
+    if own in (None, ""):
+        return phases
+    return [int(part) for part in re.split(r"[,\s]+", str(own)) if part]
+
+
+def _prompt_name(values, number):
+    name = values.get("name") or values.get("component")
+    return component_slug(name) if name else f"row-{number:04d}"
+
+
+@timings.traced()
+def render_prompts(rows, phases=None, template=None, defaults=None):
+    """Render one prompt per row and phase
+    
+    Rows without a "phase" field are rendered for `phases` (default: all
+    phases in the template). `defaults` fills placeholders a row leaves
+    empty. A row with a "component" field gets a heading naming it.
+    Returns {"template", "prompts": [{phase, name, text, unfilled}],
+    "unfilled": {key: {"hint", "count"}}, "seconds"}.
+    """
+    started = time.perf_counter()
+    compiled = load_template(template)
+    phases = sorted(phases or compiled["phases"])
+    shared = normalize_values(defaults or {})
+    result = {"template": compiled["sha256"], "prompts": [], "unfilled": {}, "seconds": 0.0}
+    
+    for number, row in enumerate(rows, 1):
+        values = dict(shared, **normalize_values(row))
+        name = _prompt_name(values, number)
+        for phase in _row_phases(row, phases):
+            if phase not in compiled["phases"]:
+                raise ValueError(f"Phase {phase} is not in the prompt template")
+            text, unfilled = render(compiled, phase, values)
+            title = compiled["phases"][phase]["title"]
+            if "component" in values:
+                text = (f"# {title}: {values['component']}\n\n"
+                        f"**Depends on:** {values.get('depends-on', 'none')}\n\n{text}")
+            else:
+                text = f"# {title}\n\n{text}"
+            result["prompts"].append({"phase": phase, "name": name, "text": text, "unfilled": unfilled})
+            for key in unfilled:
+                entry = result["unfilled"].setdefault(key, {"hint": None, "count": 0})
+                entry["count"] += 1
+    
+    hints = {slot["key"]: slot["hint"] for slot in compiled["slots"]}
+    for key, entry in result["unfilled"].items():
+        entry["hint"] = hints[key]
+    result["seconds"] = round(time.perf_counter() - started, 3)
+    return result
+
+
+@timings.traced()
+def write_prompts(result, output_dir):
+    """Write each prompt to <output_dir>/phase<N>-<name>.md, returning the paths"""
+    paths = []
+    for prompt in result["prompts"]:
+        path = os.path.join(output_dir, f"phase{prompt['phase']}-{prompt['name']}.md")
+        atomic_write(path, prompt["text"])
+        paths.append(path)
+    return paths
+
+
+def print_prompt_report(result, output_dir=None, limit=10):
+    """Print how many prompts were rendered and which placeholders were left unfilled"""
+    prompts = result["prompts"]
+    target = f" to {output_dir}" if output_dir else ""
+    print(f"📝 Rendered {len(prompts)} prompt(s){target} in {result['seconds'] * 1000:.0f} ms")
+    incomplete = sum(1 for prompt in prompts if prompt["unfilled"])
+    if not incomplete:
+        print("✅ Every placeholder is filled")
+        return
+    print(f"⚠️  {incomplete} prompt(s) have unfilled placeholders ({len(result['unfilled'])} distinct):")
+    ranked = sorted(result["unfilled"].items(), key=lambda item: (-item[1]["count"], item[0]))
+    for key, entry in ranked[:limit]:
+        hint = entry["hint"] if len(entry["hint"]) <= 60 else entry["hint"][:57] + "..."
+        print(f"   {key:<24} {entry['count']:>5}×  [{hint}]")
+    if len(ranked) > limit:
+        print(f"   ... and {len(ranked) - limit} more (use --json for the full list)")
@@ -0,0 +1,290 @@
+"""
+Push Queue - Durable background `git push` queue with retry and coalescing
+
+Pause and end enqueue their pushes and return immediately. A detached worker
+drains the queue, retrying with exponential backoff. Each repository has at
+most one queue entry: refs queued while a push is pending are merged into it and
+go out together in a single atomic push.
+"""
+
+import hashlib
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+
+from ai_sdlc import timings
+from ai_sdlc.fsutil import ai_sdlc_home, atomic_write, lock_file, locked
+
+BASE_DELAY = 2.0
+MAX_DELAY = 300.0
+MAX_ATTEMPTS = 12
+
+UMBRELLA_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The worker has no terminal: credential prompts must fail instead of hanging
+NO_PROMPT_ENV = {"GIT_TERMINAL_PROMPT": "0", "GIT_ASKPASS": "true", "SSH_ASKPASS": "true"}
+
+# Failures that need the user to fix credentials or keys, not another attempt
+AUTH_ERRORS = ("authentication failed", "could not read username", "could not read password",
+               "terminal prompts disabled", "permission denied (publickey", "host key verification failed",
+               "invalid username or password", "the requested url returned error: 403")
+
+
+def queue_dir():
+    """Folder holding queue entries"""
+    return os.path.join(ai_sdlc_home(), "push-queue")
+
+
+def _entry_path(repo):
+    key = hashlib.sha1(os.path.realpath(repo).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(queue_dir(), f"{key}.json")
+
+
+def _lock_path():
+    return os.path.join(queue_dir(), "queue.lock")
+
+
+def _git(repo, args):
+    return timings.run(["git"] + args, cwd=repo, capture_output=True, text=True)
+
+
+def _read_entry(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def resolve_push_target(repo):
+    """Return (remote, branch) for the current branch, or (None, branch) without a remote"""
+    branch = _git(repo, ["symbolic-ref", "--quiet", "--short", "HEAD"]).stdout.strip() or None
+    remotes = _git(repo, ["remote"]).stdout.split()
+    if not remotes:
+        return None, branch
+    
+    remote = None
+    if branch:
+        remote = _git(repo, ["config", f"branch.{branch}.remote"]).stdout.strip() or None
+    if remote not in remotes:
+        remote = "origin" if "origin" in remotes else remotes[0]
+    return remote, branch
+
+
+def enqueue_push(repo, refs, remote):
+    """Add refs to the repository's queue entry, coalescing with any pending push"""
+    repo = os.path.realpath(repo)
+    path = _entry_path(repo)
+    now = time.time()
+    
+    with locked(_lock_path()):
+        entry = _read_entry(path) or {"repo": repo, "remote": remote, "refs": [], "queued_at": now}
+        entry["remote"] = remote
+        entry["refs"] = sorted(set(entry["refs"]) | set(refs))
+        entry["attempts"] = 0
+        entry["next_attempt"] = now
+        entry["last_error"] = None
+        entry["updated_at"] = now
+        atomic_write(path, json.dumps(entry, indent=2))
+    return entry
+
+
+@timings.traced()
+def queue_push(project_path, tags=()):
+    """Queue the current branch (and tags) for a background push and start the worker
+    
+    Returns the queue entry, or None when no remote is configured.
+    """
+    remote, branch = resolve_push_target(project_path)
+    if remote is None:
+        return None
+    
+    refs = [f"refs/tags/{tag}" for tag in tags]
+    if branch:
+        refs.append(f"refs/heads/{branch}")
+    if not refs:
+        return None
+    
+    entry = enqueue_push(project_path, refs, remote)
+    start_worker()
+    return entry
+
+
+def request_push(project_path, tags=()):
+    """queue_push for callers that want an outcome record instead of exceptions
+    
+    Returns {"status": "queued" | "no_remote" | "failed", "remote", "error"}.
+    """
+    try:
+        entry = queue_push(project_path, tags)
+    except OSError as e:
+        return {"status": "failed", "remote": None, "error": str(e)}
+    if entry is None:
+        return {"status": "no_remote", "remote": None, "error": None}
+    return {"status": "queued", "remote": entry["remote"], "error": None}
+
+
+def start_worker():
+    """Spawn a detached drain worker (a no-op if one is already running)"""
+    os.makedirs(queue_dir(), exist_ok=True)
+    env = dict(os.environ, **NO_PROMPT_ENV)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [UMBRELLA_DIR, env.get("PYTHONPATH")]))
+    env.setdefault("GIT_SSH_COMMAND", "ssh -o BatchMode=yes")
+    
+    kwargs = {}
+    if os.name == "posix":
+        kwargs["start_new_session"] = True
+    else:
+        kwargs["creationflags"] = getattr(subprocess, "DETACHED_PROCESS", 0)
+    
+    with open(os.path.join(queue_dir(), "worker.log"), "a") as log:
+        subprocess.Popen([sys.executable, "-m", "ai_sdlc.push_queue", "drain"],
+                         stdin=subprocess.DEVNULL, stdout=log, stderr=log, env=env, **kwargs)
+
+
+def atomic_push_args(remote, refs):
+    """`git push` arguments sending every ref in one atomic push"""
+    return ["push", "--atomic", "--porcelain", remote] + [f"{ref}:{ref}" for ref in refs]
+
+
+def push_failure(returncode, stdout, stderr):
+    """Classify a failed push as (retryable, error)"""
+    # Rejections (non-fast-forward, hooks) and authentication failures will not fix themselves by retrying
+    rejected = [line for line in stdout.splitlines() if line.startswith("!")]
+    denied = [line for line in stderr.splitlines() if any(pattern in line.lower() for pattern in AUTH_ERRORS)]
+    errors = [line for line in stderr.splitlines() if line.startswith(("fatal:", "error:"))]
+    error = (rejected or denied or errors or stderr.strip().splitlines() or [f"exit {returncode}"])[0]
+    return not rejected and not denied, error.strip()
+
+
+def _push(entry):
+    """Push all refs of an entry in one atomic push; returns (ok, retryable, error)"""
+    result = _git(entry["repo"], atomic_push_args(entry["remote"], entry["refs"]))
+    if result.returncode == 0:
+        return True, False, None
+    return (False,) + push_failure(result.returncode, result.stdout, result.stderr)
+
+
+def _due_entries():
+    entries = []
+    try:
+        names = os.listdir(queue_dir())
+    except OSError:
+        return entries
+    for name in names:
+        if name.endswith(".json"):
+            entry = _read_entry(os.path.join(queue_dir(), name))
+            if entry and entry.get("attempts", 0) < MAX_ATTEMPTS:
+                entries.append(entry)
+    return entries
+
+
+def process_entry(entry):
+    """Attempt one queued push and record the outcome"""
+    ok, retryable, error = _push(entry)
+    path = _entry_path(entry["repo"])
+    
+    with locked(_lock_path()):
+        current = _read_entry(path)
+        if current is None:
+            return ok
+        if current.get("updated_at") != entry.get("updated_at"):
+            # Re-queued while pushing (new commits or tags): push again right away, whatever this push did
+            current["attempts"] = 0
+            current["next_attempt"] = time.time()
+        elif ok:
+            os.remove(path)
+            return ok
+        else:
+            attempts = current.get("attempts", 0) + 1
+            current["attempts"] = attempts if retryable else MAX_ATTEMPTS
+            delay = min(MAX_DELAY, BASE_DELAY * 2 ** (attempts - 1))
+            current["next_attempt"] = time.time() + delay * random.uniform(0.8, 1.2)
+        if not ok:
+            current["last_error"] = error
+        atomic_write(path, json.dumps(current, indent=2))
+    return ok
+
+
+def _drain_locked():
+    while True:
+        entries = _due_entries()
+        if not entries:
+            return
+        
+        now = time.time()
+        due = [entry for entry in entries if entry.get("next_attempt", 0) <= now]
+        for entry in due:
+            process_entry(entry)
+        
+        if not due:
+            next_attempt = min(entry.get("next_attempt", now) for entry in entries)
+            time.sleep(max(0.1, min(next_attempt - now, MAX_DELAY)))
+
+
+def drain_queue():
+    """Push queued entries until the queue is empty or only exhausted entries remain"""
+    os.makedirs(queue_dir(), exist_ok=True)
+    while True:
+        with open(os.path.join(queue_dir(), "worker.lock"), "a") as worker_lock:
+            if not lock_file(worker_lock, blocking=False):
+                return  # Another worker is already draining
+            _drain_locked()
+        
+        # A worker spawned just before we released the lock gave up; re-check for it
+        if not _due_entries():
+            return
+
+
+def queue_status(project_path=None):
+    """List queue entries, optionally only the one for project_path"""
+    if project_path is not None:
+        entry = _read_entry(_entry_path(project_path))
+        return [entry] if entry else []
+    
+    entries = []
+    try:
+        names = sorted(os.listdir(queue_dir()))
+    except OSError:
+        return entries
+    for name in names:
+        if name.endswith(".json"):
+            entry = _read_entry(os.path.join(queue_dir(), name))
+            if entry:
+                entries.append(entry)
+    return entries
+
+
+def print_queue_status(entries):
+    """Print what is still waiting to be pushed"""
+    if not entries:
+        print("✅ Nothing waiting to be pushed")
+        return
+    
+    now = time.time()
+    print(f"📤 Unpushed repositories: {len(entries)}")
+    for entry in entries:
+        refs = ", ".join(ref.split("/", 2)[-1] for ref in entry["refs"])
+        print(f"   - {entry['repo']} → {entry['remote']}: {refs}")
+        if entry.get("attempts", 0) >= MAX_ATTEMPTS:
+            print(f"     ❌ Gave up after {entry['attempts']} attempt(s). Push manually: git push")
+        elif entry.get("attempts"):
+            wait = max(0, int(entry["next_attempt"] - now))
+            print(f"     ⏳ Attempt {entry['attempts'] + 1} in {wait}s")
+        if entry.get("last_error"):
+            print(f"     ⚠️  {entry['last_error']}")
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else "status"
+    if command == "drain":
+        drain_queue()
+    else:
+        print_queue_status(queue_status())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Quality - Content checks for phase artifacts, cached by file content
+
+An artifact passes when it has content beyond its headings, contains the
+headings its phase rules ask for, and has no unfilled [bracketed placeholders]
+left over from ai-sdlc-prompt-template.md. Results are cached in
+.ai-sdlc/cache/ keyed by size, mtime and SHA-256, so re-validation only
+re-reads files that changed and only re-checks files whose content changed.
+"""
+
+import hashlib
+import json
+import os
+import re
+import stat
+from concurrent.futures import ThreadPoolExecutor
+
+from ai_sdlc import timings
+from ai_sdlc.component_index import CACHE_DIR
+from ai_sdlc.fsutil import atomic_write
+
+CACHE_FILE = os.path.join(CACHE_DIR, "quality-cache.json")
+CACHE_VERSION = 2
+
+# Required headings, from the MANDATORY OUTPUTS of each phase's rules
+ARTIFACT_HEADINGS = {
+    "1-Planning/project-charter.md": ["Executive Summary", "Scope", "Objectives"],
+    "1-Planning/initial-timeline.md": ["Milestones", "Dependencies"],
+    "1-Planning/stakeholder-map.md": ["Roles", "Responsibilities"],
+    "2-Requirements/requirements-specification.md": ["Functional", "Non-Functional", "Constraints"],
+    "3-Design/system-architecture.md": ["Components", "Interfaces"],
+    "3-Design/data-interfaces.md": ["Input", "Output", "Validation"]
+}
+
+# "[Define the scope - e.g. ...]": a word and a space inside brackets, not a link
+PLACEHOLDER_PATTERN = re.compile(r"\[([A-Za-z][\w'-]*\s[^\]\n]*)\](?![(\[:])")
+MAX_PLACEHOLDERS_REPORTED = 3
+
+_HEADING_PATTERN = re.compile(r"^\s{0,3}#{1,6}\s+(.*?)\s*#*\s*$")
+_INLINE_CODE_PATTERN = re.compile(r"`[^`\n]*`")
+_NUMBERING_PATTERN = re.compile(r"^(?:\d+(?:\.\d+)*[.):]?\s+)+")
+
+# Any change to the rules invalidates cached results
+RULES_DIGEST = hashlib.sha256(json.dumps(
+    [CACHE_VERSION, ARTIFACT_HEADINGS, PLACEHOLDER_PATTERN.pattern, MAX_PLACEHOLDERS_REPORTED],
+    sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _heading_words(text):
+    """Words of a heading without its section number, e.g. '2.1 Non-Functional' -> ('non', 'functional')"""
+    return tuple(re.findall(r"[a-z0-9]+", _NUMBERING_PATTERN.sub("", text.strip().lower())))
+
+
+def check_content(path, text):
+    """Content issues of one artifact (path relative to the project), empty when it passes"""
+    headings = []
+    body_lines = 0
+    placeholders = []
+    in_code = False
+    
+    for number, line in enumerate(text.split("\n"), start=1):
+        if line.lstrip().startswith(("```", "~~~")):
+            in_code = not in_code
+            continue
+        if in_code or not line.strip():
+            continue
+        
+        match = _HEADING_PATTERN.match(line)
+        if match:
+            headings.append(_heading_words(match.group(1)))
+            continue
+        body_lines += 1
+        
+        for placeholder in PLACEHOLDER_PATTERN.finditer(_INLINE_CODE_PATTERN.sub("", line)):
+            placeholders.append(f"line {number}: [{placeholder.group(1)[:40]}]")
+    
+    if not text.strip():
+        return ["file is empty"]
+    
+    issues = []
+    if not body_lines:
+        issues.append("only headings, no content")
+    
+    for heading in ARTIFACT_HEADINGS.get(path, []):
+        # Whole words from the start: "Non-Functional Requirements" does not satisfy "Functional"
+        wanted = _heading_words(heading)
+        if not any(found[:len(wanted)] == wanted for found in headings):
+            issues.append(f"missing heading '{heading}'")
+    
+    if placeholders:
+        shown = ", ".join(placeholders[:MAX_PLACEHOLDERS_REPORTED])
+        more = len(placeholders) - MAX_PLACEHOLDERS_REPORTED
+        issues.append(f"unfilled placeholder(s) {shown}" + (f" and {more} more" if more > 0 else ""))
+    return issues
+
+
+def _read_cache(cache_path):
+    """Read the result cache, returning an empty one when missing or built with other rules"""
+    try:
+        with open(cache_path, 'r') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    
+    if cache.get("version") != CACHE_VERSION or cache.get("rules") != RULES_DIGEST:
+        return {}
+    return cache.get("files", {})
+
+
+def _check_file(project_path, path, file_stat, cached):
+    """Read and check one artifact, reusing the cached result when only the mtime changed"""
+    with open(os.path.join(project_path, path), 'rb') as f:
+        data = f.read()
+    
+    digest = hashlib.sha256(data).hexdigest()
+    if cached and cached.get("sha256") == digest:
+        issues = cached["issues"]
+    else:
+        issues = check_content(path, data.decode("utf-8", errors="replace"))
+    return {"size": file_stat.st_size, "mtime_ns": file_stat.st_mtime_ns, "sha256": digest, "issues": issues}
+
+
+@timings.traced()
+def check_artifacts(project_path, paths, workers=None):
+    """Check artifacts in parallel, returning {path: [issues]} for the ones that fail
+    
+    Paths that do not exist or are folders are skipped; the existence check
+    reports those.
+    """
+    cache_path = os.path.join(project_path, CACHE_FILE)
+    cached_files = _read_cache(cache_path)
+    files = dict(cached_files)
+    
+    pending = []
+    for path in paths:
+        try:
+            file_stat = os.stat(os.path.join(project_path, path))
+        except OSError:
+            files.pop(path, None)
+            continue
+        if not stat.S_ISREG(file_stat.st_mode):
+            continue
+        
+        cached = cached_files.get(path)
+        if cached and cached["size"] == file_stat.st_size and cached["mtime_ns"] == file_stat.st_mtime_ns:
+            continue
+        pending.append((path, file_stat, cached))
+    
+    if len(pending) == 1:
+        path, file_stat, cached = pending[0]
+        files[path] = _check_file(project_path, path, file_stat, cached)
+    elif pending:
+        workers = workers or min(len(pending), 8)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            checked = pool.map(lambda item: _check_file(project_path, *item), pending)
+            for (path, _, _), entry in zip(pending, checked):
+                files[path] = entry
+    
+    if files != cached_files:
+        try:
+            atomic_write(cache_path, json.dumps({"version": CACHE_VERSION, "rules": RULES_DIGEST, "files": files},
+                                                separators=(",", ":")))
+        except OSError:
+            pass  # Cache only
+    
+    return {path: files[path]["issues"] for path in paths if files.get(path, {}).get("issues")}
@@ -0,0 +1,101 @@
+"""
+Repository Statistics - Bounded-memory Git statistics per phase folder
+"""
+
+import subprocess
+
+from ai_sdlc import timings
+
+PHASE_FOLDERS = [
+    "1-Planning", "2-Requirements", "3-Design", "4-Development",
+    "5-Testing", "6-Deployment", "7-Maintenance"
+]
+
+CHUNK_SIZE = 64 * 1024
+
+
+def iter_git_records(project_path, args, separator=b"\0"):
+    """Stream separator-delimited records from a git command without buffering its output"""
+    process = subprocess.Popen(["git"] + args, cwd=project_path,
+                               stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    pending = b""
+    try:
+        while True:
+            chunk = process.stdout.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            records = (pending + chunk).split(separator)
+            pending = records.pop()
+            for record in records:
+                if record:
+                    yield record
+        if pending:
+            yield pending
+    finally:
+        process.stdout.close()
+        if process.wait() != 0:
+            raise subprocess.CalledProcessError(process.returncode, ["git"] + args)
+
+
+def _commit_count_processes(project_path, folders):
+    """Start `git rev-list --count` for the whole history and each folder concurrently"""
+    processes = {None: subprocess.Popen(["git", "rev-list", "--count", "HEAD"], cwd=project_path,
+                                        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)}
+    for folder in folders:
+        processes[folder] = subprocess.Popen(["git", "rev-list", "--count", "HEAD", "--", folder],
+                                             cwd=project_path, stdout=subprocess.PIPE,
+                                             stderr=subprocess.DEVNULL, text=True)
+    return processes
+
+
+@timings.traced()
+def collect_repo_stats(project_path=".", folders=None):
+    """Collect commit, file and byte counts for HEAD, overall and per phase folder
+
+    Commits are counted with `git rev-list --count` and files/bytes are summed
+    while streaming `git ls-tree -r -l -z HEAD`, so memory use does not grow
+    with history length or tree size.
+    """
+    folders = list(folders or PHASE_FOLDERS)
+    stats = {
+        "commits": 0,
+        "files": 0,
+        "bytes": 0,
+        "phases": {folder: {"files": 0, "bytes": 0, "commits": 0} for folder in folders}
+    }
+
+    counters = _commit_count_processes(project_path, folders)
+
+    try:
+        with timings.span("git ls-tree", "subprocess", cwd=project_path):
+            for record in iter_git_records(project_path, ["ls-tree", "-r", "-l", "-z", "HEAD"]):
+                meta, _, path = record.partition(b"\t")
+                size = meta.split()[-1]
+                size = int(size) if size.isdigit() else 0
+                stats["files"] += 1
+                stats["bytes"] += size
+
+                top_level = path.split(b"/", 1)[0].decode("utf-8", "surrogateescape")
+                if top_level in stats["phases"] and b"/" in path:
+                    stats["phases"][top_level]["files"] += 1
+                    stats["phases"][top_level]["bytes"] += size
+    finally:
+        # Started before ls-tree, so this span only covers what is left of their runtime
+        with timings.span("git rev-list --count", "subprocess", cwd=project_path, processes=len(counters)):
+            for folder, process in counters.items():
+                output, _ = process.communicate()
+                count = int(output.strip()) if process.returncode == 0 and output.strip().isdigit() else 0
+                if folder is None:
+                    stats["commits"] = count
+                else:
+                    stats["phases"][folder]["commits"] = count
+
+    return stats
+
+
+def format_bytes(size):
+    """Format a byte count for humans, e.g. 1.5 MB"""
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
@@ -0,0 +1,106 @@
+"""
+Resume - Current project status and next steps for a returning session
+
+project_status only reads, so `resume --json` can be polled safely. The
+interactive resume also brings the workspace in line: it activates the
+current phase's rules and restores offloaded artifacts.
+"""
+
+import os
+
+from ai_sdlc import timings
+from ai_sdlc.artifact_store import materialize_artifacts
+from ai_sdlc.journal import tail_entries
+from ai_sdlc.rule_store import RULES_DIR, active_rule_files
+from ai_sdlc.session_state import PHASE_RULES, STATUS_FILE, load_state, phase_label
+
+# Journal entries shown on resume
+RECENT_SESSIONS = 5
+
+
+@timings.traced()
+def project_status(project_path=".", recent_sessions=RECENT_SESSIONS):
+    """Collect the project's current status without printing or changing anything"""
+    result = {"project": project_path, "ok": False, "error": None, "state": None,
+              "phase": None, "phase_label": None, "rules_file": None,
+              "status_file": os.path.join(project_path, STATUS_FILE), "recent_sessions": [],
+              "active_rules": [], "rules_removed": [], "rules_error": None, "artifacts": None}
+    
+    # Load structured project state (migrates SESSION-STATUS.md on first use)
+    state = load_state(project_path)
+    if state is None:
+        result["error"] = "No SESSION-STATUS.md found. Run 1-start-project.py first to setup project."
+        return result
+    
+    phase = state.get("phase")
+    result.update(ok=True, state=state, phase=phase,
+                  phase_label=phase_label(phase) if phase else None,
+                  rules_file=PHASE_RULES.get(phase, PHASE_RULES[1]),
+                  recent_sessions=tail_entries(project_path, recent_sessions))
+    if phase in PHASE_RULES:
+        rules_dir = os.path.join(project_path, RULES_DIR)
+        result["active_rules"] = [name for name in active_rule_files(phase)
+                                  if os.path.exists(os.path.join(rules_dir, name))]
+    return result
+
+
+def restore_workspace(project_path, result):
+    """Activate the current phase's rules and restore offloaded artifacts, updating a project_status result"""
+    # The phase may have changed outside advance_phase(), so bring the active rules in line
+    if result["phase"] in PHASE_RULES:
+        from ai_sdlc.project import activate_phase_rules
+        try:
+            rules = activate_phase_rules(project_path, result["phase"])
+            result["active_rules"] = rules["installed"] + rules["unchanged"]
+            result["rules_removed"] = rules["removed"]
+        except OSError as e:
+            result["rules_error"] = str(e)
+    
+    # Large files kept out of git come back from the local artifact store
+    result["artifacts"] = materialize_artifacts(project_path)
+    return result
+
+
+@timings.traced()
+def resume_project(project_path=".", recent_sessions=RECENT_SESSIONS):
+    """Resume existing AI-SDLC project"""
+    result = project_status(project_path, recent_sessions)
+    if not result["ok"]:
+        print(f"❌ {result['error']}")
+        return False
+    restore_workspace(project_path, result)
+    
+    # Read current status
+    status_file = result["status_file"]
+    with open(status_file, 'r') as f:
+        content = f.read()
+    
+    print("📋 Current Project Status:")
+    print("=" * 50)
+    print(content)
+    print("=" * 50)
+    
+    if result["recent_sessions"]:
+        print(f"\n🕘 Recent sessions:")
+        for session in result["recent_sessions"]:
+            print(f"   - {session.get('paused_at', '')}: {session.get('last_commit', '')}")
+    
+    if result["active_rules"]:
+        print(f"\n🤖 AI rules active in .amazonq/rules/: {', '.join(result['active_rules'])}")
+        if result["rules_removed"]:
+            print(f"   ({len(result['rules_removed'])} rule file(s) of other phases deactivated)")
+    else:
+        print(f"\n🤖 AI rules already loaded in .amazonq/rules/{result['rules_file']}")
+    artifacts = result["artifacts"]
+    if artifacts["materialized"]:
+        print(f"📦 Restored {len(artifacts['materialized'])} large file(s) from the artifact store")
+    if artifacts["missing"]:
+        print(f"⚠️  {len(artifacts['missing'])} offloaded file(s) are not in this machine's artifact store:")
+        for path in artifacts["missing"]:
+            print(f"   - {path}")
+    print(f"📁 Work in the current phase folder shown above")
+    print(f"📝 Update SESSION-STATUS.md when you complete tasks")
+    print(f"🔍 Validate progress: python ../Umbrella/3-validate-phase.py")
+    
+    print(f"\n💡 To update status manually, edit: {status_file}")
+    return True
@@ -0,0 +1,285 @@
+"""
+Rule Store - Content-addressed cache of AI rule files shared by all projects
+
+Rule files are stored once under ~/.ai-sdlc/rules/objects/<sha256> and installed
+into each project's .amazonq/rules/ as hardlinks (the default), symlinks or
+copies, with a copy wherever linking fails. Installs compare hashes first, so
+syncing many projects only touches files whose content actually changed.
+
+Hardlinks share the store's read-only inode, so an in-place edit of a project's
+rule fails rather than reaching every project; rules are changed in the
+framework and synced. Symlinks point into this machine's home folder; they are
+listed in .amazonq/rules/.gitignore so they are never committed.
+
+A project only has its current phase's rules active, plus the cross-cutting
+rules (and the iterative-development rules in Phases 4-6). Rules of other
+phases are removed when the phase changes, so the assistant does not carry all
+seven phases' rules in every request.
+"""
+
+import json
+import os
+import shutil
+
+from ai_sdlc import timings
+from ai_sdlc.fsutil import ai_sdlc_home, atomic_write, file_sha256, locked
+from ai_sdlc.session_state import PHASE_RULES, load_state
+
+RULE_FILES = [
+    "phase1-planning-rules.md",
+    "phase2-requirements-rules.md",
+    "phase3-design-rules.md",
+    "phase4-development-rules.md",
+    "phase5-testing-rules.md",
+    "phase6-deployment-rules.md",
+    "phase7-maintenance-rules.md",
+    "context-management-rules.md",
+    "file-organization-rules.md",
+    "iterative-development-rules.md"
+]
+
+# Rules active in every phase, and the rules shared by the iterative phases 4-6
+CROSS_CUTTING_RULES = ["context-management-rules.md", "file-organization-rules.md"]
+ITERATIVE_RULES = ["iterative-development-rules.md"]
+
+STRATEGIES = ("hardlink", "symlink", "copy")
+DEFAULT_STRATEGY = os.environ.get("AI_SDLC_RULES_STRATEGY", "hardlink")
+
+RULES_DIR = os.path.join(".amazonq", "rules")
+MANIFEST_FILE = os.path.join(".ai-sdlc", "cache", "rules-manifest.json")
+IGNORE_FILE = os.path.join(RULES_DIR, ".gitignore")
+
+
+def store_dir():
+    return os.path.join(ai_sdlc_home(), "rules")
+
+
+def _objects_dir():
+    return os.path.join(store_dir(), "objects")
+
+
+def object_path(digest):
+    return os.path.join(_objects_dir(), digest)
+
+
+def active_rule_files(phase):
+    """Rule files active in a phase (every rule file when phase is None)"""
+    if phase is None:
+        return list(RULE_FILES)
+    files = [PHASE_RULES[phase]] + CROSS_CUTTING_RULES
+    if 4 <= phase <= 6:
+        files += ITERATIVE_RULES
+    return files
+
+
+def project_phase(project_path):
+    """Current phase of a project from its state, or None when it has none"""
+    try:
+        state = load_state(project_path)
+    except (OSError, ValueError):
+        return None
+    phase = state.get("phase") if state else None
+    return phase if phase in PHASE_RULES else None
+
+
+def _load_json(path, default):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+@timings.traced()
+def ingest_rules(source_dir, rule_files=None):
+    """Add the framework's rule files to the store, returning {name: sha256}
+    
+    Source hashes are cached by (size, mtime), so unchanged rule files are not
+    re-read on every run.
+    """
+    cache_path = os.path.join(store_dir(), "sources.json")
+    cache = _load_json(cache_path, {})
+    manifest = {}
+    cache_changed = False
+    
+    for name in rule_files or RULE_FILES:
+        source_path = os.path.abspath(os.path.join(source_dir, name))
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            continue
+        
+        cached = cache.get(source_path)
+        if cached and cached["size"] == stat.st_size and cached["mtime_ns"] == stat.st_mtime_ns:
+            digest = cached["sha256"]
+        else:
+            digest = file_sha256(source_path)
+            cache[source_path] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest}
+            cache_changed = True
+        
+        target = object_path(digest)
+        if not os.path.exists(target):
+            os.makedirs(_objects_dir(), exist_ok=True)
+            tmp_path = f"{target}.{os.getpid()}.tmp"
+            shutil.copyfile(source_path, tmp_path)
+            # Read-only, so an in-place edit through a hardlink cannot corrupt the store
+            os.chmod(tmp_path, 0o444)
+            os.replace(tmp_path, target)
+        manifest[name] = digest
+    
+    if cache_changed:
+        atomic_write(cache_path, json.dumps(cache, indent=2))
+    return manifest
+
+
+def _is_current(dest_path, digest, strategy, recorded):
+    """Check whether an installed rule already has the wanted content, reading it only as a last resort"""
+    try:
+        stat = os.lstat(dest_path)
+    except OSError:
+        return False
+    
+    if strategy == "symlink" and os.path.islink(dest_path):
+        return os.readlink(dest_path) == object_path(digest)
+    if strategy == "hardlink":
+        try:
+            target = os.stat(object_path(digest))
+            if (stat.st_ino, stat.st_dev) == (target.st_ino, target.st_dev):
+                return True
+        except OSError:
+            pass
+    
+    # Copies: requested, or the fallback used when linking was not possible. A
+    # link installed with another strategy is replaced, not taken for a copy
+    if os.path.islink(dest_path) or (recorded.get("strategy") != "copy" if recorded else strategy != "copy"):
+        return False
+    if (recorded and recorded.get("sha256") == digest and recorded.get("size") == stat.st_size
+            and recorded.get("mtime_ns") == stat.st_mtime_ns):
+        return True
+    return strategy == "copy" and file_sha256(dest_path) == digest
+
+
+def _place(dest_path, digest, strategy):
+    """Install one rule file atomically, falling back to a copy if links are unavailable"""
+    source = object_path(digest)
+    tmp_path = f"{dest_path}.{os.getpid()}.tmp"
+    try:
+        if strategy == "hardlink":
+            os.link(source, tmp_path)
+        elif strategy == "symlink":
+            os.symlink(source, tmp_path)
+        else:
+            raise OSError("copy requested")
+    except OSError:
+        shutil.copyfile(source, tmp_path)
+        strategy = "copy"
+    os.replace(tmp_path, dest_path)
+    return strategy
+
+
+@timings.traced()
+def install_rules(project_path, manifest, strategy=None, phase=None):
+    """Install rules into a project's .amazonq/rules/, skipping files already current
+    
+    With a phase, only that phase's active rules are installed and the other
+    framework rule files are removed afterwards. Each file is swapped in with
+    one rename, and new rules are in place before old ones go, so the folder
+    never lacks the rules of either phase. Rule files that are not part of the
+    framework are left alone.
+    
+    Returns {"installed": [...], "unchanged": [...], "removed": [...], "strategy": ...}.
+    """
+    strategy = strategy or DEFAULT_STRATEGY
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown rule strategy '{strategy}' (use {', '.join(STRATEGIES)})")
+    
+    rules_dir = os.path.join(project_path, RULES_DIR)
+    os.makedirs(rules_dir, exist_ok=True)
+    manifest_path = os.path.join(project_path, MANIFEST_FILE)
+    recorded = _load_json(manifest_path, {})
+    result = {"installed": [], "unchanged": [], "removed": [], "strategy": strategy}
+    active = active_rule_files(phase)
+    
+    for name, digest in manifest.items():
+        if name not in active:
+            continue
+        dest_path = os.path.join(rules_dir, name)
+        if _is_current(dest_path, digest, strategy, recorded.get(name)):
+            result["unchanged"].append(name)
+            continue
+        used = _place(dest_path, digest, strategy)
+        stat = os.lstat(dest_path)
+        recorded[name] = {"sha256": digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns,
+                          "strategy": used}
+        result["installed"].append(name)
+    
+    for name in RULE_FILES:
+        if name in active:
+            continue
+        try:
+            os.remove(os.path.join(rules_dir, name))
+        except FileNotFoundError:
+            continue
+        recorded.pop(name, None)
+        result["removed"].append(name)
+    
+    if result["installed"] or result["removed"]:
+        atomic_write(manifest_path, json.dumps(recorded, indent=2))
+        _update_ignore_file(project_path, recorded)
+    
+    return result
+
+
+def _update_ignore_file(project_path, recorded):
+    """Keep symlinked rules out of git: their targets only exist on this machine"""
+    path = os.path.join(project_path, IGNORE_FILE)
+    links = sorted(name for name, entry in recorded.items() if entry.get("strategy") == "symlink")
+    if not links:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        return
+    content = "# Symlinks into ~/.ai-sdlc/rules (local only), written by ai-sdlc\n" + "\n".join(links) + "\n"
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            if f.read() == content:
+                return
+    except FileNotFoundError:
+        pass
+    atomic_write(path, content)
+
+
+def register_project(project_path):
+    """Remember a project so `sync-rules` can update it later"""
+    registry_path = os.path.join(ai_sdlc_home(), "projects.json")
+    with locked(os.path.join(ai_sdlc_home(), "projects.lock")):
+        projects = _load_json(registry_path, [])
+        project = os.path.realpath(project_path)
+        if project not in projects:
+            projects.append(project)
+            atomic_write(registry_path, json.dumps(sorted(projects), indent=2))
+
+
+def registered_projects():
+    """Registered projects that still exist on disk"""
+    projects = _load_json(os.path.join(ai_sdlc_home(), "projects.json"), [])
+    return [project for project in projects if os.path.isdir(os.path.join(project, RULES_DIR))]
+
+
+def sync_rules(source_dir, projects, strategy=None):
+    """Bring every project's rules up to date in one pass over the store
+    
+    Each project gets the rules of its current phase. Returns one install
+    result per project (with "project" and, on failure, "error").
+    """
+    manifest = ingest_rules(source_dir)
+    results = []
+    for project in projects:
+        try:
+            result = install_rules(project, manifest, strategy, project_phase(project))
+        except OSError as e:
+            result = {"installed": [], "unchanged": [], "removed": [], "strategy": strategy, "error": str(e)}
+        result["project"] = project
+        results.append(result)
+    return results
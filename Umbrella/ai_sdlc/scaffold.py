@@ -0,0 +1,261 @@
+"""
+Scaffold - Declarative project layout and bulk component skeletons
+
+Folders are described once in ai-sdlc-layout.json. A scaffold run plans every
+folder it needs, checks them against a single top-down snapshot of the project
+tree (one directory listing per existing ancestor, no stat per path) and then
+creates only what is missing, parents first.
+"""
+
+import json
+import os
+import re
+
+from ai_sdlc import timings
+
+LAYOUT_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           "ai-sdlc-layout.json")
+
+# Component stages in lifecycle order; development is the default
+STAGES = ("development", "testing", "deployment")
+
+_HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_BULLET = re.compile(r"^(\s*)(?:[-*+]|\d+[.)])\s+(.*)$")
+_DEPENDS = re.compile(r"\b(?:depends on|dependencies|requires)\s*[:\-]\s*(.*)$", re.IGNORECASE)
+_EMPHASIS = re.compile(r"\*\*(.+?)\*\*|__(.+?)__|`([^`]+)`|\[([^\]]+)\]\([^)]*\)")
+
+
+def load_layout(path=None):
+    """Load the layout spec (defaults to ai-sdlc-layout.json next to the scripts)"""
+    with open(path or LAYOUT_FILE, "r", encoding="utf-8") as f:
+        layout = json.load(f)
+    if layout.get("version") != 1:
+        raise ValueError(f"Unsupported layout version: {layout.get('version')}")
+    return layout
+
+
+def component_slug(title):
+    """Folder name for a component title, e.g. 'Auth Service' -> 'auth-service'"""
+    slug = re.sub(r"[^a-z0-9._-]+", "-", title.strip().lower())
+    return slug.strip("-.")
+
+
+def check_component_name(name):
+    """Reject names that are not their own slug, so no name can leave its component folder"""
+    if not name or name != component_slug(name):
+        hint = f" (try '{component_slug(name)}')" if component_slug(name or "") else ""
+        raise ValueError(f"Invalid component name '{name}'{hint}")
+
+
+def _component_title(text):
+    """Pick the component name out of a bullet, heading or table cell"""
+    text = re.sub(r"^component\s*[:\-]\s*", "", text.strip(), flags=re.IGNORECASE)
+    match = _EMPHASIS.search(text)
+    if match and match.start() == 0:
+        return next(group for group in match.groups() if group)
+    return re.split(r"\s+[-–—]\s+|:\s|\s\(", text, maxsplit=1)[0].strip()
+
+
+def _dependency_names(text):
+    """Split 'a, b and c' into component slugs, ignoring 'none' and dashes"""
+    text = _EMPHASIS.sub(lambda m: next(group for group in m.groups() if group), text)
+    names = []
+    for part in re.split(r",|;|\band\b", text):
+        slug = component_slug(part)
+        if slug and slug not in ("none", "n-a", "na"):
+            names.append(slug)
+    return names
+
+
+def _table_cells(line):
+    return [cell.strip() for cell in line.strip().strip("|").split("|")]
+
+
+def parse_component_breakdown(path):
+    """Read the components listed in component-breakdown.md
+    
+    Components are the rows of a table with a "Component" column (and an
+    optional "Depends on"/"Dependencies" column), or the headings and top-level
+    bullets inside a section whose title mentions components. A "Depends on:"
+    line under a component (or inside its bullet) lists its dependencies.
+    
+    Returns [{"name", "title", "depends_on"}] in document order.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    
+    components = {}
+    current = None
+    section_level = None
+    bullet_indent = None
+    table = None
+    from_heading = False
+    
+    def add(title):
+        name = component_slug(title)
+        if not name:
+            return None
+        component = components.setdefault(name, {"name": name, "title": title, "depends_on": []})
+        return component
+    
+    def add_dependencies(component, text):
+        for name in _dependency_names(text):
+            if name != component["name"] and name not in component["depends_on"]:
+                component["depends_on"].append(name)
+    
+    for line in lines:
+        # Tables: a header row with a Component column, then one row per component
+        if line.lstrip().startswith("|"):
+            cells = _table_cells(line)
+            if table is None:
+                headers = [cell.lower() for cell in cells]
+                name_column = next((i for i, h in enumerate(headers) if "component" in h or h == "name"), None)
+                if name_column is not None:
+                    deps_column = next((i for i, h in enumerate(headers)
+                                        if "depend" in h or "requires" in h), None)
+                    table = (name_column, deps_column)
+                continue
+            if all(re.fullmatch(r":?-+:?", cell) for cell in cells if cell):
+                continue
+            name_column, deps_column = table
+            if name_column < len(cells) and cells[name_column]:
+                component = add(_component_title(cells[name_column]))
+                if component and deps_column is not None and deps_column < len(cells):
+                    add_dependencies(component, cells[deps_column])
+            continue
+        table = None
+        
+        heading = _HEADING.match(line)
+        if heading:
+            level, title = len(heading.group(1)), heading.group(2)
+            bullet_indent = None
+            if title.lower().startswith("component:") or (section_level is not None and level > section_level):
+                current = add(_component_title(title))
+                from_heading = True
+            elif "component" in title.lower() and level > 1:  # Not the document title
+                section_level = level
+                current = None
+                from_heading = False
+            else:
+                section_level = None
+                current = None
+                from_heading = False
+            continue
+        
+        bullet = _BULLET.match(line)
+        depends = _DEPENDS.search(line)
+        if bullet and section_level is not None and not from_heading:
+            # Top-level bullets name components; nested ones describe them
+            indent = len(bullet.group(1))
+            if bullet_indent is None:
+                bullet_indent = indent
+            if indent == bullet_indent:
+                text = bullet.group(2)
+                current = add(_component_title(text[:depends.start() - bullet.start(2)] if depends else text))
+        
+        if depends and current is not None:
+            add_dependencies(current, depends.group(1))
+    
+    return list(components.values())
+
+
+def project_paths(layout):
+    """Folders every project has"""
+    return list(layout["project"])
+
+
+def component_paths(layout, names, stages=("development",)):
+    """Folders for the given components at the given lifecycle stages"""
+    paths = []
+    for stage in stages:
+        if stage not in layout["components"]:
+            raise ValueError(f"Unknown component stage '{stage}' (use {', '.join(STAGES)})")
+        for name in names:
+            check_component_name(name)
+            paths.extend(template.format(name=name) for template in layout["components"][stage])
+    return paths
+
+
+def plan_scaffold(project_path, relpaths):
+    """Work out which folders are missing, from one snapshot of the project tree
+    
+    Returns {"create": [...], "existing": [...], "conflicts": [...]} where
+    conflicts are paths blocked by a file of the same name.
+    """
+    targets = {os.path.normpath(path) for path in relpaths}
+    needed = set()
+    for path in targets:
+        while path and path not in needed:
+            needed.add(path)
+            path = os.path.dirname(path)
+    
+    # Only descend into folders that lead to a target
+    existing = set()
+    blocked = set()
+    stack = [""]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(os.path.join(project_path, current) if current else project_path) as entries:
+                for entry in entries:
+                    relpath = os.path.join(current, entry.name) if current else entry.name
+                    if relpath not in needed:
+                        continue
+                    if entry.is_dir():
+                        existing.add(relpath)
+                        stack.append(relpath)
+                    else:
+                        blocked.add(relpath)
+        except FileNotFoundError:
+            continue
+    
+    create = []
+    conflicts = []
+    for path in sorted(needed - existing):
+        if path in blocked or any(path.startswith(conflict + os.sep) for conflict in conflicts):
+            conflicts.append(path)
+        else:
+            create.append(path)
+    
+    return {"create": create, "existing": sorted(existing & targets), "conflicts": conflicts}
+
+
+def apply_scaffold(project_path, plan):
+    """Create the planned folders (sorted, so every parent precedes its children)"""
+    os.makedirs(project_path, exist_ok=True)
+    created = 0
+    for relpath in plan["create"]:
+        try:
+            os.mkdir(os.path.join(project_path, relpath))
+            created += 1
+        except FileExistsError:
+            pass
+    return created
+
+
+@timings.traced()
+def scaffold_project(project_path, layout=None, dry_run=False):
+    """Create the project folder layout"""
+    layout = layout or load_layout()
+    plan = plan_scaffold(project_path, project_paths(layout))
+    if not dry_run:
+        apply_scaffold(project_path, plan)
+    return plan
+
+
+@timings.traced()
+def scaffold_components(project_path, stages=("development",), names=None, layout=None, dry_run=False):
+    """Create component skeletons, by default for every component in component-breakdown.md
+    
+    Returns the plan with the component list added under "components".
+    """
+    layout = layout or load_layout()
+    if names is None:
+        breakdown = os.path.join(project_path, layout["component_breakdown"])
+        names = [component["name"] for component in parse_component_breakdown(breakdown)]
+    
+    plan = plan_scaffold(project_path, component_paths(layout, names, stages))
+    plan["components"] = list(names)
+    if not dry_run:
+        apply_scaffold(project_path, plan)
+    return plan
@@ -0,0 +1,234 @@
+"""
+Schedule - Component dependency graph, waves, critical path and blockers (Phases 4-6)
+
+Dependencies come from 4-Development/component-breakdown.md. Components in
+the same wave have no dependencies on each other and can move through
+develop/test/deploy concurrently. Inside a wave, components that start the
+longest remaining chain come first.
+
+A component is blocked when one of its dependencies has not yet reached the
+stage the component wants to enter next. For example, it cannot be deployed
+before its dependencies are deployed.
+"""
+
+import os
+
+from ai_sdlc import timings
+from ai_sdlc.scaffold import load_layout, parse_component_breakdown
+from ai_sdlc.session_state import load_state, save_state
+from ai_sdlc.validation import component_label, component_records
+
+# Lifecycle stages in order; a component's next stage is the one after its label
+STAGE_ORDER = ["not started", "in development", "ready for testing", "ready for deployment", "deployed"]
+
+
+def build_graph(components):
+    """Dependency graph {name: [dependencies]} of parsed components, plus unknown dependencies"""
+    names = {component["name"] for component in components}
+    graph = {}
+    unknown = {}
+    for component in components:
+        graph[component["name"]] = [name for name in component["depends_on"] if name in names]
+        missing = [name for name in component["depends_on"] if name not in names]
+        if missing:
+            unknown[component["name"]] = missing
+    return graph, unknown
+
+
+def find_cycles(graph):
+    """Groups of components that depend on each other in a cycle (Tarjan's algorithm)"""
+    index = {}
+    low = {}
+    stack = []
+    on_stack = set()
+    cycles = []
+    counter = 0
+    
+    for root in graph:
+        if root in index:
+            continue
+        work = [(root, iter(graph[root]))]
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        
+        while work:
+            node, dependencies = work[-1]
+            for dependency in dependencies:
+                if dependency not in index:
+                    index[dependency] = low[dependency] = counter
+                    counter += 1
+                    stack.append(dependency)
+                    on_stack.add(dependency)
+                    work.append((dependency, iter(graph[dependency])))
+                    break
+                if dependency in on_stack:
+                    low[node] = min(low[node], index[dependency])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    group = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        group.append(member)
+                        if member == node:
+                            break
+                    if len(group) > 1:
+                        cycles.append(sorted(group))
+    return cycles
+
+
+def plan_waves(graph, excluded=()):
+    """Parallel waves, the critical path and the remaining chain length of each component
+    
+    Components in `excluded` (cycles) and everything depending on them are
+    left out of the waves.
+    """
+    excluded = set(excluded)
+    dependents = {name: [] for name in graph}
+    pending = {}
+    for name, dependencies in graph.items():
+        pending[name] = len(dependencies)
+        for dependency in dependencies:
+            dependents[dependency].append(name)
+    
+    # Kahn's algorithm: a component's wave is one after its latest dependency
+    depth = {}
+    previous = {}
+    order = []
+    ready = [name for name in graph if not pending[name] and name not in excluded]
+    for name in ready:
+        depth[name] = 0
+    while ready:
+        name = ready.pop()
+        order.append(name)
+        for dependent in dependents[name]:
+            if dependent in excluded:
+                continue
+            if depth[name] + 1 > depth.get(dependent, -1):
+                depth[dependent] = depth[name] + 1
+                previous[dependent] = name
+            pending[dependent] -= 1
+            if not pending[dependent]:
+                ready.append(dependent)
+    
+    # Longest chain of components still waiting on each one, counting itself
+    remaining = {}
+    for name in reversed(order):
+        remaining[name] = 1 + max((remaining[dependent] for dependent in dependents[name]
+                                   if dependent in remaining), default=0)
+    
+    waves = [[] for _ in range(max((depth[name] for name in order), default=-1) + 1)]
+    for name in order:
+        waves[depth[name]].append(name)
+    for wave in waves:
+        wave.sort(key=lambda name: (-remaining[name], name))
+    
+    critical_path = []
+    if order:
+        name = max(order, key=lambda name: (depth[name], name))
+        while name is not None:
+            critical_path.append(name)
+            name = previous.get(name)
+        critical_path.reverse()
+    
+    unscheduled = sorted(set(graph) - set(order))
+    return {"waves": waves, "critical_path": critical_path, "remaining": remaining, "unscheduled": unscheduled}
+
+
+def blocked_components(graph, labels, cycles=()):
+    """Components whose next stage waits on a dependency, as {name: [{dependency, status}]}"""
+    in_cycle = {name for cycle in cycles for name in cycle}
+    blocked = {}
+    for name, dependencies in graph.items():
+        level = STAGE_ORDER.index(labels[name])
+        if level == len(STAGE_ORDER) - 1:
+            continue
+        waiting = [{"dependency": dependency, "status": labels[dependency]} for dependency in dependencies
+                   if STAGE_ORDER.index(labels[dependency]) <= level
+                   or (dependency in in_cycle and name in in_cycle)]
+        if waiting:
+            blocked[name] = waiting
+    return blocked
+
+
+@timings.traced()
+def build_schedule(project_path="."):
+    """Build the component schedule of a project without printing it"""
+    result = {"project": project_path, "ok": False, "error": None, "components": 0, "waves": [],
+              "critical_path": [], "cycles": [], "unscheduled": [], "unknown": {}, "blocked": {},
+              "ready": [], "status": {}}
+    
+    breakdown = os.path.join(project_path, load_layout()["component_breakdown"])
+    try:
+        components = parse_component_breakdown(breakdown)
+    except FileNotFoundError:
+        result["error"] = f"{breakdown} not found"
+        return result
+    if not components:
+        result["error"] = f"No components listed in {breakdown}"
+        return result
+    
+    graph, unknown = build_graph(components)
+    cycles = find_cycles(graph)
+    plan = plan_waves(graph, {name for cycle in cycles for name in cycle})
+    
+    records = component_records(project_path)
+    labels = {name: component_label(records.get(name)) or "not started" for name in graph}
+    blocked = blocked_components(graph, labels, cycles)
+    
+    result.update(ok=True, components=len(graph), waves=plan["waves"], critical_path=plan["critical_path"],
+                  cycles=cycles, unscheduled=plan["unscheduled"], unknown=unknown, blocked=blocked,
+                  status=labels)
+    result["ready"] = [name for wave in plan["waves"] for name in wave
+                       if name not in blocked and labels[name] != "deployed"]
+    return result
+
+
+def print_schedule(schedule):
+    """Print waves, critical path and blockers"""
+    print(f"🗺️  Component schedule: {schedule['components']} components in {len(schedule['waves'])} wave(s)")
+    print("=" * 60)
+    status = schedule["status"]
+    for number, wave in enumerate(schedule["waves"], start=1):
+        print(f"🌊 Wave {number}: " + ", ".join(f"{name} ({status[name]})" for name in wave))
+    
+    if schedule["critical_path"]:
+        print(f"\n🎯 Critical path ({len(schedule['critical_path'])}): {' → '.join(schedule['critical_path'])}")
+    
+    for cycle in schedule["cycles"]:
+        print(f"🔁 Dependency cycle: {' ↔ '.join(cycle)}")
+    if schedule["unscheduled"]:
+        print(f"⚠️  Not schedulable until cycles are broken: {', '.join(schedule['unscheduled'])}")
+    for name, dependencies in schedule["unknown"].items():
+        print(f"❓ {name} depends on unlisted component(s): {', '.join(dependencies)}")
+    
+    if schedule["blocked"]:
+        print(f"\n⛔ Blocked ({len(schedule['blocked'])}):")
+        for name, waiting in schedule["blocked"].items():
+            details = ", ".join(f"{item['dependency']} ({item['status']})" for item in waiting)
+            print(f"   - {name} ({status[name]}) waits on {details}")
+    if schedule["ready"]:
+        print(f"\n🚀 Can move now: {', '.join(schedule['ready'])}")
+
+
+@timings.traced()
+def save_schedule(project_path, schedule):
+    """Record the deployment order and blockers in the project state and SESSION-STATUS.md"""
+    state = load_state(project_path)
+    if state is None:
+        return False
+    state["schedule"] = {
+        "waves": schedule["waves"],
+        "critical_path": schedule["critical_path"],
+        "cycles": schedule["cycles"],
+        "blocked": {name: [item["dependency"] for item in waiting]
+                    for name, waiting in schedule["blocked"].items()}
+    }
+    save_state(project_path, state)
+    return True
@@ -0,0 +1,260 @@
+"""
+Session State - Structured source of truth for SESSION-STATUS.md
+
+The state lives in .ai-sdlc/state.json and SESSION-STATUS.md is rendered from
+it. Manual edits to SESSION-STATUS.md are still honoured: when the Markdown is
+newer than the JSON it is imported once and the JSON is brought up to date.
+"""
+
+import json
+import os
+import re
+
+from ai_sdlc import timings
+from ai_sdlc.fsutil import atomic_write
+
+STATE_DIR = ".ai-sdlc"
+STATE_FILE = os.path.join(STATE_DIR, "state.json")
+STATUS_FILE = "SESSION-STATUS.md"
+STATE_VERSION = 1
+
+PHASE_NAMES = ["Planning", "Requirements", "Design", "Development", "Testing", "Deployment", "Maintenance"]
+
+PHASE_RULES = {
+    1: "phase1-planning-rules.md",
+    2: "phase2-requirements-rules.md",
+    3: "phase3-design-rules.md",
+    4: "phase4-development-rules.md",
+    5: "phase5-testing-rules.md",
+    6: "phase6-deployment-rules.md",
+    7: "phase7-maintenance-rules.md"
+}
+
+# Sections of SESSION-STATUS.md owned by the renderer; anything else is preserved
+MANAGED_SECTIONS = {"Current State", "Project Info", "Next Actions", "Deployment Order", "Session Paused"}
+
+_FIELD_PATTERN = re.compile(r"^\s*-\s*\*\*(?P<key>[^*]+):\*\*\s*(?P<value>.*)$")
+_NUMBERED_PHASE_PATTERN = re.compile(r"^\s*(?:phase\s*)?([1-7])\s*[.):-]?(?:\s|$)", re.IGNORECASE)
+
+
+def phase_label(phase):
+    """Format a phase number as shown in SESSION-STATUS.md, e.g. '4. Development'"""
+    return f"{phase}. {PHASE_NAMES[phase - 1]}"
+
+
+def parse_phase(text):
+    """Parse a phase number (1-7) from a **Phase:** value, or None
+    
+    Accepts '4. Development', 'Phase 4', '4' or just 'Development'. Only the
+    leading number counts, so versions or dates later in the text do not.
+    """
+    if not text:
+        return None
+    
+    match = _NUMBERED_PHASE_PATTERN.match(text)
+    if match:
+        return int(match.group(1))
+    
+    words = re.findall(r"[a-z]+", text.lower())
+    for number, name in enumerate(PHASE_NAMES, start=1):
+        if name.lower() in words:
+            return number
+    return None
+
+
+def new_state(name, description="", tech_stack=None, ai_tools=None, phase=1):
+    """Build a fresh state record for a new project"""
+    return {
+        "version": STATE_VERSION,
+        "phase": phase,
+        "progress": "0% complete",
+        "last_task": "Project initialization",
+        "session_date": "",
+        "project": {
+            "name": name,
+            "description": description,
+            "tech_stack": list(tech_stack or []),
+            "ai_tools": dict(ai_tools or {})
+        },
+        "next_actions": [],
+        "last_session": None
+    }
+
+
+def parse_session_status(content, base=None):
+    """Import a state record from SESSION-STATUS.md content"""
+    state = json.loads(json.dumps(base)) if base else new_state("")
+    project = state["project"]
+    next_actions = []
+    sessions = []
+    section = None
+    
+    for line in content.split('\n'):
+        if line.startswith("## "):
+            section = line[3:].strip()
+            if section == "Session Paused":
+                sessions.append({})
+            continue
+        
+        if section == "Next Actions":
+            if line.startswith("- "):
+                next_actions.append(line[2:].strip())
+            continue
+        
+        match = _FIELD_PATTERN.match(line)
+        if not match:
+            continue
+        key, value = match.group("key").strip(), match.group("value").strip()
+        
+        if section == "Session Paused" and sessions:
+            if key == "Paused At":
+                sessions[-1]["paused_at"] = value
+            elif key == "Last Commit":
+                sessions[-1]["last_commit"] = value
+        elif key == "Phase":
+            state["phase"] = parse_phase(value) or state["phase"]
+        elif key == "Progress":
+            state["progress"] = value
+        elif key == "Last Task":
+            state["last_task"] = value
+        elif key == "Session Date":
+            state["session_date"] = value
+        elif key == "Name":
+            project["name"] = value
+        elif key == "Description":
+            project["description"] = value
+        elif key == "Tech Stack":
+            project["tech_stack"] = [tech.strip() for tech in value.split(",") if tech.strip()]
+    
+    if next_actions:
+        state["next_actions"] = next_actions
+    if sessions:
+        # Several blocks (or one without a journaled counterpart) are pause history
+        # from before the session journal; it is moved there on the next pause
+        if len(sessions) > 1 or not state.get("last_session"):
+            state["sessions"] = sessions
+        state["last_session"] = sessions[-1]
+    return state
+
+
+def _split_sections(content):
+    """Split Markdown into (title, text) sections on '## ' headings"""
+    sections = []
+    title, lines = None, []
+    for line in content.split('\n'):
+        if line.startswith("## "):
+            sections.append((title, "\n".join(lines)))
+            title, lines = line[3:].strip(), [line]
+        else:
+            lines.append(line)
+    sections.append((title, "\n".join(lines)))
+    return sections
+
+
+def render_session_status(state, existing_content=None):
+    """Render SESSION-STATUS.md from a state record
+    
+    Sections not owned by the renderer (e.g. notes added by the AI assistant)
+    are carried over from existing_content.
+    """
+    project = state["project"]
+    lines = ["# AI-SDLC Session Status", "", "## Current State"]
+    lines.append(f"- **Phase:** {phase_label(state['phase'])}")
+    lines.append(f"- **Progress:** {state['progress']}")
+    if state.get("last_task"):
+        lines.append(f"- **Last Task:** {state['last_task']}")
+    lines.append(f"- **Session Date:** {state['session_date']}")
+    lines.append("")
+    
+    lines.append("## Project Info")
+    lines.append(f"- **Name:** {project['name']}")
+    lines.append(f"- **Description:** {project['description']}")
+    lines.append(f"- **Tech Stack:** {', '.join(project['tech_stack'])}")
+    lines.append("")
+    
+    lines.append("## Next Actions")
+    for action in state["next_actions"]:
+        lines.append(f"- {action}")
+    
+    schedule = state.get("schedule")
+    if schedule:
+        lines.append("")
+        lines.append("## Deployment Order")
+        for number, wave in enumerate(schedule["waves"], start=1):
+            lines.append(f"- **Wave {number}:** {', '.join(wave)}")
+        if schedule["critical_path"]:
+            lines.append(f"- **Critical Path:** {' → '.join(schedule['critical_path'])}")
+        for cycle in schedule["cycles"]:
+            lines.append(f"- **Cycle:** {' ↔ '.join(cycle)}")
+        for name, dependencies in schedule["blocked"].items():
+            lines.append(f"- **Blocked:** {name} (waits on {', '.join(dependencies)})")
+    
+    text = "\n".join(lines) + "\n"
+    
+    if existing_content:
+        for title, section in _split_sections(existing_content):
+            if title and title not in MANAGED_SECTIONS:
+                text += "\n" + section.strip("\n") + "\n"
+    
+    # Only the latest pause; the full history is in the session journal
+    session = state.get("last_session") or (state.get("sessions") or [None])[-1]
+    if session:
+        text += "\n## Session Paused\n"
+        text += f"- **Paused At:** {session.get('paused_at', '')}\n"
+        text += f"- **Last Commit:** {session.get('last_commit', '')}\n"
+    
+    return text
+
+
+def _mtime_ns(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+@timings.traced()
+def load_state(project_path="."):
+    """Load the project state, or None if this is not an AI-SDLC project
+    
+    Projects created before the state file existed are migrated from
+    SESSION-STATUS.md on first load.
+    """
+    state_path = os.path.join(project_path, STATE_FILE)
+    status_path = os.path.join(project_path, STATUS_FILE)
+    state_mtime = _mtime_ns(state_path)
+    status_mtime = _mtime_ns(status_path)
+    
+    state = None
+    if state_mtime is not None:
+        try:
+            with open(state_path, 'r') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            state = None
+    
+    if status_mtime is None or (state is not None and status_mtime <= state_mtime):
+        return state
+    
+    # SESSION-STATUS.md was edited by hand (or predates the state file)
+    with open(status_path, 'r') as f:
+        state = parse_session_status(f.read(), base=state)
+    try:
+        atomic_write(state_path, json.dumps(state, indent=2) + "\n")
+    except OSError:
+        pass
+    return state
+
+
+@timings.traced()
+def save_state(project_path, state):
+    """Persist the state and re-render SESSION-STATUS.md from it"""
+    status_path = os.path.join(project_path, STATUS_FILE)
+    existing_content = None
+    if os.path.exists(status_path):
+        with open(status_path, 'r') as f:
+            existing_content = f.read()
+    
+    # Markdown first so the JSON is never older than the view rendered from it
+    atomic_write(status_path, render_session_status(state, existing_content))
+    atomic_write(os.path.join(project_path, STATE_FILE), json.dumps(state, indent=2) + "\n")
@@ -0,0 +1,221 @@
+"""
+State DB - Phase history and artifact manifests in .ai-sdlc/state.db
+
+Every phase a project enters is a row in the phase history. When a phase is
+left, the manifest of its artifacts is recorded with it: paths, sizes, mtimes
+and content hashes, never the content itself. Each transition is one SQLite
+transaction, so a crash leaves either the old or the new history.
+
+The phase itself belongs to .ai-sdlc/state.json. The database is a local,
+git-ignored index: AISDLCManager reconciles its open phase entry with
+state.json on load, so phase changes made elsewhere (validate, resume, a
+hand-edited SESSION-STATUS.md) are picked up, and a fresh clone simply
+starts a new history.
+"""
+
+import os
+import sqlite3
+from contextlib import closing, contextmanager
+from datetime import datetime
+
+from ai_sdlc import timings
+from ai_sdlc.fsutil import file_sha256
+
+DB_FILE = os.path.join(".ai-sdlc", "state.db")
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS phases (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    phase INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    entered_at TEXT NOT NULL,
+    left_at TEXT
+);
+CREATE TABLE IF NOT EXISTS artifacts (
+    entry INTEGER NOT NULL REFERENCES phases(id),
+    name TEXT NOT NULL,
+    source TEXT NOT NULL,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    PRIMARY KEY (entry, path)
+);
+CREATE INDEX IF NOT EXISTS artifacts_by_path ON artifacts (path, entry);
+"""
+
+
+def _now():
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+@contextmanager
+def connect(project_path):
+    """Open the state DB, creating its schema on first use; commits on success, rolls back on error"""
+    path = os.path.join(project_path, DB_FILE)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with closing(sqlite3.connect(path, timeout=30)) as db:
+        db.execute("PRAGMA synchronous = FULL")
+        with db:
+            db.executescript(SCHEMA)
+            db.execute("INSERT OR IGNORE INTO meta VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+        with db:
+            yield db
+
+
+def exists(project_path):
+    return os.path.isfile(os.path.join(project_path, DB_FILE))
+
+
+def _walk_files(project_path, relpath):
+    """Files under a project-relative path (itself when it is a file), skipping hidden entries"""
+    full_path = os.path.join(project_path, relpath)
+    if os.path.isfile(full_path):
+        yield relpath.replace(os.sep, "/")
+        return
+    for dirpath, dirnames, filenames in os.walk(full_path):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith(".") and d != "__pycache__")
+        for filename in sorted(filenames):
+            if not filename.startswith("."):
+                yield os.path.relpath(os.path.join(dirpath, filename), project_path).replace(os.sep, "/")
+
+
+def _known_hashes(db, paths):
+    """Latest recorded [size, mtime_ns, sha256] of each path"""
+    known = {}
+    for path in paths:
+        row = db.execute("SELECT size, mtime_ns, sha256 FROM artifacts WHERE path = ? ORDER BY entry DESC LIMIT 1",
+                         (path,)).fetchone()
+        if row:
+            known[path] = row
+    return known
+
+
+def build_manifest(db, project_path, artifacts):
+    """Manifest rows (name, source, path, size, mtime_ns, sha256) of artifacts {name: project-relative path}
+    
+    Folders are expanded to their files. Files whose size and mtime match their
+    last recorded row keep that hash without being read.
+    """
+    files = []
+    for name, source in artifacts.items():
+        if not isinstance(source, str) or not os.path.exists(os.path.join(project_path, source)):
+            continue
+        files.extend((name, source, path) for path in _walk_files(project_path, source))
+    known = _known_hashes(db, [path for _, _, path in files])
+    
+    rows = {}
+    for name, source, path in files:
+        try:
+            stat = os.stat(os.path.join(project_path, path))
+        except OSError:
+            continue
+        cached = known.get(path)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            digest = cached[2]
+        else:
+            digest = file_sha256(os.path.join(project_path, path))
+        rows[path] = (name, source, path, stat.st_size, stat.st_mtime_ns, digest)
+    return list(rows.values())
+
+
+@timings.traced()
+def record_transition(project_path, phase, name, artifacts, next_phase=None, next_name=None):
+    """Close the current phase entry with its artifact manifest and enter the next phase, in one transaction
+    
+    With next_phase None the phase is left without entering another (project
+    complete). Returns the number of files in the manifest.
+    """
+    with connect(project_path) as db:
+        row = db.execute("SELECT id, phase FROM phases WHERE left_at IS NULL ORDER BY id DESC LIMIT 1").fetchone()
+        if row is None or row[1] != phase:
+            entry = db.execute("INSERT INTO phases (phase, name, entered_at) VALUES (?, ?, ?)",
+                               (phase, name, _now())).lastrowid
+        else:
+            entry = row[0]
+        rows = build_manifest(db, project_path, artifacts)
+        db.executemany("INSERT OR REPLACE INTO artifacts VALUES (?, ?, ?, ?, ?, ?, ?)",
+                       [(entry,) + manifest_row for manifest_row in rows])
+        db.execute("UPDATE phases SET left_at = ? WHERE left_at IS NULL", (_now(),))
+        if next_phase is not None:
+            db.execute("INSERT INTO phases (phase, name, entered_at) VALUES (?, ?, ?)",
+                       (next_phase, next_name, _now()))
+    return len(rows)
+
+
+def enter_phase(project_path, phase, name):
+    """Record entering a phase unless it is already the open entry"""
+    with connect(project_path) as db:
+        row = db.execute("SELECT phase FROM phases WHERE left_at IS NULL ORDER BY id DESC LIMIT 1").fetchone()
+        if row is None or row[0] != phase:
+            db.execute("UPDATE phases SET left_at = ? WHERE left_at IS NULL", (_now(),))
+            db.execute("INSERT INTO phases (phase, name, entered_at) VALUES (?, ?, ?)", (phase, name, _now()))
+
+
+def phase_history(project_path):
+    """Phase entries, oldest first, as [{phase, name, entered_at, left_at, artifacts}]"""
+    if not exists(project_path):
+        return []
+    with connect(project_path) as db:
+        rows = db.execute("SELECT p.id, p.phase, p.name, p.entered_at, p.left_at, COUNT(a.path) "
+                          "FROM phases p LEFT JOIN artifacts a ON a.entry = p.id "
+                          "GROUP BY p.id ORDER BY p.id").fetchall()
+    return [{"phase": phase, "name": name, "entered_at": entered_at, "left_at": left_at, "artifacts": count}
+            for _, phase, name, entered_at, left_at, count in rows]
+
+
+def recorded_artifacts(project_path):
+    """Artifacts {phase name: {name: source}} recorded per phase"""
+    if not exists(project_path):
+        return {}
+    with connect(project_path) as db:
+        artifacts = {}
+        for phase_name, name, source in db.execute(
+                "SELECT DISTINCT p.name, a.name, a.source FROM artifacts a JOIN phases p ON p.id = a.entry "
+                "ORDER BY a.entry"):
+            artifacts.setdefault(phase_name, {})[name] = source
+    return artifacts
+
+
+@timings.traced()
+def changed_since(project_path, phase, check_files=False):
+    """Artifacts that changed after a phase was left, as {added, changed, removed}
+    
+    Compares the manifest as of the last time `phase` was left with the latest
+    recorded manifests, without touching the project files. With check_files,
+    the recorded paths are also compared with the files on disk (stat first,
+    hashing only files whose size or mtime moved).
+    """
+    result = {"phase": phase, "completed": False, "added": [], "changed": [], "removed": [], "recorded": 0}
+    if not exists(project_path):
+        return result
+    latest_row = ("SELECT a.path, a.sha256, a.size, a.mtime_ns FROM artifacts a WHERE a.entry = "
+                  "(SELECT MAX(b.entry) FROM artifacts b WHERE b.path = a.path AND b.entry <= ?)")
+    with connect(project_path) as db:
+        entry = db.execute("SELECT MAX(id) FROM phases WHERE phase = ? AND left_at IS NOT NULL",
+                           (phase,)).fetchone()[0]
+        if entry is None:
+            return result
+        baseline = {path: digest for path, digest, _, _ in db.execute(latest_row, (entry,))}
+        latest = {path: (digest, size, mtime_ns)
+                  for path, digest, size, mtime_ns in db.execute(latest_row, (2 ** 62,))}
+    result.update(completed=True, recorded=len(baseline))
+    
+    for path, (digest, size, mtime_ns) in sorted(latest.items()):
+        if check_files:
+            full_path = os.path.join(project_path, path)
+            try:
+                stat = os.stat(full_path)
+            except OSError:
+                if path in baseline:
+                    result["removed"].append(path)
+                continue
+            if (stat.st_size, stat.st_mtime_ns) != (size, mtime_ns):
+                digest = file_sha256(full_path)
+        if path not in baseline:
+            result["added"].append(path)
+        elif digest != baseline[path]:
+            result["changed"].append(path)
+    return result
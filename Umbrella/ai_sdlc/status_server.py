@@ -0,0 +1,292 @@
+"""
+Status Server - Long-running local JSON status service for many projects
+
+Keeps the phase, progress, gate result and component states of every project
+in a workspace in memory. A background thread checks each project's file
+signature every few seconds: the state files, the current phase's required
+artifacts, the component roots and component folders, and the recorded test
+results. A few stats per project replace reading and rescanning, and only
+projects whose signature moved are evaluated again. Test results can go
+stale through edits deep inside a component, so every project is also
+re-evaluated after MAX_AGE seconds.
+
+Responses are encoded once per change and carry a strong ETag, so a poll
+with a matching If-None-Match is answered with 304 from memory.
+
+    GET /projects        summary of every project
+    GET /projects/<id>   full status of one project
+    GET /health          server state (not cached)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+from ai_sdlc import timings
+from ai_sdlc.component_index import COMPONENT_ROOTS
+from ai_sdlc.rule_store import registered_projects
+from ai_sdlc.scaffold import component_slug
+from ai_sdlc.session_state import STATE_FILE, STATUS_FILE, load_state, phase_label
+from ai_sdlc.test_runner import RESULTS_FILE
+from ai_sdlc.validation import PHASE_REQUIREMENTS, component_label, component_records, evaluate_phase
+from ai_sdlc.workspace import discover_projects
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+INTERVAL = 2.0
+REDISCOVER_INTERVAL = 30.0
+MAX_AGE = 60.0
+
+# Fields of a project's status repeated in the /projects summary
+SUMMARY_FIELDS = ("id", "name", "path", "phase", "phase_label", "progress", "passed", "component_counts", "error")
+
+
+def _stat_key(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def project_signature(project_path, phase):
+    """Stat-only fingerprint of everything a project's status is computed from"""
+    paths = [STATE_FILE, STATUS_FILE, RESULTS_FILE] + list(COMPONENT_ROOTS.values())
+    paths += [item.rstrip("/") for item in PHASE_REQUIREMENTS.get(phase, [])]
+    signature = [_stat_key(os.path.join(project_path, path)) for path in paths]
+    # A component folder's mtime moves when its src/, tests/ or docs/ come or go,
+    # and theirs when they stop (or start) being empty
+    components = []
+    try:
+        with os.scandir(os.path.join(project_path, COMPONENT_ROOTS["development"])) as entries:
+            for entry in entries:
+                if entry.is_dir() and not entry.name.startswith("."):
+                    components.append((entry.name, entry.stat().st_mtime_ns, _folder_mtimes(entry.path)))
+    except OSError:
+        pass
+    signature.extend(sorted(components))
+    return tuple(signature)
+
+
+def _folder_mtimes(path):
+    try:
+        with os.scandir(path) as entries:
+            return tuple(sorted((entry.name, entry.stat().st_mtime_ns) for entry in entries if entry.is_dir()))
+    except OSError:
+        return ()
+
+
+@timings.traced()
+def project_summary(project_path, project_id):
+    """Status record of one project: state, gate result and component labels"""
+    status = {"id": project_id, "name": None, "path": os.path.abspath(project_path), "phase": None,
+              "phase_label": None, "progress": None, "last_task": None, "passed": False, "missing": [],
+              "issues": {}, "components": {}, "component_counts": {}, "error": None}
+    try:
+        state = load_state(project_path)
+        if state is None:
+            status["error"] = "No SESSION-STATUS.md found"
+            return status
+        gate = evaluate_phase(project_path)
+        records = component_records(project_path)
+    except (OSError, ValueError) as e:
+        status["error"] = str(e)
+        return status
+    
+    labels = {name: component_label(record) or "not started" for name, record in sorted(records.items())}
+    counts = {}
+    for label in labels.values():
+        counts[label] = counts.get(label, 0) + 1
+    status.update(name=state.get("project", {}).get("name"), phase=gate["phase"],
+                  phase_label=phase_label(gate["phase"]) if gate["phase"] else None,
+                  progress=state.get("progress"), last_task=state.get("last_task"), passed=gate["passed"],
+                  missing=gate["missing"], issues=gate["issues"], components=labels, component_counts=counts,
+                  error=gate["error"])
+    return status
+
+
+def encode(data):
+    """JSON body and strong ETag of a response"""
+    body = json.dumps(data, indent=2, sort_keys=True).encode("utf-8") + b"\n"
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"', body
+
+
+def etag_matches(header, etag):
+    """Whether an If-None-Match header matches an ETag (weak comparison, as RFC 9110 requires)"""
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+def _project_ids(paths):
+    """Readable, unique ids from the project folder names, in path order"""
+    ids = {}
+    for path in sorted(paths):
+        base = component_slug(os.path.basename(os.path.normpath(path))) or "project"
+        project_id = base
+        number = 2
+        while project_id in ids:
+            project_id = f"{base}-{number}"
+            number += 1
+        ids[project_id] = path
+    return ids
+
+
+class StatusIndex:
+    """In-memory status of every project, refreshed incrementally"""
+    
+    def __init__(self, roots=None, max_age=MAX_AGE):
+        self.roots = roots
+        self.max_age = max_age
+        self.lock = threading.Lock()
+        self.projects = {}
+        self.entries = {}
+        self.listing = encode({"projects": []})
+        self.refreshed_at = None
+        self.evaluations = 0
+    
+    def discover(self):
+        """Re-read the project list: projects under the roots, or every registered project"""
+        paths = discover_projects(self.roots) if self.roots else registered_projects()
+        self.projects = _project_ids(paths)
+    
+    @timings.traced("StatusIndex.refresh")
+    def refresh(self, rediscover=False):
+        """Re-evaluate projects whose signature moved (or that are older than max_age); returns how many changed"""
+        if rediscover or not self.refreshed_at:
+            self.discover()
+        now = time.monotonic()
+        entries = {}
+        changed = 0
+        for project_id, path in self.projects.items():
+            entry = self.entries.get(project_id)
+            if entry and entry["path"] != path:
+                entry = None  # The id went to another project when the list was re-read
+            phase = entry["status"]["phase"] if entry else None
+            signature = project_signature(path, phase)
+            if entry and entry["signature"] == signature and now - entry["checked"] < self.max_age:
+                entries[project_id] = entry
+                continue
+            
+            status = project_summary(path, project_id)
+            self.evaluations += 1
+            if status["phase"] != phase:
+                signature = project_signature(path, status["phase"])
+            etag, body = encode(status)
+            entries[project_id] = {"path": path, "signature": signature, "checked": now, "status": status,
+                                   "etag": etag, "body": body}
+            if not entry or entry["etag"] != etag:
+                changed += 1
+        
+        listing = self.listing
+        if changed or entries.keys() != self.entries.keys():
+            listing = encode({"projects": [{field: entry["status"][field] for field in SUMMARY_FIELDS}
+                                           for entry in entries.values()]})
+        with self.lock:
+            self.entries = entries
+            self.listing = listing
+            self.refreshed_at = time.time()
+        return changed
+    
+    def project(self, project_id):
+        """(etag, body) of one project, or None when it is unknown"""
+        with self.lock:
+            entry = self.entries.get(project_id)
+        return (entry["etag"], entry["body"]) if entry else None
+    
+    def health(self):
+        with self.lock:
+            return {"ok": True, "projects": len(self.entries), "evaluations": self.evaluations,
+                    "refreshed_at": self.refreshed_at}
+
+
+def _refresh_loop(index, stop, interval, rediscover_interval):
+    """Refresh the index every `interval` seconds until stop is set"""
+    last_discovery = time.monotonic()
+    while not stop.wait(interval):
+        rediscover = time.monotonic() - last_discovery >= rediscover_interval
+        if rediscover:
+            last_discovery = time.monotonic()
+        try:
+            index.refresh(rediscover)
+        except Exception as e:  # Keep serving the last good index
+            print(f"⚠️  Status refresh failed: {e}")
+
+
+def make_handler(index, verbose=False):
+    """Request handler class serving `index`"""
+    class StatusHandler(BaseHTTPRequestHandler):
+        server_version = "ai-sdlc-status/1"
+        protocol_version = "HTTP/1.1"  # Keep-alive, so a dashboard's polls reuse one connection
+        
+        def do_GET(self):
+            path = unquote(urlsplit(self.path).path).rstrip("/") or "/"
+            if path in ("/", "/projects"):
+                with index.lock:
+                    response = index.listing
+            elif path.startswith("/projects/"):
+                response = index.project(path[len("/projects/"):])
+                if response is None:
+                    self._send(404, encode({"error": f"Unknown project: {path[len('/projects/'):]}"})[1])
+                    return
+            elif path == "/health":
+                self._send(200, encode(index.health())[1])
+                return
+            else:
+                self._send(404, encode({"error": f"Not found: {path}"})[1])
+                return
+            
+            etag, body = response
+            if etag_matches(self.headers.get("If-None-Match"), etag):
+                self._send(304, None, etag)
+            else:
+                self._send(200, body, etag)
+        
+        def _send(self, code, body, etag=None):
+            self.send_response(code)
+            if etag:
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", "no-cache")
+            if body is not None:
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if body is not None:
+                self.wfile.write(body)
+        
+        def log_message(self, format, *args):
+            if verbose:
+                super().log_message(format, *args)
+    
+    return StatusHandler
+
+
+def serve_status(roots=None, host=DEFAULT_HOST, port=DEFAULT_PORT, interval=INTERVAL,
+                 rediscover_interval=REDISCOVER_INTERVAL, max_age=MAX_AGE, verbose=False):
+    """Index the projects and serve their status until interrupted"""
+    index = StatusIndex(roots, max_age)
+    started = time.perf_counter()
+    index.refresh()
+    print(f"📡 Indexed {len(index.entries)} project(s) in {time.perf_counter() - started:.2f}s")
+    
+    server = ThreadingHTTPServer((host, port), make_handler(index, verbose))
+    server.daemon_threads = True
+    stop = threading.Event()
+    refresher = threading.Thread(target=_refresh_loop, args=(index, stop, interval, rediscover_interval),
+                                 name="status-refresh", daemon=True)
+    refresher.start()
+    print(f"🌐 Serving project status on http://{host}:{server.server_address[1]}/projects (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n🛑 Status server stopped")
+    finally:
+        stop.set()
+        server.server_close()
+    return True
@@ -0,0 +1,273 @@
+"""
+Test Runner - Per-component test runs for the Test→Deploy gate (Phase 5)
+
+Each component's tests (4-Development/components/<name>/ and
+5-Testing/component-tests/<name>/) run as their own subprocess, several at a
+time. Results are recorded in .ai-sdlc/cache/test-results.json with the
+content hash of the component's files and the command used. A component whose
+hash and command match its last green run is not run again. A component
+counts as ready for deployment only while its last green run still matches
+its files.
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+import shlex
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from ai_sdlc import timings
+from ai_sdlc.component_index import CACHE_DIR, COMPONENT_ROOTS
+from ai_sdlc.fsutil import atomic_write, locked
+
+RESULTS_FILE = os.path.join(CACHE_DIR, "test-results.json")
+RESULTS_VERSION = 1
+
+DEFAULT_TIMEOUT = 600
+OUTPUT_TAIL_LINES = 20
+
+# Folders that never hold test inputs
+SKIPPED_DIRS = {"__pycache__", "node_modules", ".pytest_cache", ".venv", "venv", "dist", "build"}
+
+
+def component_dirs(project_path, name):
+    """Development and testing folders of a component that exist"""
+    folders = [os.path.join(project_path, COMPONENT_ROOTS["development"], name),
+               os.path.join(project_path, COMPONENT_ROOTS["testing"], name)]
+    return [folder for folder in folders if os.path.isdir(folder)]
+
+
+def _walk_files(folder):
+    for dirpath, dirnames, filenames in os.walk(folder):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIPPED_DIRS and not d.startswith("."))
+        for filename in sorted(filenames):
+            if not filename.startswith("."):
+                yield os.path.join(dirpath, filename)
+
+
+def content_hash(project_path, name, file_cache):
+    """Hash of every source and test file of a component
+    
+    file_cache maps relative paths to [size, mtime_ns, sha256]. It is updated
+    in place, and files whose size and mtime are unchanged are not read again.
+    """
+    digest = hashlib.sha256()
+    for folder in component_dirs(project_path, name):
+        for path in _walk_files(folder):
+            relpath = os.path.relpath(path, project_path)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            cached = file_cache.get(relpath)
+            if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+                file_digest = cached[2]
+            else:
+                file_hash = hashlib.sha256()
+                with open(path, "rb") as f:
+                    for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                        file_hash.update(chunk)
+                file_digest = file_hash.hexdigest()
+                file_cache[relpath] = [stat.st_size, stat.st_mtime_ns, file_digest]
+            digest.update(f"{relpath}\0{file_digest}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def detect_commands(project_path, name, command=None):
+    """Commands that run a component's tests, as [(argv, cwd)]; empty when it has none
+    
+    Paths in the commands are relative to the project, so recorded commands do
+    not change when the project moves. command is a shell-style string;
+    {component}, {src} and {tests} are replaced by the component name and its
+    folders.
+    """
+    development = os.path.join(COMPONENT_ROOTS["development"], name)
+    testing = os.path.join(COMPONENT_ROOTS["testing"], name)
+    test_dirs = [folder for folder in (os.path.join(development, "tests"), testing)
+                 if os.path.isdir(os.path.join(project_path, folder))]
+    
+    if command:
+        # Plain replacement, so other braces (${VAR}, JSON) pass through untouched
+        placeholders = {"{component}": name, "{src}": os.path.join(development, "src"),
+                        "{tests}": " ".join(test_dirs)}
+        argv = []
+        for part in shlex.split(command):
+            if part == "{tests}":
+                argv.extend(test_dirs)  # One argument per folder
+                continue
+            for placeholder, value in placeholders.items():
+                part = part.replace(placeholder, value)
+            argv.append(part)
+        return [(argv, project_path)]
+    
+    if os.path.isfile(os.path.join(project_path, development, "package.json")):
+        return [(["npm", "test", "--silent"], os.path.join(project_path, development))]
+    
+    python_dirs = [folder for folder in test_dirs
+                   if any(os.path.basename(path).startswith("test_") and path.endswith(".py")
+                          or path.endswith("_test.py") for path in _walk_files(os.path.join(project_path, folder)))]
+    if not python_dirs:
+        return []
+    if importlib.util.find_spec("pytest") is not None:
+        return [([sys.executable, "-m", "pytest", "-q", *python_dirs], project_path)]
+    return [([sys.executable, "-m", "unittest", "discover", "-s", folder, "-t", folder], project_path)
+            for folder in python_dirs]
+
+
+def _test_env(project_path, name):
+    """Environment with the component's src/ importable"""
+    env = dict(os.environ)
+    src = os.path.abspath(os.path.join(project_path, COMPONENT_ROOTS["development"], name, "src"))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src, env.get("PYTHONPATH")]))
+    return env
+
+
+def run_component(project_path, name, commands, timeout=DEFAULT_TIMEOUT):
+    """Run one component's test commands, returning its result record"""
+    record = {"status": "passed", "duration": 0.0, "returncode": 0,
+              "commands": [" ".join(argv) for argv, _ in commands],
+              "ran_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "output": []}
+    if not commands:
+        record.update(status="no_tests", returncode=None)
+        return record
+    
+    started = time.perf_counter()
+    output = []
+    with timings.span(f"test {name}", "component"):
+        for argv, cwd in commands:
+            try:
+                completed = timings.run(argv, cwd=cwd, env=_test_env(project_path, name), timeout=timeout,
+                                        stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                        stderr=subprocess.STDOUT, text=True, errors="replace")
+            except FileNotFoundError as e:
+                record.update(status="error", returncode=None)
+                output.append(f"Command not found: {e.filename}")
+                break
+            except subprocess.TimeoutExpired:
+                record.update(status="failed", returncode=None)
+                output.append(f"Timed out after {timeout}s: {' '.join(argv)}")
+                break
+            output.extend(completed.stdout.splitlines())
+            if completed.returncode != 0:
+                record.update(status="failed", returncode=completed.returncode)
+                break
+    record["duration"] = round(time.perf_counter() - started, 3)
+    record["output"] = output[-OUTPUT_TAIL_LINES:]
+    return record
+
+
+def _read_results(project_path):
+    try:
+        with open(os.path.join(project_path, RESULTS_FILE), 'r') as f:
+            results = json.load(f)
+    except (OSError, ValueError):
+        return {"version": RESULTS_VERSION, "components": {}, "files": {}}
+    if results.get("version") != RESULTS_VERSION:
+        return {"version": RESULTS_VERSION, "components": {}, "files": {}}
+    return results
+
+
+def _testing_components(project_path):
+    try:
+        with os.scandir(os.path.join(project_path, COMPONENT_ROOTS["testing"])) as entries:
+            return sorted(entry.name for entry in entries if entry.is_dir() and not entry.name.startswith("."))
+    except FileNotFoundError:
+        return []
+
+
+@timings.traced()
+def run_component_tests(project_path=".", names=None, jobs=None, force=False, command=None,
+                        timeout=DEFAULT_TIMEOUT):
+    """Run the tests of components in testing, skipping those unchanged since their last green run
+    
+    Returns {"components": {name: record}, "ran", "skipped", "passed", "failed"}.
+    Each record has "status" (passed, failed, error, no_tests), "duration",
+    "cached" and the tail of the output.
+    """
+    names = sorted(names) if names else _testing_components(project_path)
+    results = _read_results(project_path)
+    file_cache = results["files"]
+    
+    pending = []
+    records = {}
+    for name in names:
+        commands = detect_commands(project_path, name, command)
+        digest = content_hash(project_path, name, file_cache)
+        previous = results["components"].get(name)
+        command_key = [" ".join(argv) for argv, _ in commands]
+        if (not force and previous and previous["status"] == "passed" and previous["hash"] == digest
+                and previous["commands"] == command_key):
+            records[name] = dict(previous, cached=True)
+            continue
+        pending.append((name, commands, digest))
+    
+    # Each run is a subprocess, so threads only wait on them
+    jobs = jobs or os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(pending) or 1))) as pool:
+        finished = pool.map(lambda item: run_component(project_path, item[0], item[1], timeout), pending)
+        for (name, _, digest), record in zip(pending, finished):
+            record["hash"] = digest
+            records[name] = dict(record, cached=False)
+    
+    # Merge under a lock so concurrent runs on the same project keep each other's results
+    results_path = os.path.join(project_path, RESULTS_FILE)
+    with locked(results_path + ".lock"):
+        latest = _read_results(project_path)
+        latest["files"].update(file_cache)
+        for name, record in records.items():
+            if not record["cached"]:
+                latest["components"][name] = {key: value for key, value in record.items() if key != "cached"}
+        atomic_write(results_path, json.dumps(latest, indent=1))
+    
+    statuses = [record["status"] for record in records.values()]
+    return {
+        "project": project_path,
+        "components": records,
+        "ran": sum(1 for record in records.values() if not record["cached"]),
+        "skipped": sum(1 for record in records.values() if record["cached"]),
+        "passed": statuses.count("passed"),
+        "failed": len(statuses) - statuses.count("passed")
+    }
+
+
+def test_statuses(project_path, names):
+    """Last recorded status of each component: passed, failed, error, no_tests, stale or not_run"""
+    results = _read_results(project_path)
+    file_cache = dict(results["files"])
+    statuses = {}
+    for name in names:
+        previous = results["components"].get(name)
+        if not previous:
+            statuses[name] = "not_run"
+        elif previous["hash"] != content_hash(project_path, name, file_cache):
+            statuses[name] = "stale"
+        else:
+            statuses[name] = previous["status"]
+    return statuses
+
+
+@timings.traced()
+def passing_components(project_path, names):
+    """Components whose last recorded run passed and still matches their files (runs nothing)"""
+    statuses = test_statuses(project_path, names)
+    return [name for name in names if statuses[name] == "passed"]
+
+
+def print_test_report(report):
+    """Print per-component results of run_component_tests"""
+    icons = {"passed": "✅", "failed": "❌", "error": "⚠️ ", "no_tests": "❔"}
+    print(f"🧪 Component tests: {len(report['components'])} components "
+          f"({report['ran']} run, {report['skipped']} unchanged since last green run)")
+    for name, record in sorted(report["components"].items()):
+        note = " (cached)" if record["cached"] else ""
+        label = "no tests found" if record["status"] == "no_tests" else record["status"]
+        print(f"{icons[record['status']]} {name}: {label} in {record['duration']:.2f}s{note}")
+        if record["status"] in ("failed", "error") and not record["cached"]:
+            for line in record["output"][-5:]:
+                print(f"      {line}")
+    print(f"📊 Passed: {report['passed']}  Not passing: {report['failed']}")
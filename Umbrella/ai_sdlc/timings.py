@@ -0,0 +1,230 @@
+"""
+Timings - Opt-in span recording for the lifecycle scripts
+
+Enable with a script's --timings flag or the AI_SDLC_TIMINGS environment
+variable ("1" or a folder for the reports). Every traced step and git
+subprocess is recorded as a span; at exit the spans are written as JSON and as
+a Chrome trace (chrome://tracing, Perfetto) and summarized on stderr.
+
+When disabled, span() returns a shared no-op context, and traced() and run()
+add just one check per call.
+"""
+
+import atexit
+import functools
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from contextlib import nullcontext
+from datetime import datetime
+
+from ai_sdlc.fsutil import ai_sdlc_home, atomic_write
+
+ENV_VAR = "AI_SDLC_TIMINGS"
+
+_NULL_SPAN = nullcontext()
+_recorder = None
+
+
+class _Recorder:
+    """Collects finished spans from every thread of the process"""
+    
+    def __init__(self, output):
+        self.output = output
+        self.origin_ns = time.perf_counter_ns()
+        self.started_at = datetime.now().isoformat(timespec="seconds")
+        self.spans = []
+        self._local = threading.local()
+        self._threads = {}
+        self._lock = threading.Lock()
+    
+    def thread_index(self):
+        ident = threading.get_ident()
+        index = self._threads.get(ident)
+        if index is None:
+            with self._lock:
+                index = self._threads.setdefault(ident, len(self._threads))
+        return index
+    
+    def stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+
+class _Span:
+    """Context manager recording one span; yields its args dict for extra details"""
+    
+    __slots__ = ("name", "category", "args", "start_ns")
+    
+    def __init__(self, name, category, args):
+        self.name = name
+        self.category = category
+        self.args = args
+    
+    def __enter__(self):
+        _recorder.stack().append(self.name)
+        self.start_ns = time.perf_counter_ns()
+        return self.args
+    
+    def __exit__(self, exc_type, exc, tb):
+        end_ns = time.perf_counter_ns()
+        stack = _recorder.stack()
+        stack.pop()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        _recorder.spans.append({
+            "name": self.name,
+            "category": self.category,
+            "start_ms": (self.start_ns - _recorder.origin_ns) / 1e6,
+            "duration_ms": (end_ns - self.start_ns) / 1e6,
+            "thread": _recorder.thread_index(),
+            "depth": len(stack),
+            "parent": stack[-1] if stack else None,
+            "args": self.args
+        })
+        return False
+
+
+def enabled():
+    return _recorder is not None
+
+
+def enable(output=None):
+    """Start recording; reports are written at exit to output (a .json path) or the timings folder"""
+    global _recorder
+    if _recorder is None:
+        _recorder = _Recorder(output)
+        atexit.register(_finish)
+    return _recorder
+
+
+def enable_from_args(output):
+    """Enable recording for a --timings argument (None: flag not given, "": default location)"""
+    if output is not None:
+        enable(output or None)
+
+
+def span(name, category="step", **args):
+    """Record the enclosed block as a span (a shared no-op when timings are off)"""
+    if _recorder is None:
+        return _NULL_SPAN
+    return _Span(name, category, args)
+
+
+def traced(name=None, category="step"):
+    """Decorator recording each call of a function as a span"""
+    def decorator(func):
+        span_name = name or func.__qualname__
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _recorder is None:
+                return func(*args, **kwargs)
+            with _Span(span_name, category, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def command_name(args):
+    """Short span name for a command line, e.g. 'git commit'"""
+    args = list(args)
+    words = [os.path.basename(str(args[0]))] if args else []
+    words.extend(str(arg) for arg in args[1:2] if not str(arg).startswith("-"))
+    return " ".join(words)
+
+
+def run(args, **kwargs):
+    """subprocess.run, recorded as a subprocess span when timings are on"""
+    if _recorder is None:
+        return subprocess.run(args, **kwargs)
+    with _Span(command_name(args), "subprocess", {"argv": [str(arg) for arg in args],
+                                                  "cwd": kwargs.get("cwd")}) as details:
+        result = subprocess.run(args, **kwargs)
+        details["returncode"] = result.returncode
+    return result
+
+
+def summarize(spans):
+    """Aggregate spans by name: calls, inclusive total and maximum, slowest first"""
+    totals = {}
+    for record in spans:
+        entry = totals.setdefault(record["name"], {"name": record["name"], "category": record["category"],
+                                                    "calls": 0, "total_ms": 0.0, "max_ms": 0.0})
+        entry["calls"] += 1
+        entry["total_ms"] += record["duration_ms"]
+        entry["max_ms"] = max(entry["max_ms"], record["duration_ms"])
+    return sorted(totals.values(), key=lambda entry: entry["total_ms"], reverse=True)
+
+
+def chrome_trace(spans, pid=None):
+    """Convert spans to the Chrome trace-event format"""
+    pid = pid or os.getpid()
+    events = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": thread,
+               "args": {"name": "main" if thread == 0 else f"worker-{thread}"}}
+              for thread in sorted({record["thread"] for record in spans})]
+    for record in spans:
+        events.append({
+            "name": record["name"],
+            "cat": record["category"],
+            "ph": "X",
+            "ts": round(record["start_ms"] * 1000, 3),
+            "dur": round(record["duration_ms"] * 1000, 3),
+            "pid": pid,
+            "tid": record["thread"],
+            "args": record["args"]
+        })
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def _report_paths(output):
+    if output:
+        base = output[:-5] if output.endswith(".json") else output
+        return f"{base}.json", f"{base}.trace.json"
+    
+    folder = os.environ.get(ENV_VAR, "")
+    if folder in ("", "1"):
+        folder = os.path.join(ai_sdlc_home(), "timings")
+    script = os.path.splitext(os.path.basename(sys.argv[0] or "python"))[0]
+    base = os.path.join(folder, f"{script}-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{os.getpid()}")
+    return f"{base}.json", f"{base}.trace.json"
+
+
+def _finish():
+    """Write the reports and print the summary (registered with atexit)"""
+    recorder = _recorder
+    if recorder is None or not recorder.spans:
+        return
+    
+    spans = sorted(recorder.spans, key=lambda record: record["start_ms"])
+    total_ms = (time.perf_counter_ns() - recorder.origin_ns) / 1e6
+    json_path, trace_path = _report_paths(recorder.output)
+    try:
+        atomic_write(json_path, json.dumps({
+            "version": 1,
+            "script": os.path.basename(sys.argv[0] or ""),
+            "argv": sys.argv[1:],
+            "started_at": recorder.started_at,
+            "total_ms": round(total_ms, 3),
+            "summary": summarize(spans),
+            "spans": spans
+        }, indent=2, default=str))
+        atomic_write(trace_path, json.dumps(chrome_trace(spans), default=str))
+    except OSError as e:
+        print(f"⚠️  Could not write timings: {e}", file=sys.stderr)
+        return
+    
+    print(f"\n⏱️  Timings ({total_ms:.1f} ms total):", file=sys.stderr)
+    for entry in summarize(spans)[:15]:
+        print(f"   {entry['total_ms']:9.1f} ms  {entry['calls']:4d}x  {entry['name']}", file=sys.stderr)
+    print(f"   Report: {json_path}", file=sys.stderr)
+    print(f"   Chrome trace: {trace_path}", file=sys.stderr)
+
+
+if os.environ.get(ENV_VAR, "0") not in ("", "0"):
+    enable()
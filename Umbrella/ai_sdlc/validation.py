@@ -0,0 +1,485 @@
+"""
+Validation - Phase completion checks, component gates, watch mode and portfolios
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from ai_sdlc import timings
+from ai_sdlc.component_index import COMPONENT_ROOTS, load_component_index, scan_component
+from ai_sdlc.quality import check_artifacts
+from ai_sdlc.session_state import STATE_FILE, STATUS_FILE, load_state
+from ai_sdlc.test_runner import test_statuses
+from ai_sdlc.workspace import discover_projects
+
+
+# Phase requirements mapping
+PHASE_REQUIREMENTS = {
+    1: ["1-Planning/project-charter.md", "1-Planning/initial-timeline.md", "1-Planning/stakeholder-map.md"],
+    2: ["2-Requirements/requirements-specification.md", "2-Requirements/user-stories.md", "2-Requirements/acceptance-criteria.md"],
+    3: ["3-Design/system-architecture.md", "3-Design/database-schema.md", "3-Design/api-specifications.md", "3-Design/ui-flows.md", "3-Design/wireframes.md", "3-Design/data-interfaces.md"],
+    4: ["4-Development/components/", "4-Development/component-breakdown.md"],
+    5: ["5-Testing/component-tests/", "5-Testing/test-status.md"],
+    6: ["6-Deployment/deployed-components/", "6-Deployment/deployment-status.md"],
+    7: ["7-Maintenance/performance-reports.md", "7-Maintenance/user-feedback.md", "7-Maintenance/maintenance-log.md"]
+}
+
+
+@timings.traced()
+def evaluate_phase(project_path=".", phase_number=None):
+    """Evaluate phase completion without printing, returning a result record"""
+    result = {
+        "project": project_path,
+        "name": None,
+        "phase": None,
+        "passed": False,
+        "missing": [],
+        "issues": {},
+        "components": None,
+        "error": None
+    }
+    
+    # Get current phase from the project state
+    state = load_state(project_path)
+    if state is None:
+        result["error"] = "No SESSION-STATUS.md found"
+        return result
+    
+    result["name"] = state.get("project", {}).get("name")
+    current_phase = phase_number or state.get("phase")
+    if not current_phase:
+        result["error"] = "Could not determine current phase"
+        return result
+    result["phase"] = current_phase
+    
+    # Special handling for iterative phases 4-6
+    if current_phase >= 4 and current_phase <= 6:
+        components = summarize_components(get_component_status(project_path))
+        if current_phase == 5:
+            apply_test_results(project_path, components)
+        result["components"] = components
+        result["passed"] = iterative_gate_passed(current_phase, components)
+        return result
+    
+    # Check required files/folders for linear phases, then what is in them
+    result["missing"] = missing_requirements(project_path, current_phase)
+    result["issues"] = content_issues(project_path, current_phase)
+    result["passed"] = not result["missing"] and not result["issues"]
+    return result
+
+
+def missing_requirements(project_path, phase_number):
+    """Required files/folders of a linear phase that do not exist yet"""
+    return [item for item in PHASE_REQUIREMENTS.get(phase_number, [])
+            if not os.path.exists(os.path.join(project_path, item))]
+
+
+def content_issues(project_path, phase_number):
+    """Content problems of a linear phase's artifacts, as {path: [issues]}"""
+    return check_artifacts(project_path, PHASE_REQUIREMENTS.get(phase_number, []))
+
+
+def apply_test_results(project_path, components):
+    """Test→Deploy gate: only components whose recorded tests pass on their current files are ready"""
+    statuses = test_statuses(project_path, components["testing"])
+    components["tests"] = statuses
+    components["ready_for_deployment"] = [name for name in components["testing"] if statuses[name] == "passed"]
+    return components
+
+
+def iterative_gate_passed(phase_number, components):
+    """Check the gate of iterative phases 4-6 against summarized components"""
+    if phase_number == 4:
+        return len(components["ready_for_testing"]) > 0
+    elif phase_number == 5:
+        return len(components["ready_for_deployment"]) > 0
+    return len(components["deployed"]) > 0
+
+
+def validate_phase(project_path=".", phase_number=None):
+    """Validate current phase completion with iterative support"""
+    result = evaluate_phase(project_path, phase_number)
+    if result["error"]:
+        print(f"❌ {result['error']}")
+        return False
+    
+    current_phase = result["phase"]
+    print(f"🔍 Validating Phase {current_phase} completion...")
+    
+    if result["components"] is not None:
+        return report_iterative_phase(current_phase, result["components"])
+    
+    missing_items = result["missing"]
+    if missing_items:
+        print(f"❌ Phase {current_phase} incomplete. Missing:")
+        for item in missing_items:
+            print(f"   - {item}")
+    if result["issues"]:
+        print(f"❌ Phase {current_phase} content checks failed:")
+        for item, issues in result["issues"].items():
+            for issue in issues:
+                print(f"   - {item}: {issue}")
+    if missing_items or result["issues"]:
+        print(f"\n💡 Complete these items before advancing to Phase {current_phase + 1}")
+        return False
+    else:
+        print(f"✅ Phase {current_phase} validation passed!")
+        print(f"🚀 Ready to advance to Phase {current_phase + 1}")
+        return True
+
+
+def validate_iterative_phase(project_path, phase_number):
+    """Validate iterative phases 4-6 with component tracking"""
+    result = evaluate_phase(project_path, phase_number)
+    if result["error"] or result["components"] is None:
+        return False
+    return report_iterative_phase(phase_number, result["components"])
+
+
+def report_iterative_phase(phase_number, components):
+    """Print the component report for an iterative phase"""
+    if phase_number == 4:  # Development
+        return validate_development_components(components)
+    elif phase_number == 5:  # Testing
+        return validate_testing_components(components)
+    elif phase_number == 6:  # Deployment
+        return validate_deployment_components(components)
+
+
+def get_component_status(project_path):
+    """Get current status of all components across phases 4-6"""
+    index = load_component_index(project_path)
+    
+    status = {kind: sorted(components) for kind, components in index.items()}
+    
+    # Top-level entries of each development component, served from the index
+    status["structure"] = index["development"]
+    
+    return status
+
+
+def summarize_components(component_status):
+    """Classify components against the Dev→Test and Test→Deploy gates"""
+    structure = component_status.get("structure", {})
+    ready_for_testing = []
+    in_development = []
+    
+    for component in component_status["development"]:
+        # Check if component has required structure (empty folders are not listed)
+        entries = structure.get(component, ())
+        if "src" in entries and "tests" in entries and "docs" in entries:
+            ready_for_testing.append(component)
+        else:
+            in_development.append(component)
+    
+    # Every indexed testing component exists on disk
+    ready_for_deployment = list(component_status["testing"])
+    
+    return {
+        "development": component_status["development"],
+        "testing": component_status["testing"],
+        "deployed": component_status["deployed"],
+        "ready_for_testing": ready_for_testing,
+        "in_development": in_development,
+        "ready_for_deployment": ready_for_deployment
+    }
+
+
+def validate_development_components(components):
+    """Validate development phase components"""
+    ready_for_testing = components["ready_for_testing"]
+    in_development = components["in_development"]
+    
+    print(f"🔄 Phase 4: Development (Iterative)")
+    print(f"📦 Components ready for testing: {len(ready_for_testing)}")
+    print(f"🚧 Components in development: {len(in_development)}")
+    
+    if ready_for_testing:
+        print(f"✅ Ready components: {', '.join(ready_for_testing)}")
+        print(f"🚀 Move these to Phase 5 (Testing)")
+    
+    return len(ready_for_testing) > 0
+
+
+def validate_testing_components(components):
+    """Validate testing phase components"""
+    testing_components = components["testing"]
+    ready_for_deployment = components["ready_for_deployment"]
+    
+    print(f"🧪 Phase 5: Testing (Iterative)")
+    print(f"✅ Components ready for deployment: {len(ready_for_deployment)}")
+    print(f"🔬 Components in testing: {len(testing_components) - len(ready_for_deployment)}")
+    
+    if ready_for_deployment:
+        print(f"🚀 Ready for deployment: {', '.join(ready_for_deployment)}")
+    
+    tests = components.get("tests", {})
+    waiting = [name for name in testing_components if name not in ready_for_deployment]
+    if tests and waiting:
+        print(f"⏳ Tests not passing: {', '.join(f'{name} ({tests[name]})' for name in waiting)}")
+        print(f"💡 Run: python ../Umbrella/ai-sdlc.py test")
+    
+    return len(ready_for_deployment) > 0
+
+
+def validate_deployment_components(components):
+    """Validate deployment phase components"""
+    deployed_components = components["deployed"]
+    total_components = len(components["development"]) + len(components["testing"]) + len(deployed_components)
+    
+    print(f"🚀 Phase 6: Deployment (Iterative)")
+    print(f"✅ Deployed components: {len(deployed_components)}")
+    print(f"📊 Total components: {total_components}")
+    
+    if deployed_components:
+        print(f"🎉 Live components: {', '.join(deployed_components)}")
+    
+    return len(deployed_components) > 0
+
+
+def _evaluate_project(project_path, phase_number):
+    """Evaluate one portfolio project, turning unexpected failures into errors"""
+    try:
+        return evaluate_phase(project_path, phase_number)
+    except (OSError, ValueError) as e:
+        return {"project": project_path, "name": None, "phase": None, "passed": False,
+                "missing": [], "issues": {}, "components": None, "error": str(e)}
+
+
+@timings.traced()
+def validate_portfolio(roots, phase_number=None, workers=None):
+    """Validate every project under the given roots concurrently"""
+    projects = discover_projects(roots)
+    
+    # Validation is filesystem-bound, so threads overlap the I/O without process spawns
+    workers = workers or min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(lambda project: _evaluate_project(project, phase_number), projects))
+    
+    by_phase = {}
+    for result in results:
+        if result["phase"]:
+            by_phase[str(result["phase"])] = by_phase.get(str(result["phase"]), 0) + 1
+    
+    return {
+        "projects": results,
+        "summary": {
+            "total": len(results),
+            "passed": sum(1 for result in results if result["passed"]),
+            "failed": sum(1 for result in results if not result["passed"] and not result["error"]),
+            "errors": sum(1 for result in results if result["error"]),
+            "by_phase": by_phase
+        }
+    }
+
+
+def print_portfolio_report(report):
+    """Print the aggregated portfolio report"""
+    print(f"🗂️  Portfolio Validation: {report['summary']['total']} projects")
+    print("=" * 60)
+    
+    for result in report["projects"]:
+        name = result["name"] or os.path.basename(os.path.normpath(result["project"]))
+        label = f"{name} ({result['project']})"
+        if result["error"]:
+            print(f"⚠️  {label}: {result['error']}")
+            continue
+        
+        icon = "✅" if result["passed"] else "❌"
+        line = f"{icon} {label}: Phase {result['phase']}"
+        components = result["components"]
+        if components is not None:
+            line += (f" | dev {len(components['development'])}, test {len(components['testing'])}, "
+                     f"deployed {len(components['deployed'])}")
+        print(line)
+        for item in result["missing"]:
+            print(f"   - missing {item}")
+        for item, issues in result["issues"].items():
+            print(f"   - {item}: {'; '.join(issues)}")
+    
+    summary = report["summary"]
+    print("=" * 60)
+    print(f"📊 Passed: {summary['passed']}  Failed: {summary['failed']}  Errors: {summary['errors']}")
+
+
+def _component_record(project_path, name):
+    """Read one component's folders across phases 4-6"""
+    record = {}
+    for status, root in COMPONENT_ROOTS.items():
+        path = os.path.join(project_path, root, name)
+        if status == "development":
+            try:
+                record[status] = scan_component(path)[0]
+            except (FileNotFoundError, NotADirectoryError):
+                record[status] = None
+        else:
+            record[status] = os.path.isdir(path)
+    return record
+
+
+def component_records(project_path):
+    """Per-component records for every component, served from the component index"""
+    index = load_component_index(project_path)
+    names = set(index["development"]) | set(index["testing"]) | set(index["deployed"])
+    return {name: {"development": index["development"].get(name),
+                   "testing": name in index["testing"],
+                   "deployed": name in index["deployed"]} for name in names}
+
+
+def component_label(record):
+    """Lifecycle label of a component record, or None when it no longer exists"""
+    if record is None:
+        return None
+    if record["deployed"]:
+        return "deployed"
+    if record["testing"]:
+        return "ready for deployment"
+    entries = record["development"]
+    if entries is None:
+        return None
+    # Empty folders are not listed, so a fresh skeleton stays "in development"
+    if "src" in entries and "tests" in entries and "docs" in entries:
+        return "ready for testing"
+    return "in development"
+
+
+def _summarize_records(records):
+    """Summarize component records the way the Dev→Test and Test→Deploy gates expect"""
+    development = sorted(name for name, record in records.items() if record["development"] is not None)
+    return summarize_components({
+        "development": development,
+        "testing": sorted(name for name, record in records.items() if record["testing"]),
+        "deployed": sorted(name for name, record in records.items() if record["deployed"]),
+        "structure": {name: records[name]["development"] for name in development}
+    })
+
+
+def _changed_components(changes):
+    """Map changed paths to the components they belong to (None: a whole root changed)"""
+    roots = [os.path.normpath(root) for root in COMPONENT_ROOTS.values()]
+    names = set()
+    for path in changes:
+        for root in roots:
+            if path.startswith(root + os.sep):
+                name = path[len(root) + 1:].split(os.sep, 1)[0]
+                if not name.startswith("."):
+                    names.add(name)
+            elif root == path or root.startswith(path + os.sep):
+                return None
+    return names
+
+
+def watch_phase(project_path=".", phase_number=None, debounce=0.5, poll_interval=1.0):
+    """Re-validate whenever project files change, printing only status transitions"""
+    result = evaluate_phase(project_path, phase_number)
+    if result["error"]:
+        print(f"❌ {result['error']}")
+        return False
+    
+    from ai_sdlc.watcher import EVERYTHING, create_watcher
+    
+    watcher = create_watcher(project_path, poll_interval)
+    validate_phase(project_path, phase_number)
+    
+    phase = result["phase"]
+    records = component_records(project_path)
+    missing = missing_requirements(project_path, phase)
+    issues = content_issues(project_path, phase)
+    passed = _watch_gate(project_path, phase, records, missing, issues)
+    
+    print(f"\n👀 Watching {os.path.abspath(project_path)} ({watcher.backend}), press Ctrl+C to stop")
+    pending = set()
+    last_event = 0.0
+    try:
+        while True:
+            changes = watcher.read_changes(timeout=debounce if pending else 1.0)
+            if changes:
+                pending |= changes
+                last_event = time.monotonic()
+                continue
+            if not pending or time.monotonic() - last_event < debounce:
+                continue
+            
+            # A burst of events has settled: re-check only what it touched
+            changes, pending = pending, set()
+            stamp = datetime.now().strftime("%H:%M:%S")
+            everything = EVERYTHING in changes
+            
+            if everything or STATUS_FILE in changes or os.path.normpath(STATE_FILE) in changes:
+                new_phase = evaluate_phase(project_path, phase_number)["phase"]
+                if new_phase and new_phase != phase:
+                    print(f"[{stamp}] 📍 Phase {phase} → Phase {new_phase}")
+                    phase = new_phase
+                    missing = None
+            
+            names = None if everything else _changed_components(changes)
+            if names is None:
+                updated = component_records(project_path)
+            else:
+                updated = dict(records)
+                for name in names:
+                    record = _component_record(project_path, name)
+                    if component_label(record) is None:
+                        updated.pop(name, None)
+                    else:
+                        updated[name] = record
+            
+            for name in sorted(set(records) | set(updated)):
+                before = component_label(records.get(name))
+                after = component_label(updated.get(name))
+                if before == after:
+                    continue
+                if before is None:
+                    print(f"[{stamp}] ➕ component {name}: {after}")
+                elif after is None:
+                    print(f"[{stamp}] ➖ component {name}: removed")
+                else:
+                    print(f"[{stamp}] 🔄 component {name}: {before} → {after}")
+            records = updated
+            
+            # Linear phases: only recheck requirements when their phase folder was touched
+            if phase in PHASE_REQUIREMENTS and not 4 <= phase <= 6:
+                folder = PHASE_REQUIREMENTS[phase][0].split("/", 1)[0]
+                if missing is None:  # New phase: the gate line below reports it
+                    missing = missing_requirements(project_path, phase)
+                    issues = content_issues(project_path, phase)
+                elif everything or any(path.split(os.sep, 1)[0] == folder for path in changes):
+                    previous, missing = missing, missing_requirements(project_path, phase)
+                    for item in sorted(set(previous) - set(missing)):
+                        print(f"[{stamp}] ✅ {item} created")
+                    for item in sorted(set(missing) - set(previous)):
+                        print(f"[{stamp}] ❌ {item} missing")
+                    
+                    previous_issues, issues = issues, content_issues(project_path, phase)
+                    for item in sorted(set(previous_issues) | set(issues)):
+                        if previous_issues.get(item) == issues.get(item):
+                            continue
+                        if item in issues:
+                            print(f"[{stamp}] ⚠️  {item}: {'; '.join(issues[item])}")
+                        elif item not in missing:
+                            print(f"[{stamp}] ✅ {item} content checks pass")
+            
+            now_passed = _watch_gate(project_path, phase, records, missing, issues)
+            if now_passed != passed:
+                if now_passed:
+                    print(f"[{stamp}] ✅ Phase {phase} validation passed! Ready to advance to Phase {phase + 1}")
+                else:
+                    print(f"[{stamp}] ❌ Phase {phase} no longer passes validation")
+                passed = now_passed
+    except KeyboardInterrupt:
+        print("\n👋 Watch stopped")
+    finally:
+        watcher.close()
+    return passed
+
+
+def _watch_gate(project_path, phase, records, missing, issues):
+    """Gate result from the watcher's in-memory view of the project"""
+    if 4 <= phase <= 6:
+        components = _summarize_records(records)
+        if phase == 5:
+            apply_test_results(project_path, components)
+        return iterative_gate_passed(phase, components)
+    return not missing and not issues
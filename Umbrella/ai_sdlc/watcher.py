@@ -0,0 +1,196 @@
+"""
+File Watcher - inotify (via ctypes) with a portable polling fallback
+
+Both watchers report changed paths relative to the project root. The special
+path "." means events were lost (queue overflow) and everything may have changed.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import stat as stat_module
+import struct
+import time
+
+# Never watched: Git internals and the framework's own caches
+EXCLUDED_PATHS = {".git", os.path.join(".ai-sdlc", "cache")}
+
+EVERYTHING = "."
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+              IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def is_excluded(relpath):
+    """Check whether a project-relative path is outside the watched set"""
+    for excluded in EXCLUDED_PATHS:
+        if relpath == excluded or relpath.startswith(excluded + os.sep):
+            return True
+    return False
+
+
+class InotifyWatcher:
+    """Recursive watcher built on Linux inotify, one watch per directory"""
+    
+    backend = "inotify"
+    
+    def __init__(self, root):
+        libc_name = ctypes.util.find_library("c")
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify is not available on this platform")
+        
+        self._libc = libc
+        self.root = os.path.abspath(root)
+        self._fd = libc.inotify_init1(IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._watches = {}
+        self._add_tree("")
+    
+    def _add_watch(self, relpath):
+        path = os.path.join(self.root, relpath) if relpath else self.root
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            if errno in (2, 20):  # ENOENT, ENOTDIR: vanished before we got to it
+                return
+            raise OSError(errno, f"inotify_add_watch failed for {path}")
+        self._watches[wd] = relpath
+    
+    def _add_tree(self, relpath):
+        """Watch a directory and everything below it"""
+        stack = [relpath]
+        while stack:
+            current = stack.pop()
+            if is_excluded(current):
+                continue
+            self._add_watch(current)
+            try:
+                with os.scandir(os.path.join(self.root, current) if current else self.root) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(os.path.join(current, entry.name) if current else entry.name)
+            except OSError:
+                continue
+    
+    def read_changes(self, timeout=1.0):
+        """Wait up to timeout seconds and return the set of changed relative paths"""
+        changes = set()
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        while ready:
+            self._parse_events(os.read(self._fd, 256 * 1024), changes)
+            ready, _, _ = select.select([self._fd], [], [], 0)
+        return changes
+    
+    def _parse_events(self, data, changes):
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+            offset += length
+            
+            if mask & IN_Q_OVERFLOW:
+                changes.add(EVERYTHING)
+                continue
+            if mask & IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            
+            parent = self._watches.get(wd)
+            if parent is None:
+                continue
+            relpath = os.path.join(parent, name) if parent and name else (name or parent)
+            if not relpath or is_excluded(relpath):
+                continue
+            changes.add(relpath)
+            
+            # New directories (created or moved in) need watches of their own
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                self._add_tree(relpath)
+    
+    def close(self):
+        os.close(self._fd)
+
+
+class PollingWatcher:
+    """Portable watcher comparing (mtime, size, mode) snapshots of the tree"""
+    
+    backend = "polling"
+    
+    def __init__(self, root, interval=1.0):
+        self.root = os.path.abspath(root)
+        self.interval = interval
+        self._snapshot = self._scan()
+    
+    def _scan(self):
+        self._scanned_at = time.monotonic()
+        snapshot = {}
+        stack = [""]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(os.path.join(self.root, current) if current else self.root) as entries:
+                    for entry in entries:
+                        relpath = os.path.join(current, entry.name) if current else entry.name
+                        if is_excluded(relpath):
+                            continue
+                        try:
+                            stat = entry.stat(follow_symlinks=False)
+                        except OSError:
+                            continue
+                        snapshot[relpath] = (stat.st_mtime_ns, stat.st_size, stat.st_mode)
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(relpath)
+            except OSError:
+                continue
+        return snapshot
+    
+    def read_changes(self, timeout=1.0):
+        """Rescan once the polling interval has elapsed (timeout=0 forces a scan)"""
+        if timeout > 0:
+            remaining = self._scanned_at + self.interval - time.monotonic()
+            time.sleep(max(0, min(remaining, timeout)))
+            if time.monotonic() < self._scanned_at + self.interval:
+                return set()
+        
+        snapshot = self._scan()
+        previous = self._snapshot
+        self._snapshot = snapshot
+        
+        # Directories are skipped: their added or removed entries are reported themselves
+        changes = {path for path, signature in snapshot.items()
+                   if previous.get(path) != signature and not stat_module.S_ISDIR(signature[2])}
+        changes.update(path for path, signature in previous.items()
+                       if path not in snapshot and not stat_module.S_ISDIR(signature[2]))
+        return changes
+    
+    def close(self):
+        pass
+
+
+def create_watcher(root, poll_interval=1.0):
+    """Create the best available watcher for this platform"""
+    try:
+        return InotifyWatcher(root)
+    except (OSError, AttributeError):
+        return PollingWatcher(root, poll_interval)
@@ -0,0 +1,43 @@
+"""
+Workspace - Discovery of AI-SDLC projects under workspace folders
+"""
+
+import os
+
+from ai_sdlc import timings
+from ai_sdlc.session_state import STATUS_FILE
+
+# Folders never searched for projects
+SKIP_DIRS = {".git", ".ai-sdlc", ".amazonq", "node_modules", "__pycache__", ".venv", "venv"}
+
+
+@timings.traced()
+def discover_projects(roots, max_depth=4):
+    """Find AI-SDLC projects (folders with SESSION-STATUS.md) under the given roots"""
+    projects = []
+    seen = set()
+    
+    for root in roots:
+        stack = [(root, 0)]
+        while stack:
+            path, depth = stack.pop()
+            try:
+                with os.scandir(path) as entries:
+                    entries = list(entries)
+            except OSError:
+                continue
+            
+            if any(entry.name == STATUS_FILE and entry.is_file() for entry in entries):
+                real_path = os.path.realpath(path)
+                if real_path not in seen:
+                    seen.add(real_path)
+                    projects.append(path)
+                continue  # Projects are not nested inside other projects
+            
+            if depth >= max_depth:
+                continue
+            for entry in entries:
+                if entry.name not in SKIP_DIRS and entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, depth + 1))
+    
+    return sorted(projects)
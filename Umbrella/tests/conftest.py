@@ -0,0 +1,45 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+UMBRELLA_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, UMBRELLA_DIR)
+
+
+@pytest.fixture(autouse=True)
+def ai_sdlc_home(tmp_path, monkeypatch):
+    """Keep the per-user store, archives and push queue out of the real home folder"""
+    home = tmp_path / "ai-sdlc-home"
+    monkeypatch.setenv("AI_SDLC_HOME", str(home))
+    for role in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{role}_NAME", "AI-SDLC Tests")
+        monkeypatch.setenv(f"GIT_{role}_EMAIL", "tests@example.com")
+    return home
+
+
+def write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def git(project, *args):
+    return subprocess.run(["git", *args], cwd=project, capture_output=True, text=True, check=True).stdout
+
+
+def git_project(tmp_path, files, session=False):
+    """A committed git repository holding files ({relpath: text}), optionally with a project state"""
+    from ai_sdlc.session_state import new_state, save_state
+    
+    project = tmp_path / "project"
+    write(project / ".gitignore", ".ai-sdlc/cache/\n.ai-sdlc/state.db\n")
+    for relpath, text in files.items():
+        write(project / relpath, text)
+    if session:
+        save_state(str(project), new_state("Demo"))
+    git(project, "init", "-q")
+    git(project, "add", ".")
+    git(project, "commit", "-q", "-m", "Initial")
+    return project
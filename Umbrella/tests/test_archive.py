@@ -0,0 +1,58 @@
+import os
+
+from conftest import write
+
+from ai_sdlc.archive import archive_project, default_archive_path, list_revisions, restore_revision
+
+
+def _tree(root):
+    files = {}
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            with open(path, "rb") as f:
+                files[os.path.relpath(path, root).replace(os.sep, "/")] = f.read()
+    return files
+
+
+def test_archive_restore_round_trip_reuses_objects(tmp_path):
+    project = tmp_path / "project"
+    output = str(tmp_path / "archive.tar")
+    write(project / "README.md", "# Demo\n")
+    charter = write(project / "1-Planning" / "project-charter.md", "# Charter\n\nFirst draft.\n")
+    write(project / "2-Requirements" / "requirements-specification.md", "# Requirements\n")
+    # Same content twice: stored as one object
+    write(project / "3-Design" / "copy-of-readme.md", "# Demo\n")
+    
+    first = archive_project(str(project), output, workers=1)
+    assert first["files"] == 4
+    assert first["new_objects"] == 3
+    assert first["reused"] == 1
+    first_tree = _tree(project)
+    
+    charter.write_text("# Charter\n\nSecond draft, a little longer.\n", encoding="utf-8")
+    second = archive_project(str(project), output, workers=1)
+    assert second["new_objects"] == 1
+    assert second["reused"] == 3
+    assert list_revisions(output) == sorted([first["revision"], second["revision"]])
+    
+    restore_revision(output, first["revision"], str(tmp_path / "first"))
+    restore_revision(output, second["revision"], str(tmp_path / "second"))
+    assert _tree(tmp_path / "first") == first_tree
+    assert _tree(tmp_path / "second") == _tree(project)
+
+
+def test_projects_with_the_same_name_keep_separate_revisions(tmp_path):
+    one = tmp_path / "a" / "Demo"
+    two = tmp_path / "b" / "Demo"
+    write(one / "1-Planning" / "project-charter.md", "# One\n")
+    write(two / "1-Planning" / "project-charter.md", "# Two\n")
+    assert default_archive_path(str(one)) != default_archive_path(str(two))
+    
+    # Even when they share one archive file, each only sees its own revisions
+    output = str(tmp_path / "shared.tar")
+    first = archive_project(str(one), output, workers=1)
+    second = archive_project(str(two), output, workers=1)
+    assert list_revisions(output, str(one)) == [first["revision"]]
+    assert list_revisions(output, str(two)) == [second["revision"]]
+    assert second["reused"] == 0
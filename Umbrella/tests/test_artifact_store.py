@@ -0,0 +1,40 @@
+import os
+
+from conftest import write
+
+from ai_sdlc.artifact_store import materialize_artifacts, offload_artifacts, pointer_path, read_pointer
+
+BIG = "x" * 64
+
+
+def test_full_scan_skips_release_snapshots(tmp_path):
+    write(tmp_path / "3-Design" / "wireframes" / "home.png", BIG)
+    write(tmp_path / "3-Design" / "wireframes" / "tiny.png", "x")
+    write(tmp_path / "6-Deployment" / "deployed-components" / ".releases" / "auth" / "r1" / "bundle.js", BIG)
+    
+    result = offload_artifacts(str(tmp_path), threshold=32)
+    assert result["offloaded"] == ["3-Design/wireframes/home.png"]
+    assert read_pointer(pointer_path(str(tmp_path), "3-Design/wireframes/home.png"))["size"] == len(BIG)
+
+
+def test_changed_paths_limit_what_is_looked_at(tmp_path):
+    write(tmp_path / "3-Design" / "wireframes" / "home.png", BIG)
+    write(tmp_path / "3-Design" / "wireframes" / "login.png", BIG)
+    write(tmp_path / "3-Design" / "architecture-diagrams" / "system.svg", BIG)
+    
+    result = offload_artifacts(str(tmp_path), threshold=32, changed={"3-Design/wireframes/home.png", "README.md"})
+    assert result["offloaded"] == ["3-Design/wireframes/home.png"]
+    
+    # A changed folder above the offload folders covers everything below it
+    result = offload_artifacts(str(tmp_path), threshold=32, changed={"3-Design"})
+    assert result["offloaded"] == ["3-Design/architecture-diagrams/system.svg", "3-Design/wireframes/login.png"]
+    assert result["managed"] == 3
+
+
+def test_offloaded_file_is_materialized_again(tmp_path):
+    image = write(tmp_path / "3-Design" / "wireframes" / "home.png", BIG)
+    offload_artifacts(str(tmp_path), threshold=32)
+    os.remove(image)
+    
+    assert materialize_artifacts(str(tmp_path))["materialized"] == ["3-Design/wireframes/home.png"]
+    assert image.read_text(encoding="utf-8") == BIG
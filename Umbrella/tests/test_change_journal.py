@@ -0,0 +1,67 @@
+import os
+import signal
+import subprocess
+import sys
+import time
+
+import pytest
+from conftest import UMBRELLA_DIR, git, git_project, write
+
+from ai_sdlc.change_journal import WATCHER_FILE, stage_changes, watcher_running
+from ai_sdlc.pause import pause_session
+
+
+def _staged(project):
+    return git(project, "diff", "--cached", "--name-status").splitlines()
+
+
+def test_stage_changes_stages_deletions_of_tracked_files(tmp_path):
+    project = git_project(tmp_path, {"4-Development/components/auth/docs/README.md": "# Auth\n",
+                                     "4-Development/components/auth/src/app.py": "print()\n"})
+    os.remove(project / "4-Development/components/auth/docs/README.md")
+    write(project / "4-Development/components/auth/src/new.py", "x = 1\n")
+    
+    # A path that never existed is dropped rather than failing the batch
+    stage_changes(str(project), {"4-Development/components/auth/docs/README.md",
+                                 "4-Development/components/auth/src/new.py", "never/existed.md"})
+    assert _staged(project) == ["D\t4-Development/components/auth/docs/README.md",
+                                "A\t4-Development/components/auth/src/new.py"]
+
+
+def test_stage_changes_treats_paths_literally(tmp_path):
+    project = git_project(tmp_path, {"3-Design/a*.md": "star\n"})
+    write(project / "3-Design" / "ab.md", "not journaled\n")
+    write(project / "3-Design" / "[x].md", "brackets\n")
+    write(project / "3-Design" / "x.md", "not journaled either\n")
+    # Once 'a*.md' is gone, a glob pathspec would match 'ab.md' instead
+    os.remove(project / "3-Design" / "a*.md")
+    
+    stage_changes(str(project), {"3-Design/a*.md", "3-Design/[x].md"})
+    assert _staged(project) == ["A\t3-Design/[x].md", "D\t3-Design/a*.md"]
+
+
+def test_pause_commits_deletion_seen_by_watcher(tmp_path):
+    project = git_project(tmp_path, {"4-Development/components/auth/docs/README.md": "# Auth\n",
+                                     "4-Development/components/auth/src/app.py": "print()\n"}, session=True)
+    watcher = subprocess.Popen([sys.executable, os.path.join(UMBRELLA_DIR, "ai-sdlc.py"), "pause", "--watch",
+                                str(project), "--poll-interval", "0.1"],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        deadline = time.monotonic() + 10
+        while watcher_running(str(project)) is None:
+            if time.monotonic() > deadline or watcher.poll() is not None:
+                pytest.fail("change watcher did not start")
+            time.sleep(0.05)
+        
+        os.remove(project / "4-Development/components/auth/docs/README.md")
+        time.sleep(0.3)
+        result = pause_session(str(project), "Pause with a deletion")
+    finally:
+        watcher.send_signal(signal.SIGTERM)
+        watcher.wait(10)
+    
+    assert result["error"] is None
+    assert result["journaled"] is not None
+    assert "README.md" not in git(project, "status", "--porcelain")
+    assert "4-Development/components/auth/docs/README.md" in git(project, "show", "--name-only", "HEAD")
+    assert not os.path.exists(project / WATCHER_FILE)
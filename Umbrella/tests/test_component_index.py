@@ -0,0 +1,43 @@
+import os
+
+from conftest import write
+
+from ai_sdlc.component_index import INDEX_FILE, load_component_index
+
+
+def _touch_later(path):
+    """Move a folder's mtime clearly forward, as a later edit would"""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5 * 10**9))
+
+
+def test_index_lists_components_without_empty_folders(tmp_path):
+    write(tmp_path / "4-Development" / "components" / "auth" / "src" / "app.py", "v = 1\n")
+    (tmp_path / "4-Development" / "components" / "auth" / "tests").mkdir()
+    (tmp_path / "5-Testing" / "component-tests" / "auth").mkdir(parents=True)
+    
+    index = load_component_index(str(tmp_path))
+    assert index == {"development": {"auth": ["src"]}, "testing": {"auth": []}, "deployed": {}}
+    assert os.path.isfile(tmp_path / INDEX_FILE)
+
+
+def test_warm_load_sees_changes_below_an_unchanged_root(tmp_path):
+    components = tmp_path / "4-Development" / "components"
+    write(components / "auth" / "src" / "app.py", "v = 1\n")
+    (components / "auth" / "tests").mkdir()
+    load_component_index(str(tmp_path))
+    written = os.stat(tmp_path / INDEX_FILE).st_mtime_ns
+    
+    assert load_component_index(str(tmp_path))["development"] == {"auth": ["src"]}
+    assert os.stat(tmp_path / INDEX_FILE).st_mtime_ns == written  # Nothing changed, nothing rewritten
+    
+    # Neither the root nor the component folder changes here, only tests/
+    root_mtime = os.stat(components).st_mtime_ns
+    write(components / "auth" / "tests" / "test_app.py", "")
+    _touch_later(components / "auth" / "tests")
+    assert os.stat(components).st_mtime_ns == root_mtime
+    assert load_component_index(str(tmp_path))["development"] == {"auth": ["src", "tests"]}
+    
+    write(components / "billing" / "docs" / "README.md", "# Billing\n")
+    _touch_later(components)
+    assert load_component_index(str(tmp_path))["development"] == {"auth": ["src", "tests"], "billing": ["docs"]}
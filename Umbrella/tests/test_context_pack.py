@@ -0,0 +1,57 @@
+import os
+
+from conftest import git_project
+
+from ai_sdlc.context_pack import build_context_pack, digest_text, file_digests, measure
+
+CHARTER = "# Project Charter\n\nA billing portal for small teams.\n\n## Scope\n\n" + "Details. " * 400 + "\n"
+TIMELINE = "# Timeline\n\nSix weeks.\n\n## Milestones\n\n- Week 1\n"
+
+
+def _project(tmp_path):
+    return git_project(tmp_path, {"1-Planning/project-charter.md": CHARTER,
+                                  "1-Planning/initial-timeline.md": TIMELINE}, session=True)
+
+
+def test_digest_text_outlines_headings_and_first_paragraph():
+    digest = digest_text("# Title\n\nFirst line\ncontinues.\n\n```\n# not a heading\n```\n## Part ##\n\nLater.\n")
+    assert digest == {"headings": [[1, "Title"], [2, "Part"]], "summary": "First line continues."}
+
+
+def test_large_budget_includes_full_text(tmp_path):
+    pack = build_context_pack(str(_project(tmp_path)), budget=100000, phase=2)
+    assert pack["ok"] is True
+    assert [(artifact["path"], artifact["mode"]) for artifact in pack["artifacts"]] == [
+        ("1-Planning/project-charter.md", "full"), ("1-Planning/initial-timeline.md", "full")]
+    assert "Details. Details." in pack["text"]
+    assert pack["used"] == measure(pack["text"]) <= 100000
+
+
+def test_small_budget_falls_back_to_outlines_and_omissions(tmp_path):
+    project = str(_project(tmp_path))
+    base = build_context_pack(project, budget=0, phase=2)["used"]
+    
+    for budget in (base, base + 60, base + 200, base + 600):
+        pack = build_context_pack(project, budget=budget, phase=2)
+        assert pack["used"] == measure(pack["text"]) <= budget
+    
+    modes = {artifact["path"]: artifact["mode"]
+             for artifact in build_context_pack(project, budget=base + 200, phase=2)["artifacts"]}
+    assert modes == {"1-Planning/project-charter.md": "outline", "1-Planning/initial-timeline.md": "full"}
+    
+    pack = build_context_pack(project, budget=base, phase=2)
+    assert [artifact["mode"] for artifact in pack["artifacts"]] == ["omitted", "omitted"]
+    assert "## Omitted (over budget)" in pack["text"]
+
+
+def test_digest_cache_survives_a_touch_without_changes(tmp_path):
+    project = _project(tmp_path)
+    path = "1-Planning/initial-timeline.md"
+    first = file_digests(str(project), [path, "1-Planning/missing.md"])
+    assert list(first) == [path]
+    
+    stat = os.stat(project / path)
+    os.utime(project / path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    second = file_digests(str(project), [path])[path]
+    assert second["sha256"] == first[path]["sha256"]
+    assert second["mtime_ns"] == stat.st_mtime_ns + 10**9
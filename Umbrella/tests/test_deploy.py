@@ -0,0 +1,66 @@
+import os
+import shlex
+import sys
+
+import pytest
+from conftest import write
+
+from ai_sdlc.cli import main
+from ai_sdlc.deploy import deploy_component, deployed_path, read_pointer, rollback_component
+from ai_sdlc.test_runner import run_component_tests
+
+PASS = f"{shlex.quote(sys.executable)} -c pass"
+FAIL = f"{shlex.quote(sys.executable)} -c 'raise SystemExit(1)'"
+
+
+def _component(project, name, files):
+    for path, text in files.items():
+        write(project / "4-Development" / "components" / name / "src" / path, text)
+    (project / "5-Testing" / "component-tests" / name).mkdir(parents=True, exist_ok=True)
+
+
+def test_redeploy_links_unchanged_files_and_rolls_back(tmp_path):
+    _component(tmp_path, "auth", {"app.py": "v = 1\n", "lib/util.py": "u = 1\n"})
+    first = deploy_component(str(tmp_path), "auth")
+    assert first["ok"] and first["added"] == 2 and first["linked"] == 0
+    assert deploy_component(str(tmp_path), "auth")["up_to_date"] is True
+    
+    write(tmp_path / "4-Development" / "components" / "auth" / "src" / "app.py", "v = 2\n")
+    second = deploy_component(str(tmp_path), "auth")
+    assert (second["changed"], second["linked"], second["previous"]) == (1, 1, first["release"])
+    deployed = deployed_path(str(tmp_path), "auth")
+    assert open(os.path.join(deployed, "app.py")).read() == "v = 2\n"
+    
+    rolled = rollback_component(str(tmp_path), "auth")
+    assert (rolled["release"], rolled["previous"]) == (first["release"], second["release"])
+    assert open(os.path.join(deployed, "app.py")).read() == "v = 1\n"
+    assert read_pointer(str(tmp_path), "auth")["current"] == first["release"]
+
+
+def test_rollback_needs_a_previous_release(tmp_path):
+    assert rollback_component(str(tmp_path), "auth")["error"] == "not deployed"
+    _component(tmp_path, "auth", {"app.py": "v = 1\n"})
+    deploy_component(str(tmp_path), "auth")
+    assert rollback_component(str(tmp_path), "auth")["error"] == "no previous release to roll back to"
+
+
+def test_deploy_reports_components_without_passing_tests(tmp_path, capsys):
+    _component(tmp_path, "auth", {"app.py": "v = 1\n"})
+    _component(tmp_path, "billing", {"app.py": "v = 1\n"})
+    _component(tmp_path, "search", {"app.py": "v = 1\n"})
+    run_component_tests(str(tmp_path), ["auth", "search"], command=PASS)
+    run_component_tests(str(tmp_path), ["billing"], command=FAIL)
+    write(tmp_path / "4-Development" / "components" / "search" / "src" / "app.py", "v = 2\n")
+    
+    main(["deploy", str(tmp_path)])
+    out = capsys.readouterr().out
+    assert "🚀 auth: deployed" in out
+    assert "billing: skipped, tests not passing (failed)" in out
+    assert "search: skipped, tests not passing (stale)" in out
+    assert not os.path.exists(deployed_path(str(tmp_path), "billing"))
+    
+    # Nothing left that can be deployed is a failure
+    write(tmp_path / "4-Development" / "components" / "auth" / "src" / "app.py", "v = 2\n")
+    with pytest.raises(SystemExit):
+        main(["deploy", str(tmp_path)])
+    assert "📭 No components with passing tests" in capsys.readouterr().out
@@ -0,0 +1,47 @@
+import os
+
+from ai_sdlc import journal
+from ai_sdlc.journal import (ARCHIVE_FILE, JOURNAL_DIR, JOURNAL_FILE, append_entries, append_entry, migrate_sessions,
+                             read_all_entries, tail_entries)
+
+
+def _entries(start, stop):
+    return [{"session": number, "summary": f"Session {number} " + "x" * 40} for number in range(start, stop)]
+
+
+def test_rotation_keeps_every_entry_in_order(tmp_path, monkeypatch):
+    monkeypatch.setattr(journal, "SEGMENT_BYTES", 512)
+    monkeypatch.setattr(journal, "MAX_SEGMENTS", 2)
+    for entry in _entries(0, 60):
+        append_entry(str(tmp_path), entry)
+    
+    segments = sorted(name for name in os.listdir(tmp_path / JOURNAL_DIR) if name.startswith("sessions-0"))
+    assert len(segments) == 2
+    assert os.path.isfile(tmp_path / ARCHIVE_FILE)
+    assert os.path.getsize(tmp_path / JOURNAL_FILE) <= 512
+    assert [entry["session"] for entry in read_all_entries(str(tmp_path))] == list(range(60))
+    
+    # Tails reach back through the segments and into the archive
+    assert [entry["session"] for entry in tail_entries(str(tmp_path), 3)] == [57, 58, 59]
+    assert [entry["session"] for entry in tail_entries(str(tmp_path), 25)] == list(range(35, 60))
+    assert [entry["session"] for entry in tail_entries(str(tmp_path), 100)] == list(range(60))
+    assert tail_entries(str(tmp_path), 0) == []
+
+
+def test_tail_reads_across_blocks_and_skips_torn_lines(tmp_path, monkeypatch):
+    monkeypatch.setattr(journal, "READ_BLOCK", 16)
+    append_entries(str(tmp_path), _entries(0, 5))
+    with open(tmp_path / JOURNAL_FILE, "ab") as f:
+        f.write(b'{"session": 5, "summ')  # Interrupted write
+    
+    assert tail_entries(str(tmp_path), 3)[-1]["session"] == 4
+    assert tail_entries(str(tmp_path / "empty")) == []
+
+
+def test_migrate_sessions_moves_state_history_into_the_journal(tmp_path):
+    state = {"sessions": [{"date": "2026-01-01", "summary": "One"}, {"date": "2026-01-02", "summary": "Two"}]}
+    assert migrate_sessions(str(tmp_path), state) is True
+    assert "sessions" not in state
+    assert state["last_session"]["summary"] == "Two"
+    assert [entry["event"] for entry in read_all_entries(str(tmp_path))] == ["pause", "pause"]
+    assert migrate_sessions(str(tmp_path), {}) is False
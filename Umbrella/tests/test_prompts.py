@@ -0,0 +1,62 @@
+import os
+
+from conftest import write
+
+from ai_sdlc.prompts import compile_template, load_template, render, render_prompts, write_prompts
+
+TEMPLATE = """Preamble with [not a slot]
+==========
+1-PLANNING
+==========
+
+## 1.1 Setup
+**Operating System:** [Windows/Mac]
+Build [component] with [framework]; see [docs](http://example.com).
+## 1.2 Goals
+[goal one]
+==========
+4-DEVELOPMENT
+==========
+Component [component] needs [framework].
+"""
+
+
+def test_compile_keys_slots_by_section_label_and_name():
+    compiled = compile_template(TEMPLATE)
+    assert sorted(compiled["phases"]) == [1, 4]
+    assert compiled["phases"][4]["title"] == "Development"
+    assert [slot["names"] for slot in compiled["slots"] if slot["phase"] == 1] == [
+        ["1.1.1", "operating-system"], ["component", "1.1.2"], ["framework", "1.1.3"], ["1.2.1"]]
+    
+    text, unfilled = render(compiled, 1, {"operating-system": "Linux", "component": "auth", "1.2.1": "Ship"})
+    assert text == ("## 1.1 Setup\n**Operating System:** Linux\n"
+                    "Build auth with [framework]; see [docs](http://example.com).\n## 1.2 Goals\nShip\n")
+    assert unfilled == ["framework"]
+
+
+def test_render_prompts_per_row_and_phase(tmp_path):
+    template = str(write(tmp_path / "template.md", TEMPLATE))
+    rows = [{"component": "Auth Service", "framework": "Flask", "phase": "4"},
+            {"component": "Billing", "phase": "1,4"}]
+    result = render_prompts(rows, template=template, defaults={"framework": "Django"})
+    
+    assert [(prompt["phase"], prompt["name"]) for prompt in result["prompts"]] == [
+        (4, "auth-service"), (1, "billing"), (4, "billing")]
+    assert result["prompts"][0]["text"] == ("# Development: Auth Service\n\n**Depends on:** none\n\n"
+                                            "Component Auth Service needs Flask.\n")
+    assert "needs Django" in result["prompts"][2]["text"]
+    assert result["unfilled"] == {"1.1.1": {"hint": "Windows/Mac", "count": 1},
+                                  "1.2.1": {"hint": "goal one", "count": 1}}
+    
+    paths = write_prompts(result, str(tmp_path / "out"))
+    assert [os.path.basename(path) for path in paths] == ["phase4-auth-service.md", "phase1-billing.md",
+                                                          "phase4-billing.md"]
+
+
+def test_bundled_template_compiles_every_phase_once():
+    compiled = load_template()
+    assert sorted(compiled["phases"]) == [1, 2, 3, 4, 5, 6, 7]
+    assert load_template() is compiled
+    text, unfilled = render(compiled, 1, {})
+    assert len(unfilled) == sum(1 for slot in compiled["slots"] if slot["phase"] == 1)
+    assert all(f"[{slot['hint']}]" in text for slot in compiled["slots"] if slot["phase"] == 1)
@@ -0,0 +1,73 @@
+import json
+import os
+import time
+
+from ai_sdlc.push_queue import MAX_ATTEMPTS, enqueue_push, process_entry, push_failure, queue_dir, queue_status
+
+
+def test_enqueue_push_coalesces_refs_per_repository(tmp_path):
+    repo = tmp_path / "repo"
+    other = tmp_path / "other"
+    repo.mkdir()
+    other.mkdir()
+    
+    enqueue_push(str(repo), ["refs/heads/main"], "origin")
+    entry = enqueue_push(str(repo), ["refs/tags/v1.0", "refs/heads/main"], "origin")
+    enqueue_push(str(other), ["refs/heads/main"], "origin")
+    
+    assert entry["refs"] == ["refs/heads/main", "refs/tags/v1.0"]
+    assert entry["attempts"] == 0
+    assert queue_status(str(repo)) == [entry]
+    assert len([name for name in os.listdir(queue_dir()) if name.endswith(".json")]) == 2
+
+
+def test_push_failure_classification():
+    rejected = push_failure(1, "To ../remote.git\n!\trefs/heads/main:refs/heads/main\t[rejected] (non-fast-forward)\n",
+                            "error: failed to push some refs\n")
+    assert rejected == (False, "!\trefs/heads/main:refs/heads/main\t[rejected] (non-fast-forward)")
+    
+    auth = push_failure(128, "", "remote: Invalid username or password.\n"
+                                 "fatal: Authentication failed for 'https://example.com/repo.git/'\n")
+    assert auth == (False, "remote: Invalid username or password.")
+    assert push_failure(128, "", "fatal: could not read Username for 'https://example.com': "
+                                 "terminal prompts disabled\n")[0] is False
+    assert push_failure(128, "", "git@example.com: Permission denied (publickey).\n"
+                                 "fatal: Could not read from remote repository.\n")[0] is False
+    
+    network = push_failure(128, "", "fatal: unable to access 'https://example.com/': Could not resolve host\n")
+    assert network == (True, "fatal: unable to access 'https://example.com/': Could not resolve host")
+    assert push_failure(1, "", "") == (True, "exit 1")
+
+
+def test_non_retryable_failure_exhausts_the_entry(tmp_path, monkeypatch):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    entry = enqueue_push(str(repo), ["refs/heads/main"], "origin")
+    monkeypatch.setattr("ai_sdlc.push_queue._push", lambda entry: (False, False, "fatal: Authentication failed"))
+    
+    assert process_entry(entry) is False
+    [stored] = queue_status(str(repo))
+    assert stored["attempts"] == MAX_ATTEMPTS
+    assert stored["last_error"] == "fatal: Authentication failed"
+    
+    monkeypatch.setattr("ai_sdlc.push_queue._push", lambda entry: (True, False, None))
+    assert process_entry(json.loads(json.dumps(stored))) is True
+    assert queue_status(str(repo)) == []
+
+
+def test_entry_requeued_during_a_failed_push_is_retried_at_once(tmp_path, monkeypatch):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    entry = enqueue_push(str(repo), ["refs/heads/main"], "origin")
+    
+    def push_while_requeued(pushed):
+        enqueue_push(str(repo), ["refs/tags/v1.0"], "origin")
+        return False, True, "fatal: unable to access 'https://example.com/': Could not resolve host"
+    
+    monkeypatch.setattr("ai_sdlc.push_queue._push", push_while_requeued)
+    assert process_entry(entry) is False
+    [stored] = queue_status(str(repo))
+    assert stored["attempts"] == 0
+    assert stored["next_attempt"] <= time.time()
+    assert stored["refs"] == ["refs/heads/main", "refs/tags/v1.0"]
+    assert stored["last_error"].startswith("fatal: unable to access")
@@ -0,0 +1,36 @@
+from conftest import write
+
+from ai_sdlc.quality import check_artifacts, check_content
+
+CHARTER = "1-Planning/project-charter.md"
+REQUIREMENTS = "2-Requirements/requirements-specification.md"
+
+
+def test_empty_and_heading_only_files():
+    assert check_content(CHARTER, "") == ["file is empty"]
+    assert check_content(CHARTER, "  \n\n") == ["file is empty"]
+    assert check_content(CHARTER, "# Executive Summary\n## Scope\n## Objectives\n") == ["only headings, no content"]
+
+
+def test_placeholders_are_reported():
+    text = ("# Executive Summary\nShort.\n## Scope\n[Define the scope - e.g. which teams]\n"
+            "## Objectives\nSee [the plan](plan.md) and `[not a placeholder]`.\n")
+    assert check_content(CHARTER, text) == ["unfilled placeholder(s) line 4: [Define the scope - e.g. which teams]"]
+
+
+def test_missing_headings_match_whole_words():
+    text = "# Spec\n## 2.5 Non-Functional Requirements\nFast.\n## Constraints\nNone.\n"
+    assert check_content(REQUIREMENTS, text) == ["missing heading 'Functional'"]
+    
+    text = "# Spec\n## 2.4 Functional Requirements:\nLogin.\n" + text
+    assert check_content(REQUIREMENTS, text) == []
+
+
+def test_check_artifacts_skips_missing_files(tmp_path):
+    write(tmp_path / CHARTER, "")
+    write(tmp_path / REQUIREMENTS, "# Spec\n## Functional\nx\n## Non-Functional\ny\n## Constraints\nz\n")
+    
+    issues = check_artifacts(str(tmp_path), [CHARTER, REQUIREMENTS, "3-Design/system-architecture.md"])
+    assert issues == {CHARTER: ["file is empty"]}
+    # Served from the cache the second time
+    assert check_artifacts(str(tmp_path), [CHARTER, REQUIREMENTS]) == issues
@@ -0,0 +1,45 @@
+import os
+
+from conftest import git_project
+
+from ai_sdlc.artifact_store import offload_artifacts
+from ai_sdlc.resume import project_status, resume_project
+from ai_sdlc.rule_store import RULES_DIR
+
+
+def _snapshot(root):
+    found = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d != ".git"]
+        for name in dirnames + filenames:
+            path = os.path.join(dirpath, name)
+            stat = os.lstat(path)
+            found[os.path.relpath(path, root)] = (stat.st_mtime_ns, stat.st_size)
+    return found
+
+
+def test_project_status_changes_nothing(tmp_path):
+    project = git_project(tmp_path, {"3-Design/wireframes/home.png": "x" * 64}, session=True)
+    offload_artifacts(str(project), threshold=32)
+    os.remove(project / "3-Design/wireframes/home.png")
+    before = _snapshot(project)
+    
+    result = project_status(str(project))
+    assert result["ok"] is True
+    assert result["phase"] == 1
+    assert result["active_rules"] == []
+    assert result["artifacts"] is None
+    assert _snapshot(project) == before
+
+
+def test_resume_activates_rules_and_restores_artifacts(tmp_path, capsys):
+    project = git_project(tmp_path, {"3-Design/wireframes/home.png": "x" * 64}, session=True)
+    offload_artifacts(str(project), threshold=32)
+    os.remove(project / "3-Design/wireframes/home.png")
+    
+    assert resume_project(str(project)) is True
+    assert "phase1-planning-rules.md" in os.listdir(project / RULES_DIR)
+    assert (project / "3-Design/wireframes/home.png").read_text(encoding="utf-8") == "x" * 64
+    assert "Restored 1 large file(s)" in capsys.readouterr().out
+    assert project_status(str(project))["active_rules"] == [
+        "phase1-planning-rules.md", "context-management-rules.md", "file-organization-rules.md"]
@@ -0,0 +1,43 @@
+import os
+
+from conftest import UMBRELLA_DIR
+
+from ai_sdlc.rule_store import IGNORE_FILE, RULES_DIR, ingest_rules, install_rules, object_path
+
+
+def test_default_install_hardlinks_read_only_store_objects(tmp_path):
+    manifest = ingest_rules(UMBRELLA_DIR)
+    result = install_rules(str(tmp_path), manifest, phase=1)
+    
+    assert result["strategy"] == "hardlink"
+    assert sorted(result["installed"]) == ["context-management-rules.md", "file-organization-rules.md",
+                                           "phase1-planning-rules.md"]
+    installed = tmp_path / RULES_DIR / "phase1-planning-rules.md"
+    assert os.path.samefile(installed, object_path(manifest["phase1-planning-rules.md"]))
+    assert os.stat(installed).st_mode & 0o222 == 0
+    assert install_rules(str(tmp_path), manifest, phase=1)["installed"] == []
+
+
+def test_phase_change_swaps_phase_rules(tmp_path):
+    manifest = ingest_rules(UMBRELLA_DIR)
+    install_rules(str(tmp_path), manifest, phase=3)
+    (tmp_path / RULES_DIR / "team-notes.md").write_text("# Ours\n", encoding="utf-8")
+    
+    result = install_rules(str(tmp_path), manifest, phase=4)
+    assert sorted(result["installed"]) == ["iterative-development-rules.md", "phase4-development-rules.md"]
+    assert result["removed"] == ["phase3-design-rules.md"]
+    assert sorted(os.listdir(tmp_path / RULES_DIR)) == [
+        "context-management-rules.md", "file-organization-rules.md", "iterative-development-rules.md",
+        "phase4-development-rules.md", "team-notes.md"]
+
+
+def test_symlinked_rules_are_git_ignored_until_replaced(tmp_path):
+    manifest = ingest_rules(UMBRELLA_DIR)
+    install_rules(str(tmp_path), manifest, "symlink", phase=1)
+    ignore = (tmp_path / IGNORE_FILE).read_text(encoding="utf-8").splitlines()
+    assert ignore[1:] == ["context-management-rules.md", "file-organization-rules.md", "phase1-planning-rules.md"]
+    
+    result = install_rules(str(tmp_path), manifest, "copy", phase=1)
+    assert len(result["installed"]) == 3
+    assert not os.path.islink(tmp_path / RULES_DIR / "phase1-planning-rules.md")
+    assert not os.path.exists(tmp_path / IGNORE_FILE)
@@ -0,0 +1,59 @@
+from conftest import write
+
+from ai_sdlc.schedule import blocked_components, build_graph, build_schedule, find_cycles, plan_waves
+
+
+def _graph(edges):
+    return {name: list(dependencies) for name, dependencies in edges.items()}
+
+
+def test_find_cycles_returns_each_strongly_connected_group():
+    graph = _graph({"a": ["b"], "b": ["c"], "c": ["a"], "d": ["a"], "e": ["e2"], "e2": ["e"], "f": []})
+    assert sorted(find_cycles(graph)) == [["a", "b", "c"], ["e", "e2"]]
+    assert find_cycles(_graph({"a": [], "b": ["a"]})) == []
+
+
+def test_find_cycles_handles_long_chains_without_recursion():
+    graph = {f"c{i}": [f"c{i + 1}"] for i in range(5000)}
+    graph["c5000"] = ["c0"]
+    assert len(find_cycles(graph)[0]) == 5001
+
+
+def test_plan_waves_orders_by_depth_and_remaining_chain():
+    graph = _graph({"db": [], "auth": ["db"], "api": ["auth", "db"], "ui": ["api"], "docs": []})
+    plan = plan_waves(graph)
+    assert plan["waves"] == [["db", "docs"], ["auth"], ["api"], ["ui"]]
+    assert plan["critical_path"] == ["db", "auth", "api", "ui"]
+    assert plan["remaining"]["db"] == 4
+    assert plan["unscheduled"] == []
+
+
+def test_cycle_members_and_their_dependents_are_unscheduled():
+    graph = _graph({"a": ["b"], "b": ["a"], "c": ["a"], "d": []})
+    plan = plan_waves(graph, {name for cycle in find_cycles(graph) for name in cycle})
+    assert plan["waves"] == [["d"]]
+    assert plan["unscheduled"] == ["a", "b", "c"]
+
+
+def test_blocked_until_dependencies_reach_the_next_stage():
+    graph = _graph({"db": [], "api": ["db"]})
+    blocked = blocked_components(graph, {"db": "in development", "api": "in development"})
+    assert blocked == {"api": [{"dependency": "db", "status": "in development"}]}
+    assert blocked_components(graph, {"db": "ready for testing", "api": "in development"}) == {}
+
+
+def test_build_schedule_from_component_breakdown(tmp_path):
+    write(tmp_path / "4-Development" / "component-breakdown.md",
+          "# Component Breakdown\n\n"
+          "| Component | Depends on |\n|---|---|\n"
+          "| Auth | Store |\n| Store | |\n| Billing | Auth, Payments |\n")
+    
+    schedule = build_schedule(str(tmp_path))
+    assert schedule["ok"] is True
+    assert schedule["waves"] == [["store"], ["auth"], ["billing"]]
+    assert schedule["unknown"] == {"billing": ["payments"]}
+    assert schedule["ready"] == ["store"]
+    assert sorted(schedule["blocked"]) == ["auth", "billing"]
+    
+    assert build_graph([{"name": "x", "depends_on": ["x2"]}]) == ({"x": []}, {"x": ["x2"]})
+    assert build_schedule(str(tmp_path / "missing"))["error"].endswith("not found")
@@ -0,0 +1,45 @@
+from conftest import write
+
+from ai_sdlc.state_db import changed_since, phase_history, record_transition
+
+
+def test_changed_since_unknown_until_phase_is_left(tmp_path):
+    write(tmp_path / "1-Planning" / "project-charter.md", "# Charter\n")
+    
+    assert changed_since(str(tmp_path), 1)["completed"] is False
+
+
+def test_changed_since_after_record_transition(tmp_path):
+    project = str(tmp_path)
+    charter = write(tmp_path / "1-Planning" / "project-charter.md", "# Charter\n")
+    write(tmp_path / "1-Planning" / "initial-timeline.md", "# Timeline\n")
+    
+    assert record_transition(project, 1, "Planning", {"planning": "1-Planning"}, 2, "Requirements") == 2
+    result = changed_since(project, 1)
+    assert result["completed"] is True
+    assert result["recorded"] == 2
+    assert (result["added"], result["changed"], result["removed"]) == ([], [], [])
+    
+    # Edits recorded when a later phase is left show up against Phase 1's manifest
+    charter.write_text("# Charter\n\nScope grew.\n", encoding="utf-8")
+    write(tmp_path / "1-Planning" / "stakeholder-map.md", "# Stakeholders\n")
+    record_transition(project, 2, "Requirements", {"planning": "1-Planning"}, 3, "Design")
+    result = changed_since(project, 1)
+    assert result["changed"] == ["1-Planning/project-charter.md"]
+    assert result["added"] == ["1-Planning/stakeholder-map.md"]
+    assert [entry["phase"] for entry in phase_history(project)] == [1, 2, 3]
+
+
+def test_changed_since_check_files_sees_unrecorded_edits(tmp_path):
+    project = str(tmp_path)
+    charter = write(tmp_path / "1-Planning" / "project-charter.md", "# Charter\n")
+    timeline = write(tmp_path / "1-Planning" / "initial-timeline.md", "# Timeline\n")
+    record_transition(project, 1, "Planning", {"planning": "1-Planning"}, 2, "Requirements")
+    
+    charter.write_text("# Charter, edited on disk only\n", encoding="utf-8")
+    timeline.unlink()
+    
+    assert changed_since(project, 1)["changed"] == []
+    result = changed_since(project, 1, check_files=True)
+    assert result["changed"] == ["1-Planning/project-charter.md"]
+    assert result["removed"] == ["1-Planning/initial-timeline.md"]
@@ -0,0 +1,79 @@
+import http.client
+import json
+import threading
+from http.server import ThreadingHTTPServer
+
+from conftest import git_project
+
+from ai_sdlc.session_state import load_state, save_state
+from ai_sdlc.status_server import StatusIndex, encode, etag_matches, make_handler
+
+
+def _workspace(tmp_path):
+    first = git_project(tmp_path / "alpha", {}, session=True)
+    second = git_project(tmp_path / "beta", {}, session=True)
+    return first, second
+
+
+def test_etag_matching():
+    etag, _ = encode({"a": 1})
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches('"other"', etag)
+
+
+def test_refresh_evaluates_only_projects_that_changed(tmp_path):
+    first, _ = _workspace(tmp_path)
+    index = StatusIndex([str(tmp_path)])
+    assert index.refresh() == 2
+    assert sorted(index.entries) == ["project", "project-2"]
+    listing = index.listing
+    
+    assert index.refresh() == 0
+    assert index.evaluations == 2
+    assert index.listing is listing
+    
+    state = load_state(str(first))
+    state["progress"] = "Charter drafted"
+    save_state(str(first), state)
+    etag = index.project("project")[0]
+    assert index.refresh() == 1
+    assert index.evaluations == 3
+    assert index.project("project")[0] != etag
+    assert json.loads(index.project("project")[1])["progress"] == "Charter drafted"
+    assert index.listing != listing
+
+
+def test_server_answers_304_for_a_matching_etag(tmp_path):
+    _workspace(tmp_path)
+    index = StatusIndex([str(tmp_path)])
+    index.refresh()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(index))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=10)
+        connection.request("GET", "/projects")
+        response = connection.getresponse()
+        body = json.loads(response.read())
+        etag = response.getheader("ETag")
+        assert response.status == 200
+        assert [project["id"] for project in body["projects"]] == ["project", "project-2"]
+        
+        # Same keep-alive connection, answered from memory
+        connection.request("GET", "/projects", headers={"If-None-Match": etag})
+        response = connection.getresponse()
+        assert (response.status, response.read()) == (304, b"")
+        
+        connection.request("GET", "/projects/project-2")
+        response = connection.getresponse()
+        assert json.loads(response.read())["name"] == "Demo"
+        connection.request("GET", "/projects/missing")
+        response = connection.getresponse()
+        assert (response.status, json.loads(response.read())) == (404, {"error": "Unknown project: missing"})
+        connection.close()
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,30 @@
+import os
+import shlex
+import sys
+
+from conftest import write
+
+from ai_sdlc.test_runner import detect_commands, run_component_tests
+from ai_sdlc.test_runner import test_statuses as recorded_statuses  # Not collected as a test
+
+
+def test_command_placeholders_leave_other_braces_alone(tmp_path):
+    (tmp_path / "5-Testing" / "component-tests" / "auth").mkdir(parents=True)
+    argv, cwd = detect_commands(str(tmp_path), "auth", "run --name={component} --env ${HOME} '{\"a\": 1}' {tests}")[0]
+    assert argv == ["run", "--name=auth", "--env", "${HOME}", '{"a": 1}',
+                    os.path.join("5-Testing", "component-tests", "auth")]
+    assert cwd == str(tmp_path)
+
+
+def test_green_run_is_cached_until_files_change(tmp_path):
+    write(tmp_path / "4-Development" / "components" / "auth" / "src" / "app.py", "v = 1\n")
+    (tmp_path / "5-Testing" / "component-tests" / "auth").mkdir(parents=True)
+    command = f"{shlex.quote(sys.executable)} -c 'import json; json.dumps({{}})'"
+    
+    first = run_component_tests(str(tmp_path), command=command)
+    assert (first["ran"], first["passed"]) == (1, 1)
+    assert run_component_tests(str(tmp_path), command=command)["skipped"] == 1
+    
+    write(tmp_path / "4-Development" / "components" / "auth" / "src" / "app.py", "v = 2\n")
+    assert recorded_statuses(str(tmp_path), ["auth"]) == {"auth": "stale"}
+    assert run_component_tests(str(tmp_path), command=command)["ran"] == 1